@@ -7,68 +7,57 @@
 #   export ADZUNA_APP_KEY=yyyyy
 #   python adzuna_report.py --what "intern systems OR infrastructure OR backend OR reliability OR compiler OR quant OR simulation OR modeling OR 'data infrastructure' OR 'ml systems'" --location "Boston, MA" --remote --out ./reports
 
-import argparse, datetime as dt, os, re
-import requests
-
-API_BASE = "https://api.adzuna.com/v1/api/jobs/us/search/1"
-
-def format_location(location: str) -> str:
-    """Format location string with proper separators and truncation."""
-    if not location:
-        return location
-    
-    # Preserve "Remote in USA" and "Remote in Canada" exactly as they are
-    location = location.replace('Remote in USA', '<<<REMOTE_USA>>>')
-    location = location.replace('Remote in Canada', '<<<REMOTE_CANADA>>>')
-    
-    # Add commas between locations that are missing them
-    location = re.sub(r'([A-Z]{2})([A-Z]{2,}[a-z])', r'\1, \2', location)
-    location = re.sub(r'([A-Z]{2})([A-Z]{3,})', r'\1, \2', location)
-    location = re.sub(r'([A-Z]{2})([A-Z][a-z])', r'\1, \2', location)
-    location = re.sub(r'([a-z])([A-Z][a-z])', r'\1, \2', location)
-    location = re.sub(r'(Remote in [A-Z]{2,})([A-Z])', r'\1, \2', location)
-    location = re.sub(r'(Remote in [A-Za-z\s]+?)([A-Z][a-z]+, [A-Z]{2})', r'\1, \2', location)
-    location = re.sub(r'(\d+ locations)([A-Z])', r'\1, \2', location)
-    
-    # Restore preserved patterns
-    location = location.replace('<<<REMOTE_USA>>>', 'Remote in USA')
-    location = location.replace('<<<REMOTE_CANADA>>>', 'Remote in Canada')
-    
-    locations = re.split(r'[,;]', location)
-    locations = [loc.strip() for loc in locations if loc.strip()]
-    
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_locations = []
-    for loc in locations:
-        loc_lower = loc.lower()
-        if loc_lower not in seen:
-            seen.add(loc_lower)
-            unique_locations.append(loc)
-    locations = unique_locations
-    
-    # If too many locations or too long, truncate and add line break
-    if len(locations) > 3 or len(', '.join(locations)) > 50:
-        kept_locations = []
-        total_length = 0
-        
-        for loc in locations[:3]:
-            if total_length + len(loc) > 50 and kept_locations:
-                break
-            kept_locations.append(loc)
-            total_length += len(loc) + 2
-        
-        result = ', '.join(kept_locations)
-        
-        if len(locations) > len(kept_locations):
-            remaining = len(locations) - len(kept_locations)
-            result += f'<br>+{remaining} more'
-        
-        return result
-    
-    return ', '.join(locations)
-
-def fetch_adzuna(what: str, where: str = "Boston, MA", max_days_old: int = 7, remote: bool = False, results_per_page: int = 50):
+import argparse, datetime as dt, os, re, time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import http_cassette
+import http_client
+from http_client import HTTP
+from listing_store import ListingStore
+from locations import format_location
+from run_report import RunReport, add_profile_argument
+
+http_cassette.install_from_env()
+
+API_BASE = os.environ.get("ADZUNA_API", "https://api.adzuna.com/v1/api/jobs/us/search")
+RESULTS_PER_PAGE = 50   # Adzuna's maximum page size
+MAX_PAGES = 20
+PAGE_WORKERS = 4        # pages in flight at once
+
+DEFAULT_WHAT = 'intern OR internship OR co-op OR coop OR student OR graduate OR "new grad" OR entry OR junior OR systems OR infrastructure OR backend OR "core systems" OR frontend OR "front end" OR "full stack" OR web OR mobile OR reliability OR "site reliability" OR sre OR devops OR cloud OR security OR qa OR "quality assurance" OR support OR IT OR compiler OR compilers OR algorithm OR algorithms OR quant OR quantitative OR simulation OR modeling OR "data infrastructure" OR "data platform" OR analytics OR "data science" OR "ml systems" OR "machine learning systems" OR "ml infra" OR "ml platform" OR product OR UX OR UI OR design OR research OR campus OR university OR fall OR spring OR summer'
+
+# Sharded mode: the OR expression is split into runs of SHARD_TERMS terms,
+# each sent as its own (smaller, faster) OR query. Together the shards ask
+# for exactly what the single expression does.
+SHARD_TERMS = 10
+SHARD_WORKERS = 4
+
+def fetch_adzuna_page(page: int, params: dict, report: RunReport = None):
+    r = HTTP.get(f"{API_BASE}/{page}", params=params, timeout=20)
+    r.raise_for_status()
+    if report:
+        report.add_bytes("adzuna", len(r.content))
+    return r.json()
+
+def _posted_on(it):
+    try:
+        return dt.date.fromisoformat((it.get("created") or "")[:10])
+    except ValueError:
+        return None
+
+def fetch_adzuna(what: str, where: str = "Boston, MA", max_days_old: int = 7, remote: bool = False,
+                 results_per_page: int = RESULTS_PER_PAGE, max_pages: int = MAX_PAGES, workers: int = PAGE_WORKERS,
+                 extra_params: dict = None, label: str = "Adzuna", report: RunReport = None):
+    """
+    Yield every Adzuna result for the search, page by page.
+
+    Page 1 gives the total count; the remaining pages are fetched with at most
+    `workers` requests in flight and yielded in page order, so only a few
+    pages are ever held in memory. Results are requested newest first, and
+    fetching stops at the first page that reaches past max_days_old.
+    extra_params are added to the query string (a None value removes one).
+    Bytes downloaded are added to `report`.
+    """
     app_id = os.environ.get("ADZUNA_APP_ID")
     app_key = os.environ.get("ADZUNA_APP_KEY")
     if not app_id or not app_key:
@@ -82,109 +71,191 @@ def fetch_adzuna(what: str, where: str = "Boston, MA", max_days_old: int = 7, re
         "results_per_page": results_per_page,
         "content-type": "application/json",
         "max_days_old": max_days_old,
+        "sort_by": "date",
     }
     if remote:
         params["remote"] = 1
+    params.update(extra_params or {})
+    params = {k: v for k, v in params.items() if v is not None}
+    cutoff = dt.date.today() - dt.timedelta(days=max_days_old)
+    HTTP.ensure_pool_size(workers)
 
-    r = requests.get(API_BASE, params=params, timeout=20)
-    r.raise_for_status()
-    return r.json()
+    def page_results(data):
+        """The page's results within max_days_old, and whether the page reached past it."""
+        results = data.get("results", [])
+        fresh = [it for it in results if (_posted_on(it) or dt.date.max) >= cutoff]
+        return fresh, len(fresh) < len(results)
 
-def main():
-    ap = argparse.ArgumentParser()
-    ap.add_argument("--what", default='intern OR internship OR co-op OR coop OR student OR graduate OR "new grad" OR entry OR junior OR systems OR infrastructure OR backend OR "core systems" OR frontend OR "front end" OR "full stack" OR web OR mobile OR reliability OR "site reliability" OR sre OR devops OR cloud OR security OR qa OR "quality assurance" OR support OR IT OR compiler OR compilers OR algorithm OR algorithms OR quant OR quantitative OR simulation OR modeling OR "data infrastructure" OR "data platform" OR analytics OR "data science" OR "ml systems" OR "machine learning systems" OR "ml infra" OR "ml platform" OR product OR UX OR UI OR design OR research OR campus OR university OR fall OR spring OR summer')
-    ap.add_argument("--location", default="Boston, MA")
-    ap.add_argument("--remote", action="store_true")
-    ap.add_argument("--max-days-old", type=int, default=7)
-    args = ap.parse_args()
+    first = fetch_adzuna_page(1, params, report)
+    total_pages = min(max_pages, max(1, -(-int(first.get("count") or 0) // results_per_page)))
+    print(f"{label}: {first.get('count', 0)} results reported, fetching up to {total_pages} pages")
+    fresh, stale = page_results(first)
+    yield from fresh
+    if stale or total_pages == 1:
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        next_page = 2
+        pending = []
+        while pending or next_page <= total_pages:
+            while next_page <= total_pages and len(pending) < workers:
+                pending.append((next_page, pool.submit(fetch_adzuna_page, next_page, params, report)))
+                next_page += 1
+            page, future = pending.pop(0)
+            fresh, stale = page_results(future.result())
+            yield from fresh
+            if stale or not fresh:
+                for _, f in pending:
+                    f.cancel()
+                if page < total_pages:
+                    print(f"{label}: stopped after page {page} of {total_pages} (older than {max_days_old} days)")
+                return
+
+def split_terms(what: str):
+    """The terms of an OR expression, with quotes removed: 'a OR "b c"' -> ['a', 'b c']."""
+    terms = re.findall(r'"([^"]+)"|\'([^\']+)\'|(\S+)', what)
+    return [next(t for t in groups if t) for groups in terms if (groups[2] or "").upper() != "OR"]
+
+def join_terms(terms):
+    """An OR expression of terms, quoting the multi-word ones: ['a', 'b c'] -> 'a OR "b c"'."""
+    return " OR ".join(f'"{t}"' if " " in t else t for t in terms)
+
+def shard_queries(what: str, shard_terms: int = SHARD_TERMS, distance_km: int = None):
+    """
+    Split an OR expression into sub-queries of at most shard_terms terms each.
 
-    data = fetch_adzuna(args.what, args.location, args.max_days_old, args.remote)
-    results = data.get("results", [])
-    print(f"Found {len(results)} results from Adzuna.")
-
-    # --- Append to README.md ---
-    readme_path = os.path.join(os.path.dirname(__file__), "..", "README.md")
-    
-    # If README.md doesn't exist, create with header and table
-    if not os.path.exists(readme_path):
-        with open(readme_path, "w", encoding="utf-8") as f:
-            f.write("# Job Listings\n\n")
-            f.write("| Company Name | Job Title | Location | Date Posted | APPLY |\n")
-            f.write("|---|---|---|---|---|\n")
-    
-    # Read existing README.md and extract existing URLs
-    with open(readme_path, "r", encoding="utf-8") as f:
-        readme_lines = f.readlines()
-    
-    # Extract all existing URLs from the README
-    import re
-    existing_urls = set()
-    for line in readme_lines:
-        # Match URLs in [APPLY](url) format (old markdown style)
-        matches = re.findall(r'\[APPLY\]\((https?://[^\)]+)\)', line)
-        existing_urls.update(matches)
-        # Match URLs in HTML <a href="url"> format (new HTML style)
-        matches = re.findall(r'<a href="(https?://[^"]+)"', line)
-        existing_urls.update(matches)
-    
-    # Prepare table rows (excluding duplicates)
-    table_rows = []
+    Every term of `what` lands in exactly one shard, so the shards' results
+    together are the single query's. distance_km, if given, also limits
+    every shard to that radius around the location.
+    """
+    terms = split_terms(what)
+    shard_terms = max(1, shard_terms)
+    chunks = [terms[i:i + shard_terms] for i in range(0, len(terms), shard_terms)] or [[]]
+    extra = {"distance": distance_km} if distance_km else {}
+    return [(f"{i}/{len(chunks)} {chunk[0] if chunk else ''}".strip(), dict(extra, what=join_terms(chunk) or what))
+            for i, chunk in enumerate(chunks, 1)]
+
+def fetch_adzuna_sharded(what: str, where: str = "Boston, MA", max_days_old: int = 7, remote: bool = False,
+                         shard_terms: int = SHARD_TERMS, distance_km: int = None,
+                         workers: int = SHARD_WORKERS, max_pages: int = MAX_PAGES, report: RunReport = None):
+    """
+    Run the shards of `what` in parallel and yield their results, dropping any
+    result another shard already returned. Results are keyed on the Adzuna
+    id: redirect URLs carry per-search tracking parameters, so the same ad
+    found by two shards has two URLs.
+    """
+    seen = set()
+    HTTP.ensure_pool_size(workers * PAGE_WORKERS)
+
+    def run_shard(name, extra):
+        return list(fetch_adzuna(what, where, max_days_old, remote, max_pages=max_pages,
+                                 extra_params=extra, label=f"Adzuna [{name}]", report=report))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_shard, name, extra)
+                   for name, extra in shard_queries(what, shard_terms, distance_km)]
+        for future in as_completed(futures):
+            for it in future.result():
+                key = it.get("id") or it.get("redirect_url")
+                if key in seen:
+                    continue
+                seen.add(key)
+                yield it
+
+def count_into(stage, results):
+    """Pass results through, counting them in stage.rows_in."""
+    stage.rows_in = 0
+    for it in results:
+        stage.rows_in += 1
+        yield it
+
+def is_internship(it):
+    """Extra strict internship/co-op filter on title and description."""
+    title = (it.get("title", "") or "").lower()
+    desc = (it.get("description", "") or "").lower()
+    return "intern" in title or "internship" in title or "co-op" in title or "co op" in title or "intern" in desc or "internship" in desc or "co-op" in desc or "co op" in desc
+
+def compare_modes(what: str, where: str, max_days_old: int, remote: bool, max_pages: int = MAX_PAGES):
+    """Time the single OR query against the sharded queries and print hits per mode."""
+    print(f"{'mode':<10} {'seconds':>8} {'results':>8} {'useful':>7} {'ratio':>6}")
+    for mode, fetch in (("single", fetch_adzuna), ("sharded", fetch_adzuna_sharded)):
+        start = time.perf_counter()
+        results = list(fetch(what, where, max_days_old, remote, max_pages=max_pages))
+        elapsed = time.perf_counter() - start
+        useful = sum(1 for it in results if is_internship(it))
+        ratio = useful / len(results) if results else 0.0
+        print(f"{mode:<10} {elapsed:8.2f} {len(results):8d} {useful:7d} {ratio:6.0%}")
+
+def record_jobs(store: ListingStore, results):
+    """Upsert Adzuna results into the listing store; returns (added, skipped duplicates)."""
     added_count = 0
     skipped_count = 0
     for it in results:
-        # Extra strict internship/co-op filter
-        title = (it.get("title", "") or "").lower()
-        desc = (it.get("description", "") or "").lower()
-        if not ("intern" in title or "internship" in title or "co-op" in title or "co op" in title or "intern" in desc or "internship" in desc or "co-op" in desc or "co op" in desc):
+        if not is_internship(it):
             continue
-        
+
         url = it.get("redirect_url", "")
-        # Skip if URL already exists in README
-        if url and url in existing_urls:
-            skipped_count += 1
-            continue
-        
         company = (it.get("company") or {}).get("display_name", "")
-        job_title = (it.get("title", "") or "").replace("|", r"\|")
+        job_title = it.get("title", "") or ""
         location = format_location((it.get("location") or {}).get("display_name", ""))
         # Format date posted as MM/DD/YYYY
         raw_date = it.get("created", "")
         date_posted = ""
         if raw_date:
             try:
-                from datetime import datetime
-                date_posted = datetime.fromisoformat(raw_date[:10]).strftime("%m/%d/%Y")
+                date_posted = dt.datetime.fromisoformat(raw_date[:10]).strftime("%m/%d/%Y")
             except Exception:
                 date_posted = raw_date
-        # Format apply link
-        apply_link = f'[APPLY]({url})' if url else ""
-        table_rows.append(f"| {company} | {job_title} | {location} | {date_posted} | {apply_link} |")
-        added_count += 1
-
-    # Find where the table ends
-    table_start = None
-    for i, line in enumerate(readme_lines):
-        # Match both old and new table separator formats
-        if line.strip().startswith("|---|---|---|---|") and "---" in line:
-            table_start = i
-            break
-    
-    # If table exists, append rows after it
-    if table_start is not None:
-        # Find last row in table
-        last_row = table_start + 1
-        while last_row < len(readme_lines) and readme_lines[last_row].startswith("|"):
-            last_row += 1
-        # Insert new rows after last_row
-        new_lines = readme_lines[:last_row] + [row + "\n" for row in table_rows] + readme_lines[last_row:]
-    else:
-        # No table found, add header and table
-        new_lines = ["# Job Listings\n\n", "| Company Name | Job Title | Location | Date Posted | APPLY |\n", "|---|---|---|---|---|\n"] + [row + "\n" for row in table_rows] + readme_lines
-    
-    # Write back to README.md
-    with open(readme_path, "w", encoding="utf-8") as f:
-        f.writelines(new_lines)
-    
+        # Skip (but credit this source) if the URL is already stored
+        if store.upsert(company, job_title, location, date_posted, url, source="adzuna"):
+            added_count += 1
+        else:
+            skipped_count += 1
+    return added_count, skipped_count
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--what", default=DEFAULT_WHAT)
+    ap.add_argument("--location", default="Boston, MA")
+    ap.add_argument("--remote", action="store_true")
+    ap.add_argument("--max-days-old", type=int, default=7)
+    ap.add_argument("--max-pages", type=int, default=MAX_PAGES, help="Most result pages to fetch")
+    ap.add_argument("--workers", type=int, default=PAGE_WORKERS, help="Result pages fetched concurrently")
+    ap.add_argument("--sharded", action="store_true",
+                    help="Split the --what OR expression into smaller queries run in parallel")
+    ap.add_argument("--shard-terms", type=int, default=SHARD_TERMS, help="Sharded mode: terms per sub-query")
+    ap.add_argument("--distance", type=int, default=None,
+                    help="Sharded mode: also limit every sub-query to this many km around --location")
+    ap.add_argument("--compare", action="store_true",
+                    help="Time the single and sharded queries and print their useful-hit ratios, without recording")
+    add_profile_argument(ap)
+    args = ap.parse_args()
+
+    if args.compare:
+        compare_modes(args.what, args.location, args.max_days_old, args.remote, args.max_pages)
+        return
+
+    # --- Stream pages into the listing store and re-render README.md ---
+    report = RunReport("adzuna_report", profile_dir=args.profile)
+    try:
+        with ListingStore() as store:
+            if args.sharded:
+                results = fetch_adzuna_sharded(args.what, args.location, args.max_days_old, args.remote,
+                                               shard_terms=args.shard_terms, distance_km=args.distance,
+                                               max_pages=args.max_pages, report=report)
+            else:
+                results = fetch_adzuna(args.what, args.location, args.max_days_old, args.remote,
+                                       max_pages=args.max_pages, workers=args.workers, report=report)
+            # Pages stream straight into the store, so fetch and record are one stage
+            with report.stage("fetch and record") as stage:
+                added_count, skipped_count = record_jobs(store, count_into(stage, results))
+                stage.rows_out = added_count
+            with report.stage("render README") as stage:
+                stage.rows_out = store.render_readme()
+    finally:
+        http_client.record_connections(report)
+        report.save()
+
     print(f"README.md: Added {added_count} new jobs, skipped {skipped_count} duplicates.")
 
 if __name__ == "__main__":
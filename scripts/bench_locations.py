@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Benchmark the shared location normalizer against the per-script copies it replaced.
+
+The corpus is the Location column of README.md (plus any extra README tables
+passed with --readme). Each legacy variant below is a frozen copy of the
+format_location that used to live in that script; the benchmark reports how
+fast the old and new versions are and how often their outputs agree (raw
+equality). Every cell whose outputs differ on purpose is listed, with both
+exact outputs, in INTENTIONAL_DIFFS; any other difference is printed and
+makes the exit status 1.
+
+Known intentional differences:
+- The old display variants replaced "Remote in USA"/"Remote in Canada" with
+  upper-case placeholders that their own rules then split, producing
+  "<<<RE, MOTE_USA>>>". The shared normalizer keeps these phrases intact.
+- adzuna_report/discover_slugs lacked the two concatenation rules that
+  job_report and fix_locations had; all scripts now share them.
+- The legacy rules never split a state code glued to the next place or
+  "USA" glued to a city, and kept the "N locations" count as a location:
+  "3 locationsNew York, NYBoston, MARemote in USA" came out as
+  "Boston; MARemote in USA" and "San Francisco, CARemote in USASt. Louis, MO"
+  as one location. The shared tokenizer splits both into their locations and
+  drops the count.
+- The display variants split "City, ST" pairs on the comma and de-duplicated
+  the pieces, so "Boston, MA; Quincy, MA" lost its second "MA"; the shared
+  tokenizer keeps each pair whole.
+- A state code followed by a city ("TX Boston") stayed one location; the
+  shared tokenizer splits it, so the relevant formatter keeps just "Boston".
+
+Usage:
+    python bench_locations.py
+    python bench_locations.py --readme other/README.md --repeat 5
+    python bench_locations.py --show-intentional
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+import locations
+from locations import is_relevant_location
+from run_report import Profiler, add_profile_argument
+
+
+# ---------- Legacy variants (frozen, for comparison only) ----------
+def _legacy_display(location: str, split_concatenated: bool, protect_uk: bool,
+                    max_length: int, overflow_format: str) -> str:
+    """job_report / adzuna_report / discover_slugs / fix_locations format_location."""
+    if not location:
+        return location
+    location = location.replace('Remote in USA', '<<<REMOTE_USA>>>')
+    location = location.replace('Remote in Canada', '<<<REMOTE_CANADA>>>')
+    if protect_uk:
+        location = location.replace('Remote in UK', '<<<REMOTE_UK>>>')
+    if split_concatenated:
+        location = re.sub(r'([a-z])([A-Z][a-z]{3,})', r'\1, \2', location)
+        location = re.sub(r'([A-Z]{2})([A-Z][a-z]{3,})', r'\1, \2', location)
+    location = re.sub(r'([A-Z]{2})([A-Z]{2,}[a-z])', r'\1, \2', location)
+    location = re.sub(r'([A-Z]{2})([A-Z]{3,})', r'\1, \2', location)
+    location = re.sub(r'([A-Z]{2})([A-Z][a-z])', r'\1, \2', location)
+    location = re.sub(r'([a-z])([A-Z][a-z])', r'\1, \2', location)
+    location = re.sub(r'(Remote in [A-Z]{2,})([A-Z])', r'\1, \2', location)
+    location = re.sub(r'(Remote in [A-Za-z\s]+?)([A-Z][a-z]+, [A-Z]{2})', r'\1, \2', location)
+    location = re.sub(r'(\d+ locations)([A-Z])', r'\1, \2', location)
+    location = location.replace('<<<REMOTE_USA>>>', 'Remote in USA')
+    location = location.replace('<<<REMOTE_CANADA>>>', 'Remote in Canada')
+    if protect_uk:
+        location = location.replace('<<<REMOTE_UK>>>', 'Remote in UK')
+    locations_ = [loc.strip() for loc in re.split(r'[,;]', location) if loc.strip()]
+    seen = set()
+    unique_locations = []
+    for loc in locations_:
+        if loc.lower() not in seen:
+            seen.add(loc.lower())
+            unique_locations.append(loc)
+    locations_ = unique_locations
+    if len(locations_) > 3 or len(', '.join(locations_)) > max_length:
+        kept_locations = []
+        total_length = 0
+        for loc in locations_[:3]:
+            if total_length + len(loc) > max_length and kept_locations:
+                break
+            kept_locations.append(loc)
+            total_length += len(loc) + 2
+        result = ', '.join(kept_locations)
+        if len(locations_) > len(kept_locations):
+            result += overflow_format.format(len(locations_) - len(kept_locations))
+        return result
+    return ', '.join(locations_)
+
+
+def _legacy_relevant(location: str) -> str:
+    """simplify_scraper format_location (filters to relevant locations)."""
+    if not location:
+        return location
+    location = location.replace('Remote in USA', '___remote_usa___')
+    location = location.replace('Remote in UK', '___remote_uk___')
+    location = location.replace('Remote in Canada', '___remote_canada___')
+    location = location.replace('Remote in India', '___remote_india___')
+    location = location.replace('Remote in Europe', '___remote_europe___')
+    location = re.sub(r'([a-z])([A-Z][a-z]{3,})', r'\1; \2', location)
+    location = re.sub(r'([A-Z]{2})([A-Z][a-z]{3,})', r'\1; \2', location)
+    location = re.sub(r'\b([A-Z]{2})\s+([A-Z][a-z]+),\s*([A-Z]{2})\b', r'\1; \2, \3', location)
+    location = re.sub(r'([a-z], [A-Z]{2})\s+([A-Z][a-z]+)', r'\1; \2', location)
+    location = re.sub(r'(\d+ locations)([A-Z])', r'\1, \2', location)
+    location = re.sub(r'(Remote in [A-Z]{2,})([A-Z])', r'\1; \2', location)
+    location = re.sub(r'(Remote in [A-Za-z\s]+?)([A-Z][a-z]+, [A-Z]{2})', r'\1; \2', location)
+    location = location.replace('___remote_usa___', 'Remote in USA')
+    location = location.replace('___remote_uk___', 'Remote in UK')
+    location = location.replace('___remote_canada___', 'Remote in Canada')
+    location = location.replace('___remote_india___', 'Remote in India')
+    location = location.replace('___remote_europe___', 'Remote in Europe')
+    expanded_locations = []
+    for segment in re.split(r';', location):
+        if re.search(r'[a-zA-Z]+,\s*[A-Z]{2}(?:\s|$)', segment):
+            expanded_locations.append(segment.strip())
+        else:
+            expanded_locations.extend([p for p in (p.strip() for p in segment.split(',')) if p])
+    locations_ = [loc.strip() for loc in expanded_locations if loc.strip()]
+    merged_locations = []
+    i = 0
+    while i < len(locations_):
+        if i + 1 < len(locations_) and re.match(r'^[A-Z]{2}$', locations_[i + 1].strip()):
+            merged_locations.append(f"{locations_[i]}, {locations_[i + 1]}")
+            i += 2
+        else:
+            merged_locations.append(locations_[i])
+            i += 1
+    locations_ = [loc for loc in merged_locations if is_relevant_location(loc)]
+    if not locations_:
+        return ""
+    seen = set()
+    unique_locations = []
+    for loc in locations_:
+        if loc.lower() not in seen:
+            seen.add(loc.lower())
+            unique_locations.append(loc)
+    locations_ = unique_locations
+    if len(locations_) > 4:
+        return f"{locations_[0]} (+{len(locations_)-1} other location{'s' if len(locations_) > 2 else ''})"
+    elif len(locations_) > 1:
+        return '; '.join(locations_)
+    return locations_[0] if locations_ else ""
+
+
+# Printed before the corpus results so the fixed cases stay visible
+EXAMPLES = [
+    "3 locationsNew York, NYBoston, MARemote in USA",
+    "San Francisco, CARemote in USASt. Louis, MO",
+]
+
+# Every known intentional difference on the README corpus, as
+# {cell: (legacy output, shared output)} per variant. A diff is only counted
+# as intentional if it matches its entry exactly.
+_RELEVANT_DIFFS = {
+    '4 locations Boston': ('4 locations Boston', 'Boston'),
+    'Boston, Massachusetts': ('Boston; Massachusetts', 'Boston, Massachusetts'),
+    'Boston, Massachusetts, USA': ('Boston; Massachusetts', 'Boston, Massachusetts, USA'),
+    'Quincy, Massachusetts': ('Quincy; Massachusetts', 'Quincy, Massachusetts'),
+    'Boston, Massachusetts, USA<br>+1 more': ('Boston; Massachusetts', 'Boston, Massachusetts'),
+    'Boston, Massachusetts, USA<br>+3 more': ('Boston; Massachusetts', 'Boston, Massachusetts'),
+    'United States Boston, Massachusetts': ('United States Boston; Massachusetts',
+                                            'United States Boston, Massachusetts'),
+    'Lowell, MA, Statewide, MA': ('Lowell, MA, Statewide, MA', 'Lowell, MA; Statewide, MA'),
+    'CARemote in USASt. Louis, MO': ('CARemote in USASt. Louis, MO', 'Remote in USA'),
+    'Remote in USALongmont, CO': ('', 'Remote in USA'),
+    'CO Boxborough , MA': ('CO Boxborough, MA', 'Boxborough, MA'),
+    'TX Boston': ('TX Boston', 'Boston'),
+    'GA Boston': ('GA Boston', 'Boston'),
+    'RI Norwood': ('RI Norwood', 'Norwood'),
+    'CO Cambridge': ('CO Cambridge', 'Cambridge'),
+    'NY Lowell': ('NY Lowell', 'Lowell'),
+    'CA Waltham': ('CA Waltham', 'Waltham'),
+}
+_DISPLAY_DIFFS = {
+    'Remote in USA': ('<<<RE, MOTE_USA>>>', 'Remote in USA'),
+    'Remote in USALongmont, CO': ('<<<RE, MOTE_USA>>>Longmont, CO', 'Remote in USA, Longmont, CO'),
+    'CARemote in USASt. Louis, MO': ('CA<<<RE, MOTE_USA>>>St. Louis, MO', 'CA, Remote in USA, St. Louis, MO'),
+    '4 locations Boston': ('4 locations Boston', 'Boston'),
+    'Boston, MA; Quincy, MA': ('Boston, MA, Quincy', 'Boston, MA, Quincy, MA'),
+    'Lowell, MA, Statewide, MA': ('Lowell, MA, Statewide', 'Lowell, MA, Statewide, MA'),
+    'Boston, MA Canton, MA': ('Boston, MA Canton, MA', 'Boston, MA, Canton, MA'),
+    'Bedford, MA; Domestic Teleworker, MA; Lexington Park, MD': (
+        'Bedford, MA, Domestic Teleworker<br>+2 more', 'Bedford, MA, Domestic Teleworker, MA<br>+1 more'),
+    'CO Boxborough , MA': ('CO Boxborough, MA', 'CO, Boxborough, MA'),
+    'TX Boston': ('TX Boston', 'TX, Boston'),
+    'GA Boston': ('GA Boston', 'GA, Boston'),
+    'RI Norwood': ('RI Norwood', 'RI, Norwood'),
+    'CO Cambridge': ('CO Cambridge', 'CO, Cambridge'),
+    'NY Lowell': ('NY Lowell', 'NY, Lowell'),
+    'CA Waltham': ('CA Waltham', 'CA, Waltham'),
+}
+# fix_locations allows 60 characters, so the long cell fits and has its own overflow note
+_FIX_LOCATIONS_DIFFS = dict(_DISPLAY_DIFFS, **{
+    'Bedford, MA; Domestic Teleworker, MA; Lexington Park, MD': (
+        'Bedford, MA, Domestic Teleworker (+2 more)', 'Bedford, MA, Domestic Teleworker, MA, Lexington Park, MD'),
+})
+INTENTIONAL_DIFFS = {
+    "simplify_scraper": _RELEVANT_DIFFS,
+    "job_report": _DISPLAY_DIFFS,
+    "adzuna_report/discover_slugs": _DISPLAY_DIFFS,
+    "fix_locations": _FIX_LOCATIONS_DIFFS,
+}
+
+
+# (script, legacy implementation, shared replacement)
+VARIANTS = [
+    ("simplify_scraper",
+     _legacy_relevant,
+     locations.format_relevant_location),
+    ("job_report",
+     lambda loc: _legacy_display(loc, True, False, 50, '<br>+{} more'),
+     locations.format_location),
+    ("adzuna_report/discover_slugs",
+     lambda loc: _legacy_display(loc, False, False, 50, '<br>+{} more'),
+     locations.format_location),
+    ("fix_locations",
+     lambda loc: _legacy_display(loc, True, True, 60, ' (+{} more)'),
+     lambda loc: locations.format_location(loc, max_length=60, overflow_format=' (+{} more)')),
+]
+
+
+def load_corpus(paths):
+    """Location column (4th pipe-separated field) of every table row in the given READMEs."""
+    corpus = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.startswith("| ") or line.startswith("| Company Name"):
+                    continue
+                cells = line.split("|")
+                if len(cells) >= 6:
+                    corpus.append(cells[3].strip())
+    return corpus
+
+
+def best_time(fn, corpus, repeat, clear_cache=None):
+    best = float("inf")
+    for _ in range(repeat):
+        if clear_cache:
+            clear_cache()
+        start = time.perf_counter()
+        for loc in corpus:
+            fn(loc)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def clear_caches():
+    locations.tokenize_locations.cache_clear()
+    locations.format_location.cache_clear()
+    locations.format_relevant_location.cache_clear()
+
+
+def main():
+    default_readme = os.path.join(os.path.dirname(__file__), "..", "README.md")
+    ap = argparse.ArgumentParser(description="Compare the shared location normalizer with the legacy copies")
+    ap.add_argument("--readme", action="append", default=[], help="README(s) to take Location cells from")
+    ap.add_argument("--repeat", type=int, default=5, help="Runs per variant; best time is reported")
+    ap.add_argument("--show-diffs", type=int, default=3, help="Unlisted differences to print per variant")
+    ap.add_argument("--show-intentional", action="store_true",
+                    help="Also print the listed intentional differences found in the corpus")
+    add_profile_argument(ap)
+    args = ap.parse_args()
+
+    corpus = load_corpus(args.readme or [default_readme])
+    if not corpus:
+        raise SystemExit("No Location cells found")
+    repeat = max(1, args.repeat)
+    print("Concatenated cells:")
+    for loc in EXAMPLES:
+        print(f"    {loc!r}")
+        for name, legacy, shared in VARIANTS[:2]:
+            print(f"        {name:<18} {legacy(loc)!r} -> {shared(loc)!r}")
+    print(f"\nCorpus: {len(corpus):,} locations ({len(set(corpus)):,} distinct)\n")
+    # "equal" is raw output equality; "listed" diffs match INTENTIONAL_DIFFS exactly, "other" don't
+    print(f"{'variant':<30} {'legacy ms':>10} {'shared ms':>10} {'cached ms':>10} {'speedup':>8} "
+          f"{'equal':>8} {'listed':>7} {'other':>6}")
+
+    profiler = Profiler(args.profile, "bench_locations")
+    all_other = 0
+    for name, legacy, shared in VARIANTS:
+        with profiler.profile(f"{name} legacy"):
+            legacy_time = best_time(legacy, corpus, repeat)
+        with profiler.profile(f"{name} shared"):
+            shared_time = best_time(shared, corpus, repeat, clear_caches)  # per-run cache starts empty
+        cached_time = best_time(shared, corpus, repeat)                # every value already cached
+        diffs = [(loc, legacy(loc), shared(loc)) for loc in corpus if legacy(loc) != shared(loc)]
+        listed = INTENTIONAL_DIFFS[name]
+        other = [d for d in diffs if listed.get(d[0]) != d[1:]]
+        equal = 100.0 * (len(corpus) - len(diffs)) / len(corpus)
+        print(f"{name:<30} {legacy_time * 1000:10.2f} {shared_time * 1000:10.2f} {cached_time * 1000:10.2f} "
+              f"{legacy_time / shared_time:7.1f}x {equal:7.2f}% {len(diffs) - len(other):7d} {len(other):6d}")
+        all_other += len(other)
+        shown = {loc: (old, new) for loc, old, new in other}
+        for loc, (old, new) in list(shown.items())[:args.show_diffs]:
+            print(f"    other:  {loc!r}: {old!r} -> {new!r}")
+        if args.show_intentional:
+            for loc in dict.fromkeys(d[0] for d in diffs if d[0] not in shown):
+                print(f"    listed: {loc!r}: {listed[loc][0]!r} -> {listed[loc][1]!r}")
+    sys.exit(1 if all_other else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Measure memory per JobListing: the slotted, interned class against the plain
+dataclass it replaced.
+
+Parses a SimplifyJobs-style and two markdown synthetic READMEs (the
+generators from bench_pipeline.py) --replays times over, as a run that also
+holds historical snapshots would, keeps every listing, and reports the
+traced bytes still held per listing and the size of one instance (with its
+__dict__, if any). Also times filter_boston_remote and
+deduplicate_across_sources over the whole set, which use the lowercase keys
+the new class computes up front, and checks both classes produce the same
+listings.
+
+Parsing runs once untraced first, so the normalizer caches are warm and only
+the listings themselves are counted.
+
+Usage:
+    python bench_memory.py
+    python bench_memory.py --rows 20000 --replays 5
+"""
+
+import argparse
+import contextlib
+import gc
+import logging
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import astuple, dataclass
+
+import simplify_scraper as scraper
+from bench_pipeline import markdown_readme, simplify_readme
+from locations import listing_matches_location
+
+DEFAULT_ROWS = 10000
+DEFAULT_REPLAYS = 3
+
+
+# ---------- Legacy model (frozen, for comparison only) ----------
+@dataclass
+class LegacyJobListing:
+    company: str
+    title: str
+    location: str
+    apply_url: str
+    date_posted: str
+    source: str = ""
+    is_closed: bool = False
+
+    def matches_location(self, include_remote: bool = True) -> bool:
+        return listing_matches_location(self.location, include_remote)
+
+    @property
+    def dedupe_key(self) -> str:
+        # What deduplicate_across_sources computed per call before the key was stored
+        return f"{self.company}|{self.title}".lower()
+
+
+VARIANTS = {"dataclass": LegacyJobListing, "slotted": scraper.JobListing}
+
+
+@contextlib.contextmanager
+def listing_class(cls):
+    """Make the simplify_scraper parsers build listings of `cls`."""
+    current = scraper.JobListing
+    scraper.JobListing = cls
+    try:
+        yield
+    finally:
+        scraper.JobListing = current
+
+
+def parse_all(readmes, replays: int):
+    return [job for _ in range(replays) for name, content in readmes
+            for job in scraper.parse_markdown_table(content, name)]
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def instance_size(job) -> int:
+    return sys.getsizeof(job) + (sys.getsizeof(job.__dict__) if hasattr(job, "__dict__") else 0)
+
+
+def measure(cls, readmes, replays: int, repeat: int):
+    """(listings, kept by filter+dedupe, retained bytes, bytes per instance, filter seconds, dedupe seconds)."""
+    with listing_class(cls):
+        parse_all(readmes, 1)
+        gc.collect()
+        tracemalloc.start()
+        jobs = parse_all(readmes, replays)
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    filter_seconds = best_of(lambda: scraper.filter_boston_remote(jobs), repeat)
+    dedupe_seconds = best_of(lambda: scraper.deduplicate_across_sources(jobs), repeat)
+    kept = scraper.filter_boston_remote(scraper.deduplicate_across_sources(jobs))
+    return jobs, kept, retained, instance_size(jobs[0]) if jobs else 0, filter_seconds, dedupe_seconds
+
+
+def as_tuple(job):
+    return astuple(job) if isinstance(job, LegacyJobListing) else job.astuple()
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Compare memory per listing for the old and new JobListing")
+    ap.add_argument("--rows", type=int, default=DEFAULT_ROWS, help="Rows per synthetic README")
+    ap.add_argument("--replays", type=int, default=DEFAULT_REPLAYS,
+                    help="Times every README is parsed and kept (historical snapshots)")
+    ap.add_argument("--repeat", type=int, default=5, help="Runs of each timing; the fastest is reported")
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+
+    # Per-section progress logs would swamp the output
+    logging.disable(logging.WARNING)
+    rng = random.Random(args.seed)
+    readmes = [
+        ("SimplifyJobs", simplify_readme(rng, args.rows)),
+        ("SpeedyApply", markdown_readme(rng, args.rows, 0)),
+        ("vanshb03", markdown_readme(rng, args.rows, args.rows // 2)),
+    ]
+
+    results = {name: measure(cls, readmes, max(1, args.replays), max(1, args.repeat))
+               for name, cls in VARIANTS.items()}
+
+    print(f"{'variant':<10} {'listings':>9} {'bytes/listing':>14} {'instance B':>11} {'retained MB':>12} "
+          f"{'filter s':>9} {'dedupe s':>9}")
+    for name, (jobs, _, retained, instance, filter_seconds, dedupe_seconds) in results.items():
+        per_listing = retained / len(jobs) if jobs else 0
+        print(f"{name:<10} {len(jobs):9,d} {per_listing:14.0f} {instance:11d} {retained / 1e6:12.1f} "
+              f"{filter_seconds:9.3f} {dedupe_seconds:9.3f}")
+
+    old, new = results["dataclass"], results["slotted"]
+    if old[2] and new[2]:
+        print(f"\nslotted holds {1 - new[2] / old[2]:.0%} less per listing")
+    identical = ([as_tuple(j) for j in old[0]] == [as_tuple(j) for j in new[0]]
+                 and [as_tuple(j) for j in old[1]] == [as_tuple(j) for j in new[1]])
+    if not identical:
+        print("MISMATCH between dataclass and slotted listings")
+    sys.exit(0 if identical else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark the GitHub README parsing paths.
+
+Parses the same README with every HTML row-parser backend in HTML_ROW_PARSERS,
+each with and without the location pre-filter, checks that every variant
+produces JobListings identical to the full BeautifulSoup path, and reports
+how long each one takes. Markdown-table READMEs (speedyapply, vanshb03) are
+checked the same way with and without the pre-filter.
+
+Usage:
+    python bench_parsers.py                       # fetch the live SimplifyJobs README
+    python bench_parsers.py --readme path/to/README.md --repeat 5
+"""
+
+import argparse
+import logging
+import sys
+import time
+
+import simplify_scraper as scraper
+from run_report import Profiler, add_profile_argument
+
+
+def time_variant(parse, repeat: int):
+    """Return (best wall time in seconds, parsed listings as tuples) for one variant."""
+    best = float("inf")
+    jobs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        jobs = parse()
+        best = min(best, time.perf_counter() - start)
+    return best, [job.astuple() for job in jobs]
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Compare README parsing backends and the location pre-filter")
+    ap.add_argument("--readme", help="Local README to parse (default: fetch SimplifyJobs)")
+    ap.add_argument("--repeat", type=int, default=3, help="Runs per variant; best time is reported")
+    add_profile_argument(ap)
+    args = ap.parse_args()
+
+    if args.readme:
+        with open(args.readme, "r", encoding="utf-8") as f:
+            readme_content = f.read()
+    else:
+        source = scraper.GITHUB_SOURCES[0]
+        readme_content = scraper.fetch_readme(source["url"], source["name"])
+        if not readme_content:
+            raise SystemExit("Could not fetch the SimplifyJobs README")
+
+    # Per-section progress logs would swamp the timings
+    logging.disable(logging.INFO)
+    repeat = max(1, args.repeat)
+
+    section_tables = scraper.find_section_tables(readme_content, scraper.SIMPLIFY_SECTIONS)
+    variants = {}
+    if section_tables:
+        rows = sum(table.count("<tr") - 1 for _, table in section_tables)
+        print(f"README: {len(readme_content):,} bytes, {rows:,} HTML table rows")
+        for parser in scraper.HTML_ROW_PARSERS:
+            for prefilter in (False, True):
+                name = f"{parser}{'+prefilter' if prefilter else ''}"
+                variants[name] = lambda p=parser, f=prefilter: scraper.parse_html_tables(readme_content, "bench", p, f)
+        reference = "bs4"
+    else:
+        rows = sum(1 for line in readme_content.split("\n") if line.strip().startswith("|"))
+        print(f"README: {len(readme_content):,} bytes, {rows:,} markdown table rows")
+        for prefilter in (False, True):
+            name = f"markdown{'+prefilter' if prefilter else ''}"
+            variants[name] = lambda f=prefilter: scraper.parse_plain_markdown_tables(readme_content, "bench", f)
+        reference = "markdown"
+
+    profiler = Profiler(args.profile, "bench_parsers")
+    results = {}
+    for name, parse in variants.items():
+        with profiler.profile(name):
+            results[name] = time_variant(parse, repeat)
+        elapsed, jobs = results[name]
+        print(f"  {name:<16} {elapsed * 1000:9.1f} ms  {len(jobs):,} listings")
+
+    baseline_time, baseline_jobs = results[reference]
+    identical = True
+    for name, (elapsed, jobs) in results.items():
+        if name == reference:
+            continue
+        same = jobs == baseline_jobs
+        identical = identical and same
+        print(f"  {name} vs {reference}: {'identical' if same else 'MISMATCH'} output, {baseline_time / elapsed:.1f}x faster")
+
+    sys.exit(0 if identical else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Benchmark the GitHub board pipeline on synthetic READMEs of increasing size.
+
+For each size, generates a SimplifyJobs-style HTML README, speedyapply- and
+vanshb03-style markdown READMEs and a README.md with matching historical
+rows, then times every stage of simplify_scraper on them separately:
+
+    parse_html_tables, parse_plain_markdown_tables, format_location,
+    deduplicate_across_sources, filter_boston_remote, load_existing,
+    deduplicate_jobs, append_to_readme, sort_readme
+
+get_existing_jobs no longer exists: the existing listings now live in the
+listing store, so its cost is measured as load_existing (bootstrapping a
+fresh store from the historical README) plus deduplicate_jobs (indexed
+lookups against it). sort_readme re-renders README.md from the store, which
+is what sort_readme.py does.
+
+Each size ends by checking that rendering the README, importing it back and
+rendering again changes nothing (the exit status is 1 if it does).
+
+Everything runs offline in a temporary directory. Results are written as
+JSON; pass a previous run with --baseline to print per-stage ratios.
+
+Usage:
+    python bench_pipeline.py                                  # 1k, 10k, 100k rows
+    python bench_pipeline.py --sizes 1000,10000 --out bench.json
+    python bench_pipeline.py --baseline bench.json --out bench-new.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+import locations
+import simplify_scraper as scraper
+from listing_store import TABLE_HEADER, TABLE_SEPARATOR, ListingStore, format_readme_row
+from run_report import Profiler, add_profile_argument
+
+DEFAULT_SIZES = "1000,10000,100000"
+HISTORY_OVERLAP = 0.5  # share of historical README rows that reappear in the boards
+
+# Raw location cells in the shapes the boards use; about a third are relevant
+LOCATIONS = [
+    "Boston, MA", "Cambridge, MA", "Remote in USA", "Somerville, MA", "Waltham, MA",
+    "New York, NY", "San Francisco, CA", "Seattle, WA", "Austin, TX", "Chicago, IL",
+    "Toronto, ON, Canada", "London, UK", "Mountain View, CA", "Denver, CO", "Atlanta, GA",
+]
+MULTI_LOCATIONS = [
+    ("New York, NY", "Boston, MA", "Remote in USA"),
+    ("San Francisco, CA", "Seattle, WA", "Austin, TX"),
+    ("Cambridge, MA", "Burlington, MA"),
+]
+ROLES = [
+    "Software Engineer Intern", "Backend Engineering Intern", "Data Science Intern",
+    "Machine Learning Intern", "Quantitative Research Intern", "Hardware Engineering Intern",
+    "Site Reliability Intern", "Product Manager Intern", "Infrastructure Co-op",
+]
+AGES = ["0d", "1d", "3d", "1w", "2w", "1mo", "Oct 17", "Sep 02"]
+
+
+def synthetic_row(rng: random.Random, i: int):
+    """(company, role, location parts, url, age) for the i-th synthetic posting."""
+    company = f"Company{i % (1 + i // 4):05d}"
+    role = f"{rng.choice(ROLES)} {i % 7 or ''}".strip()
+    parts = rng.choice(MULTI_LOCATIONS) if rng.random() < 0.1 else (rng.choice(LOCATIONS),)
+    return company, role, parts, f"https://boards.example.com/{company.lower()}/{i}?utm_source=Simplify", rng.choice(AGES)
+
+
+def location_cell(rng: random.Random) -> str:
+    """
+    A location cell as the HTML parser extracts it: one to four places, a
+    multi-location cell glued together ("2 locationsBoston, MARemote in USA").
+    Drawn from all orderings of LOCATIONS so few cells repeat.
+    """
+    parts = rng.sample(LOCATIONS, rng.choice((1, 1, 2, 3, 4)))
+    return f"{len(parts)} locations{''.join(parts)}" if len(parts) > 1 else parts[0]
+
+
+def simplify_readme(rng: random.Random, rows: int) -> str:
+    """SimplifyJobs layout: one HTML table per section, rows spread across sections."""
+    per_section = -(-rows // len(scraper.SIMPLIFY_SECTIONS))
+    out = ["# Summer 2026 Tech Internships\n"]
+    for s, section in enumerate(scraper.SIMPLIFY_SECTIONS):
+        out.append(f"## {section}\n\n<table>\n<thead>\n<tr>\n<th>Company</th>\n<th>Role</th>\n"
+                   "<th>Location</th>\n<th>Application</th>\n<th>Age</th>\n</tr>\n</thead>\n<tbody>")
+        for i in range(s * per_section, min(rows, (s + 1) * per_section)):
+            company, role, parts, url, age = synthetic_row(rng, i)
+            if len(parts) > 1:
+                location = f"<details><summary><strong>{len(parts)} locations</strong></summary>{'</br>'.join(parts)}</details>"
+            else:
+                location = parts[0]
+            lock = "🔒" if rng.random() < 0.1 else ""
+            out.append(f'<tr>\n<td><strong><a href="https://simplify.jobs/c/{company}">{company}</a></strong></td>\n'
+                       f"<td>{role}{lock}</td>\n<td>{location}</td>\n"
+                       f'<td><div align="center"><a href="{url}"><img src="https://i.imgur.com/apply.png" width="118" alt="Apply"></a></div></td>\n'
+                       f"<td>{age}</td>\n</tr>")
+        out.append("</tbody>\n</table>\n")
+    return "\n".join(out)
+
+
+def markdown_readme(rng: random.Random, rows: int, offset: int) -> str:
+    """speedyapply/vanshb03 layout: one markdown table, Company | Position | Location | Posting | Age."""
+    out = ["# 2026 SWE College Jobs\n", "| Company | Position | Location | Posting | Age |", "|---|---|---|:---:|:---:|"]
+    for i in range(offset, offset + rows):
+        company, role, parts, url, age = synthetic_row(rng, i)
+        out.append(f"| **[{company}](https://{company.lower()}.example.com)** | {role} | {'</br>'.join(parts)} "
+                   f"| [Apply]({url}) | {age} |")
+    return "\n".join(out) + "\n"
+
+
+def history_readme(jobs, rng: random.Random, rows: int) -> str:
+    """README.md with `rows` historical listings, HISTORY_OVERLAP of them taken from `jobs`."""
+    overlap = rng.sample(jobs, min(len(jobs), int(rows * HISTORY_OVERLAP)))
+    lines = [format_readme_row(j.company, j.title, j.location, "09/01/2025", j.apply_url) for j in overlap]
+    for i in range(rows - len(lines)):
+        lines.append(format_readme_row(f"Legacy{i:06d}", "Software Engineer Intern", "Boston, MA",
+                                       f"{1 + i % 12:02d}/{1 + i % 28:02d}/2025", f"https://legacy.example.com/{i}"))
+    return f"# Job Listings\n\n{TABLE_HEADER}\n{TABLE_SEPARATOR}\n" + "\n".join(lines) + "\n"
+
+
+# Stored values a README row can't reproduce verbatim: whitespace _cell
+# collapses, and apply links parse_readme_row doesn't read back
+AWKWARD_LISTINGS = [
+    ("Acme  Robotics", "Software  Engineer Intern ", "Boston, MA", "09/01/2025", "https://acme.example.com/1"),
+    ("Acme Robotics", "Data\tScience Intern", "Boston, MA", "09/01/2025", "mailto:jobs@acme.example.com"),
+    ("Beta Labs", "Hardware Intern", "Cambridge, MA", "09/01/2025", ""),
+]
+
+
+def render_is_stable(store: ListingStore) -> bool:
+    """render -> import -> render leaves the README and the listing count unchanged."""
+    for listing in AWKWARD_LISTINGS:
+        store.upsert(*listing, source="bench")
+    with contextlib.redirect_stdout(io.StringIO()):
+        store.render_readme()
+        with open(store.readme_path, "r", encoding="utf-8") as f:
+            first = f.read()
+        count = store.count()
+        store.render_readme()
+    with open(store.readme_path, "r", encoding="utf-8") as f:
+        return f.read() == first and store.count() == count
+
+
+def best_of(fn, repeat: int, setup=None):
+    """(best seconds, last result) of fn(*setup()) over `repeat` runs; setup is not timed."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        args = setup() if setup else ()
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def cold_caches():
+    """Empty the location normalizer's memo caches so each run starts like a fresh process."""
+    for name in ("tokenize_locations", "format_location", "format_relevant_location",
+                 "_classify_relevant", "_classify_listing", "_classify_boston_area"):
+        getattr(locations, name).cache_clear()
+    return ()
+
+
+def bench_size(rows: int, repeat: int, seed: int, workdir: str, profiler: Optional[Profiler] = None):
+    """
+    Time every stage on READMEs with `rows` rows. Returns (result dicts,
+    whether the rendered README survives a render -> import -> render).
+    """
+    profiler = profiler or Profiler(None, "bench_pipeline")
+
+    def timed(stage, fn, setup=None):
+        with profiler.profile(f"{stage} {rows}"):
+            return best_of(fn, repeat, setup)
+
+    rng = random.Random(seed)
+    simplify = simplify_readme(rng, rows)
+    markdown = [markdown_readme(rng, rows // 2, rows // 4), markdown_readme(rng, rows // 2, rows)]
+    results = []
+
+    def record(stage, seconds, rows_in, rows_out):
+        results.append({"rows": rows, "stage": stage, "seconds": round(seconds, 6),
+                        "rows_in": rows_in, "rows_out": rows_out})
+        print(f"  {stage:<28} {seconds * 1000:10.1f} ms  {rows_in:>8,} -> {rows_out:,}", file=sys.stderr)
+
+    seconds, html_jobs = timed("parse_html_tables", lambda: scraper.parse_html_tables(simplify, "SimplifyJobs"),
+                               cold_caches)
+    record("parse_html_tables", seconds, rows, len(html_jobs))
+
+    sources = list(zip(markdown, ("SpeedyApply", "vanshb03")))
+    seconds, md_jobs = timed("parse_plain_markdown_tables",
+                             lambda: [job for content, name in sources
+                                      for job in scraper.parse_plain_markdown_tables(content, name)], cold_caches)
+    record("parse_plain_markdown_tables", seconds, rows // 2 * 2, len(md_jobs))
+
+    # Varied cells, so the stage measures the tokenizer rather than memo hits
+    raw_locations = [location_cell(rng) for _ in range(rows)]
+    seconds, formatted = timed("format_location", lambda: [scraper.format_location(loc) for loc in raw_locations],
+                               cold_caches)
+    record("format_location", seconds, rows, sum(1 for loc in formatted if loc))
+
+    all_jobs = html_jobs + md_jobs
+    seconds, unique = timed("deduplicate_across_sources", lambda: scraper.deduplicate_across_sources(all_jobs))
+    record("deduplicate_across_sources", seconds, len(all_jobs), len(unique))
+
+    seconds, filtered = timed("filter_boston_remote",
+                              lambda: scraper.filter_boston_remote(unique, include_remote=True), cold_caches)
+    record("filter_boston_remote", seconds, len(unique), len(filtered))
+
+    readme_path = os.path.join(workdir, f"README-{rows}.md")
+    db_path = os.path.join(workdir, f"listings-{rows}.db")
+    history = history_readme(filtered, rng, rows)
+
+    def fresh_store():
+        for path in (db_path, db_path + "-wal", db_path + "-shm"):
+            if os.path.exists(path):
+                os.remove(path)
+        with open(readme_path, "w", encoding="utf-8") as f:
+            f.write(history)
+        return ()
+
+    def load_existing():
+        with contextlib.redirect_stdout(io.StringIO()):
+            store = ListingStore(db_path, readme_path)
+        count = store.count()
+        store.close()
+        return count
+
+    seconds, stored = timed("load_existing", load_existing, fresh_store)
+    record("load_existing", seconds, rows, stored)
+
+    with ListingStore(db_path, readme_path) as store:
+        seconds, new_jobs = timed("deduplicate_jobs", lambda: scraper.deduplicate_jobs(filtered, store))
+        record("deduplicate_jobs", seconds, len(filtered), len(new_jobs))
+
+    def open_store():
+        fresh_store()
+        with contextlib.redirect_stdout(io.StringIO()):
+            return (ListingStore(db_path, readme_path),)
+
+    def append(store):
+        with contextlib.redirect_stdout(io.StringIO()):
+            scraper.append_to_readme(new_jobs, store)
+        count = store.count()
+        store.close()
+        return count
+
+    seconds, total = timed("append_to_readme", append, open_store)
+    record("append_to_readme", seconds, len(new_jobs), total)
+
+    with ListingStore(db_path, readme_path) as store:
+        seconds, rendered = timed("sort_readme", store.render_readme)
+    record("sort_readme", seconds, total, rendered)
+
+    with ListingStore(db_path, readme_path) as store:
+        stable = render_is_stable(store)
+    if not stable:
+        print("  MISMATCH: re-rendering the README changed it", file=sys.stderr)
+    return results, stable
+
+
+def print_comparison(results, baseline_path: str) -> None:
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {(r["rows"], r["stage"]): r["seconds"] for r in json.load(f)["results"]}
+    print(f"\n{'rows':>8} {'stage':<28} {'baseline ms':>12} {'now ms':>10} {'ratio':>7}", file=sys.stderr)
+    for r in results:
+        before = baseline.get((r["rows"], r["stage"]))
+        if before is None:
+            continue
+        ratio = r["seconds"] / before if before else float("inf")
+        flag = "  <-- slower" if ratio > 1.2 else ""
+        print(f"{r['rows']:8,} {r['stage']:<28} {before * 1000:12.1f} {r['seconds'] * 1000:10.1f} {ratio:6.2f}x{flag}",
+              file=sys.stderr)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Time the GitHub board pipeline stages on synthetic READMEs")
+    ap.add_argument("--sizes", default=DEFAULT_SIZES, help="Comma-separated row counts")
+    ap.add_argument("--repeat", type=int, default=3, help="Runs per stage; best time is reported")
+    ap.add_argument("--seed", type=int, default=2026, help="Seed for the synthetic READMEs")
+    ap.add_argument("--out", help="Write JSON results here (default: stdout)")
+    ap.add_argument("--baseline", help="Earlier --out file to compare against")
+    add_profile_argument(ap)
+    args = ap.parse_args()
+
+    # Per-section progress logs would swamp the timings
+    logging.disable(logging.INFO)
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    repeat = max(1, args.repeat)
+
+    results = []
+    stable = True
+    with tempfile.TemporaryDirectory(prefix="bench_pipeline-") as workdir:
+        for rows in sizes:
+            print(f"{rows:,} rows", file=sys.stderr)
+            size_results, size_stable = bench_size(rows, repeat, args.seed, workdir,
+                                                   Profiler(args.profile, "bench_pipeline"))
+            results.extend(size_results)
+            stable = stable and size_stable
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": sizes,
+            "repeat": repeat,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nWrote {args.out}", file=sys.stderr)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    if args.baseline:
+        print_comparison(results, args.baseline)
+    sys.exit(0 if stable else 1)
+
+
+if __name__ == "__main__":
+    main()
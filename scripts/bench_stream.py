@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Compare buffered and streamed README download+parse.
+
+For every GitHub source, times fetch_readme + parse_markdown_table (the
+whole body read into memory, then parsed) against stream_readme_listings
+(parsed line by line as it downloads) and reports wall time, time to the
+first listing, peak traced memory and bytes read. Also checks that both
+modes produce the same listings, and that a README recorded to an HTTP
+cassette streams back the same listings on replay.
+
+By default the READMEs come from mock_server.py (started in a subprocess, so
+its own allocations aren't traced) with --readme-rows rows each; --live
+downloads the real ones.
+
+Usage:
+    python bench_stream.py                          # 20k-row synthetic READMEs
+    python bench_stream.py --readme-rows 100000 --repeat 5
+    python bench_stream.py --live
+"""
+
+import argparse
+import logging
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import requests
+
+import http_cassette
+import simplify_scraper as scraper
+from mock_server import mock_env
+
+README_ROWS = 20000
+
+
+def start_mock(readme_rows: int):
+    """Run mock_server.py in a subprocess; returns (process, base URL) once it answers."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    proc = subprocess.Popen([sys.executable, "mock_server.py", "--port", str(port), "--readme-rows", str(readme_rows)],
+                            cwd=os.path.dirname(os.path.abspath(__file__)),
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    base_url = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            requests.get(f"{base_url}/_stats", timeout=1)
+            return proc, base_url
+        except requests.ConnectionError:
+            time.sleep(0.1)
+    proc.kill()
+    raise SystemExit("mock_server.py did not start")
+
+
+def run_buffered(source):
+    start = time.perf_counter()
+    content = scraper.fetch_readme(source["url"], source["name"])
+    jobs = scraper.parse_markdown_table(content, source["name"]) if content else []
+    first = time.perf_counter() - start  # nothing is available before the whole body is parsed
+    return jobs, first, len(content.encode("utf-8")) if content else 0
+
+
+def run_streamed(source):
+    start = time.perf_counter()
+    first = None
+    nbytes = [0]
+    jobs = []
+    for job in scraper.stream_readme_listings(source, on_bytes=lambda n: nbytes.__setitem__(0, nbytes[0] + n)):
+        if first is None:
+            first = time.perf_counter() - start
+        jobs.append(job)
+    return jobs, first or 0.0, nbytes[0]
+
+
+def check_cassette_replay(source) -> bool:
+    """Record the buffered download to a temporary cassette, then stream it back from the replay."""
+    with tempfile.TemporaryDirectory() as directory:
+        http_cassette.install(directory, "record")
+        try:
+            recorded = run_buffered(source)[0]
+        finally:
+            http_cassette.uninstall()
+        http_cassette.install(directory, "replay")
+        try:
+            replayed = run_streamed(source)[0]
+        finally:
+            http_cassette.uninstall()
+    return sorted(j.astuple() for j in recorded) == sorted(j.astuple() for j in replayed)
+
+
+def measure(run, source, repeat: int):
+    """Best wall time, its time to first listing, peak traced memory, bytes read and the listings."""
+    best = None
+    for _ in range(repeat):
+        tracemalloc.start()
+        start = time.perf_counter()
+        jobs, first, nbytes = run(source)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        if best is None or elapsed < best[0]:
+            best = (elapsed, first, peak, nbytes, [j.astuple() for j in jobs])
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Compare buffered and streamed README download+parse")
+    ap.add_argument("--readme-rows", type=int, default=README_ROWS, help="Rows per synthetic README")
+    ap.add_argument("--repeat", type=int, default=3, help="Runs per mode; the fastest is reported")
+    ap.add_argument("--live", action="store_true", help="Download the real READMEs instead of synthetic ones")
+    args = ap.parse_args()
+
+    # Per-section progress logs would swamp the output
+    logging.disable(logging.WARNING)
+    proc = None
+    sources = scraper.GITHUB_SOURCES
+    if not args.live:
+        proc, base_url = start_mock(args.readme_rows)
+        raw = mock_env(base_url)["GITHUB_RAW"]
+        sources = [{**s, "url": s["url"].replace(scraper.GITHUB_RAW, raw, 1)} for s in sources]
+
+    identical = True
+    try:
+        print(f"{'source':<14} {'mode':<9} {'seconds':>8} {'first row':>10} {'peak MB':>8} {'read KB':>9} {'listings':>9}")
+        for source in sources:
+            results = {mode: measure(run, source, max(1, args.repeat))
+                       for mode, run in (("buffered", run_buffered), ("streamed", run_streamed))}
+            for mode, (elapsed, first, peak, nbytes, jobs) in results.items():
+                print(f"{source['name']:<14} {mode:<9} {elapsed:8.3f} {first:10.3f} {peak / 1e6:8.1f} "
+                      f"{nbytes / 1024:9.0f} {len(jobs):9,d}")
+            # Streaming yields HTML listings in README order rather than section order
+            same = sorted(results["buffered"][4]) == sorted(results["streamed"][4])
+            identical = identical and same
+            if not same:
+                print(f"{source['name']}: MISMATCH between buffered and streamed listings")
+            if not check_cassette_replay(source):
+                identical = False
+                print(f"{source['name']}: MISMATCH between recorded and stream-replayed listings")
+    finally:
+        if proc:
+            proc.terminate()
+    sys.exit(0 if identical else 1)
+
+
+if __name__ == "__main__":
+    main()
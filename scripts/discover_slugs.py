@@ -1,75 +1,208 @@
-import os, re, time, argparse, requests, yaml
+import os, re, time, json, hashlib, argparse, threading, yaml
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from urllib.parse import urlparse
-from datetime import datetime
+from datetime import datetime, timezone
 
-GH_HOST = "boards.greenhouse.io"
+import http_cassette
+import http_client
+from http_client import HTTP
+from listing_store import ListingStore
+from locations import format_location
+from run_report import RunReport, add_profile_argument
 
-def format_location(location: str) -> str:
-    """Format location string with proper separators and truncation."""
-    if not location:
-        return location
-    
-    # Preserve "Remote in USA" and "Remote in Canada" exactly as they are
-    location = location.replace('Remote in USA', '<<<REMOTE_USA>>>')
-    location = location.replace('Remote in Canada', '<<<REMOTE_CANADA>>>')
-    
-    # Add commas between locations that are missing them
-    location = re.sub(r'([A-Z]{2})([A-Z]{2,}[a-z])', r'\1, \2', location)
-    location = re.sub(r'([A-Z]{2})([A-Z]{3,})', r'\1, \2', location)
-    location = re.sub(r'([A-Z]{2})([A-Z][a-z])', r'\1, \2', location)
-    location = re.sub(r'([a-z])([A-Z][a-z])', r'\1, \2', location)
-    location = re.sub(r'(Remote in [A-Z]{2,})([A-Z])', r'\1, \2', location)
-    location = re.sub(r'(Remote in [A-Za-z\s]+?)([A-Z][a-z]+, [A-Z]{2})', r'\1, \2', location)
-    location = re.sub(r'(\d+ locations)([A-Z])', r'\1, \2', location)
-    
-    # Restore preserved patterns
-    location = location.replace('<<<REMOTE_USA>>>', 'Remote in USA')
-    location = location.replace('<<<REMOTE_CANADA>>>', 'Remote in Canada')
-    
-    locations = re.split(r'[,;]', location)
-    locations = [loc.strip() for loc in locations if loc.strip()]
-    
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_locations = []
-    for loc in locations:
-        loc_lower = loc.lower()
-        if loc_lower not in seen:
-            seen.add(loc_lower)
-            unique_locations.append(loc)
-    locations = unique_locations
-    
-    # If too many locations or too long, truncate and add line break
-    if len(locations) > 3 or len(', '.join(locations)) > 50:
-        kept_locations = []
-        total_length = 0
-        
-        for loc in locations[:3]:
-            if total_length + len(loc) > 50 and kept_locations:
-                break
-            kept_locations.append(loc)
-            total_length += len(loc) + 2
-        
-        result = ', '.join(kept_locations)
-        
-        if len(locations) > len(kept_locations):
-            remaining = len(locations) - len(kept_locations)
-            result += f'<br>+{remaining} more'
-        
-        return result
-    
-    return ', '.join(locations)
+http_cassette.install_from_env()
 
 GH_HOST = "boards.greenhouse.io"
 LEVER_HOST = "jobs.lever.co"
-SERPAPI_ENDPOINT = "https://serpapi.com/search.json"
+SERPAPI_ENDPOINT = os.environ.get("SERPAPI_ENDPOINT", "https://serpapi.com/search.json")
+HTTP.skip_429_retries(SERPAPI_ENDPOINT)  # serpapi_search paces and backs off itself
+GH_BOARD_API = os.environ.get("GREENHOUSE_API", "https://boards-api.greenhouse.io/v1/boards") + "/{slug}/jobs"
+LEVER_BOARD_API = os.environ.get("LEVER_API", "https://api.lever.co/v0/postings") + "/{slug}?mode=json"
+
+# Validated slugs are remembered across runs; a valid board rarely disappears,
+# an invalid slug (typo'd link, renamed board) is retried sooner.
+SLUG_CACHE_PATH = os.path.join(os.path.dirname(__file__), "..", ".cache", "slug_validation.json")
+VALID_SLUG_TTL_DAYS = 30
+INVALID_SLUG_TTL_DAYS = 7
+VALIDATE_WORKERS = 8
+# Board API statuses that prove a slug is invalid; any other failure is transient
+BOARD_MISSING_STATUSES = (404, 410)
+
+# SerpAPI throughput: sustained queries per second, how many may go out back
+# to back, and how many are in flight at once
+SERPAPI_QPS = 2.0
+SERPAPI_BURST = 4
+QUERY_WORKERS = 4
+SERPAPI_MAX_RETRIES = 3
+
+# Search results are cached on disk so the daily city x keyword queries don't
+# spend a paid credit each time
+SERPAPI_CACHE_DIR = os.path.join(os.path.dirname(__file__), "..", ".cache", "serpapi")
+SERPAPI_CACHE_TTL_HOURS = 72
+
+# Per-query discovery history used to rank queries by expected new-slug yield
+QUERY_STATS_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "query_stats.json")
+REQUERY_DAYS = 14       # a query whose results were all known is skipped this long
+UNSEEN_QUERY_PRIOR = 1.0  # optimistic yield for never-run queries, so they get explored
+LARGE_PAGE = 100        # num= for queries that may have more results than one small page
+DEFAULT_CITIES = "Boston,Cambridge,Somerville,Quincy,Newton,Brookline,Waltham,Watertown,Burlington,Lexington,Needham"
+DEFAULT_KEYWORDS = "intern internship co-op coop student graduate new grad entry junior software engineer backend infrastructure systems reliability compiler quant data platform analytics data science ml ai frontend front end full stack web mobile devops cloud security qa quality assurance support IT product UX UI design research campus university fall spring summer"
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, at most `burst` banked."""
+
+    def __init__(self, rate, burst):
+        self.rate = max(rate, 1e-6)
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                else:
+                    wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        """Hold every caller for `seconds` (e.g. a Retry-After) and drop banked tokens."""
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.tokens = 0.0
 
-def serpapi_search(q, api_key, num=10):
+def retry_after_seconds(value, default):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return default
+
+class SearchCache:
+    """
+    On-disk SerpAPI responses, one JSON file per normalized query + params.
+
+    The API key is not part of the key. With refresh=True cached responses
+    are ignored but fresh ones are still written.
+    """
+
+    def __init__(self, path=SERPAPI_CACHE_DIR, ttl_hours=SERPAPI_CACHE_TTL_HOURS, refresh=False):
+        self.path = path
+        self.ttl = ttl_hours * 3600
+        self.refresh = refresh
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(params):
+        normalized = {k: (" ".join(str(v).lower().split()) if k == "q" else str(v))
+                      for k, v in params.items() if k != "api_key"}
+        return hashlib.sha1(json.dumps(normalized, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _file(self, params):
+        return os.path.join(self.path, self.key(params) + ".json")
+
+    def get(self, params):
+        data = None
+        if not self.refresh:
+            try:
+                with open(self._file(params), "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+                if time.time() - entry.get("fetched", 0) <= self.ttl:
+                    data = entry.get("response")
+            except (OSError, ValueError, AttributeError):
+                data = None
+        with self.lock:
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return data
+
+    def put(self, params, data):
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            target = self._file(params)
+            tmp_path = f"{target}.{threading.get_ident()}.tmp"
+            entry = {"fetched": int(time.time()), "query": params.get("q"), "response": data}
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, target)
+        except OSError as e:
+            print(f"  ⚠️  Could not cache search results: {e}")
+
+    def summary(self):
+        total = self.hits + self.misses
+        return f"SerpAPI cache: {self.hits} hits, {self.misses} misses" + (
+            f" ({100.0 * self.hits / total:.0f}% hit rate)" if total else "")
+
+def serpapi_search(q, api_key, num=10, limiter=None, max_retries=SERPAPI_MAX_RETRIES, cache=None, report=None):
     params = {"engine": "google", "q": q, "api_key": api_key, "num": num, "hl": "en"}
-    r = requests.get(SERPAPI_ENDPOINT, params=params, timeout=20)
-    r.raise_for_status()
-    return r.json()
+    if cache:
+        data = cache.get(params)
+        if data is not None:
+            return data
+    for attempt in range(max_retries + 1):
+        if limiter:
+            limiter.acquire()
+        r = HTTP.get(SERPAPI_ENDPOINT, params=params, timeout=20)
+        if r.status_code == 429 and attempt < max_retries:
+            delay = retry_after_seconds(r.headers.get("Retry-After"), 2 ** attempt)
+            if limiter:
+                limiter.pause(delay)
+            else:
+                time.sleep(delay)
+            continue
+        r.raise_for_status()
+        if report:
+            report.add_bytes("serpapi", len(r.content))
+        data = r.json()
+        if cache:
+            cache.put(params, data)
+        return data
+
+def run_queries(queries, api_key, qps=SERPAPI_QPS, burst=SERPAPI_BURST, workers=QUERY_WORKERS, num=10, cache=None,
+                report=None):
+    """
+    Run search queries concurrently under a shared token bucket.
+
+    Each query is a string (fetched with `num` results) or a (query, num) pair.
+    Queries answered from `cache` return immediately without taking a token.
+
+    Yields (query, response) as each query completes; a query that fails
+    after its retries is reported and skipped.
+    """
+    limiter = TokenBucket(qps, burst)
+    HTTP.ensure_pool_size(workers)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        plan = [(q, num) if isinstance(q, str) else q for q in queries]
+        futures = {pool.submit(serpapi_search, q, api_key, n, limiter, SERPAPI_MAX_RETRIES, cache, report): q
+                   for q, n in plan}
+        for fut in as_completed(futures):
+            q = futures[fut]
+            try:
+                yield q, fut.result()
+            except Exception as e:
+                print(f"  ⚠️  Search failed for {q!r}: {e}")
 
 def extract_slug(url, host):
     try:
@@ -83,15 +216,104 @@ def extract_slug(url, host):
     except Exception:
         return None
 
-def validate_greenhouse(slug):
-    url = f"https://boards-api.greenhouse.io/v1/boards/{slug}/jobs?content=true"
-    r = requests.get(url, timeout=20)
-    return r.status_code == 200
+def fetch_board(provider, slug, report=None):
+    """
+    Job list for a board, or None if the board doesn't exist.
+
+    This doubles as validation: the list without content=true is the
+    cheapest request that proves the board is live, and the payload is kept
+    so the job fetch doesn't download the same board again. Only a 404/410
+    means the board doesn't exist: network errors and any other status (a
+    429 or 5xx that outlasted the retries) raise, so they aren't cached as
+    an invalid slug. Time and bytes are added to `report`.
+    """
+    url = (GH_BOARD_API if provider == "greenhouse" else LEVER_BOARD_API).format(slug=slug)
+    start = time.perf_counter()
+    r = HTTP.get(url, timeout=20)
+    if report:
+        report.add_company(f"{provider}:{slug}", time.perf_counter() - start)
+        report.add_bytes(provider, len(r.content))
+    if r.status_code in BOARD_MISSING_STATUSES:
+        return None
+    r.raise_for_status()
+    data = r.json()
+    return data.get("jobs", []) if provider == "greenhouse" else data
+
+def load_json(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def save_json(data, path):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"  ⚠️  Could not save {os.path.basename(path)}: {e}")
+
+def load_slug_cache(path=SLUG_CACHE_PATH):
+    """Validation results keyed by "provider:slug" -> {"valid": bool, "checked": epoch seconds}."""
+    return load_json(path)
+
+def save_slug_cache(cache, path=SLUG_CACHE_PATH):
+    save_json(cache, path)
+
+def cached_validity(cache, provider, slug, valid_ttl_days=VALID_SLUG_TTL_DAYS,
+                    invalid_ttl_days=INVALID_SLUG_TTL_DAYS, now=None):
+    """True/False from an unexpired cache entry, None if the slug must be checked."""
+    entry = cache.get(f"{provider}:{slug}")
+    if not isinstance(entry, dict):
+        return None
+    ttl_days = valid_ttl_days if entry.get("valid") else invalid_ttl_days
+    age = (now or time.time()) - entry.get("checked", 0)
+    if age > ttl_days * 86400:
+        return None
+    return bool(entry.get("valid"))
+
+def validate_slugs(candidates, cache, workers=VALIDATE_WORKERS,
+                   valid_ttl_days=VALID_SLUG_TTL_DAYS, invalid_ttl_days=INVALID_SLUG_TTL_DAYS, report=None):
+    """
+    Validate each unique (provider, slug) once, consulting and updating the cache.
+
+    `candidates` may be a lazy iterable; each new slug is submitted for
+    validation as soon as it arrives. Returns (valid (provider, slug) pairs in
+    arrival order, boards) where boards maps the pairs checked over the network
+    this run to their job list.
+    """
+    now = time.time()
+    known = {}
+    futures = {}
+    HTTP.ensure_pool_size(workers)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for c in candidates:
+            if c in known:
+                continue
+            known[c] = cached_validity(cache, *c, valid_ttl_days, invalid_ttl_days, now)
+            if known[c] is None:
+                futures[c] = pool.submit(fetch_board, *c, report)
+
+    boards = {}
+    for c, fut in futures.items():
+        try:
+            jobs = fut.result()
+        except Exception as e:
+            # Transient (network, rate limit, server error): not cached, so it's checked next run
+            print(f"  ⚠️  Could not validate {c[0]} slug {c[1]}: {e}")
+            known[c] = False
+            continue
+        known[c] = jobs is not None
+        cache[f"{c[0]}:{c[1]}"] = {"valid": known[c], "checked": int(now)}
+        if jobs is not None:
+            boards[c] = jobs
 
-def validate_lever(slug):
-    url = f"https://api.lever.co/v0/postings/{slug}?mode=json"
-    r = requests.get(url, timeout=20)
-    return r.status_code == 200
+    print(f"Slug validation: {len(known)} unique slugs, {len(known) - len(futures)} from cache, {len(futures)} checked")
+    return [c for c in known if known[c]], boards
 
 def merge_companies(path, gh_slugs, lever_slugs):
     existing = {"companies": [], "boston_locations": [], "include_remote": False, "out_dir": "./reports"}
@@ -121,22 +343,13 @@ def merge_companies(path, gh_slugs, lever_slugs):
         yaml.safe_dump(existing, f, sort_keys=False)
     return len(new_companies)
 
-def fetch_greenhouse_jobs(slug):
-    """Fetch jobs from Greenhouse API."""
-    url = f"https://boards-api.greenhouse.io/v1/boards/{slug}/jobs?content=true"
-    r = requests.get(url, timeout=10)
-    if r.status_code != 200:
-        return []
-    data = r.json()
-    return data.get("jobs", [])
+def fetch_greenhouse_jobs(slug, report=None):
+    """Fetch jobs from Greenhouse API (descriptions aren't used, so content=true is not requested)."""
+    return fetch_board("greenhouse", slug, report) or []
 
-def fetch_lever_jobs(slug):
+def fetch_lever_jobs(slug, report=None):
     """Fetch jobs from Lever API."""
-    url = f"https://api.lever.co/v0/postings/{slug}?mode=json"
-    r = requests.get(url, timeout=10)
-    if r.status_code != 200:
-        return []
-    return r.json()
+    return fetch_board("lever", slug, report) or []
 
 def normalize_greenhouse_job(job, company_name):
     """Normalize a Greenhouse job to a common format."""
@@ -176,50 +389,20 @@ def normalize_lever_job(job, company_name):
         "url": url
     }
 
-def append_jobs_to_readme(jobs_to_add):
-    """Append new jobs to README.md in the same format as job_report.py."""
-    readme_path = os.path.join(os.path.dirname(__file__), "..", "README.md")
-    
-    # If README.md doesn't exist, create with header and table
-    if not Path(readme_path).exists():
-        with open(readme_path, "w", encoding="utf-8") as f:
-            f.write("# Job Listings\n\n")
-            f.write("| Company Name | Job Title | Location | Date Posted | APPLY |\n")
-            f.write("|---|---|---|---|---|\n")
-    
-    # Read existing README.md and extract existing URLs
-    with open(readme_path, "r", encoding="utf-8") as f:
-        readme_lines = f.readlines()
-    
-    # Extract all existing URLs from the README
-    import re
-    existing_urls = set()
-    for line in readme_lines:
-        # Match URLs in [APPLY](url) format (old markdown style)
-        matches = re.findall(r'\[APPLY\]\((https?://[^\)]+)\)', line)
-        existing_urls.update(matches)
-        # Match URLs in HTML <a href="url"> format (new HTML style)
-        matches = re.findall(r'<a href="(https?://[^"]+)"', line)
-        existing_urls.update(matches)
-    
-    # Prepare table rows (excluding duplicates)
-    table_rows = []
+def record_jobs(store, jobs_to_add):
+    """Upsert normalized jobs into the listing store; returns (added, skipped duplicates)."""
     added_count = 0
     skipped_count = 0
     for job in jobs_to_add:
         url = job.get("url", "")
-        
-        # Skip if URL already exists in README
-        if url and url in existing_urls:
-            skipped_count += 1
-            continue
-        
         company = job.get("company", "")
-        job_title = (job.get("title", "") or "").replace("|", "\\|")
-        location = format_location((job.get("location") or "")).replace("|", "\\|")
-        
+        job_title = job.get("title", "") or ""
+        location = format_location((job.get("location") or ""))
+
         # Format date posted as MM/DD/YYYY
         raw_date = job.get("date_posted") or ""
+        if isinstance(raw_date, (int, float)):  # Lever timestamps are epoch milliseconds
+            raw_date = datetime.fromtimestamp(raw_date / 1000, timezone.utc).date().isoformat()
         date_posted = ""
         if raw_date:
             try:
@@ -227,95 +410,204 @@ def append_jobs_to_readme(jobs_to_add):
                 date_posted = datetime.fromisoformat(raw_date[:10]).strftime("%m/%d/%Y")
             except Exception:
                 date_posted = raw_date
-        
-        # Format apply link
-        apply_link = f'[APPLY]({url})' if url else ""
-        table_rows.append(f"| {company} | {job_title} | {location} | {date_posted} | {apply_link} |")
-        added_count += 1
-
-    if not table_rows:
-        if skipped_count > 0:
-            print(f"All {skipped_count} jobs were already in README.md (no duplicates added)")
-        return
-
-    # Find where the table ends
-    table_start = None
-    for i, line in enumerate(readme_lines):
-        # Match both old and new table separator formats
-        if line.strip().startswith("|---|---|---|---|") and "---" in line:
-            table_start = i
-            break
-    
-    # If table exists, append rows after it
-    if table_start is not None:
-        # Find last row in table
-        last_row = table_start + 1
-        while last_row < len(readme_lines) and readme_lines[last_row].startswith("|"):
-            last_row += 1
-        # Insert new rows after last_row
-        new_lines = readme_lines[:last_row] + [row + "\n" for row in table_rows] + readme_lines[last_row:]
-    else:
-        # No table found, add header and table
-        new_lines = ["# Job Listings\n\n", "| Company Name | Job Title | Location | Date Posted | APPLY |\n", "|---|---|---|---|---|\n"] + [row + "\n" for row in table_rows] + readme_lines
-    
-    # Write back to README.md
-    with open(readme_path, "w", encoding="utf-8") as f:
-        f.writelines(new_lines)
-    
-    print(f"Added {added_count} new jobs to README.md, skipped {skipped_count} duplicates")
 
-def main():
-    ap = argparse.ArgumentParser()
-    ap.add_argument("--cities", default="Boston,Cambridge,Somerville,Quincy,Newton,Brookline,Waltham,Watertown,Burlington,Lexington,Needham")
-    ap.add_argument("--keywords", default="intern internship co-op coop student graduate new grad entry junior software engineer backend infrastructure systems reliability compiler quant data platform analytics data science ml ai frontend front end full stack web mobile devops cloud security qa quality assurance support IT product UX UI design research campus university fall spring summer")
-    ap.add_argument("--max", type=int, default=100)
-    ap.add_argument("--config", default="config/companies.yml")
-    args = ap.parse_args()
+        # Skip (but credit this source) if the URL is already stored
+        if store.upsert(company, job_title, location, date_posted, url, source="discover_slugs"):
+            added_count += 1
+        else:
+            skipped_count += 1
+    return added_count, skipped_count
 
-    api_key = os.environ.get("SERPAPI_KEY")
-    if not api_key:
-        raise SystemExit("Set SERPAPI_KEY in your environment")
+def append_jobs_to_readme(jobs_to_add):
+    """Record new jobs in the listing store and re-render README.md; returns how many were new."""
+    with ListingStore() as store:
+        added_count, skipped_count = record_jobs(store, jobs_to_add)
+        if not added_count:
+            if skipped_count > 0:
+                print(f"All {skipped_count} jobs were already in README.md (no duplicates added)")
+            return 0
+        store.render_readme()
 
-    cities = [c.strip() for c in args.cities.split(",") if c.strip()]
-    keywords = [k.strip() for k in args.keywords.split() if k.strip()]
+    print(f"Added {added_count} new jobs to README.md, skipped {skipped_count} duplicates")
+    return added_count
+
+def build_queries(cities, keywords, max_queries=None, max_keywords=10):
+    """
+    Site-restricted search queries for every city/keyword pair.
 
-    gh_slugs_found, lever_slugs_found = set(), set()
+    Queries are interleaved keyword by keyword across cities so that cutting
+    the list short doesn't spend the whole budget on the first city.
+    """
     queries = []
-    for city in cities:
-        for kw in keywords[:10]:
+    for kw in keywords[:max_keywords]:
+        for city in cities:
             queries.append(f'site:{GH_HOST} "{city}" {kw}')
             queries.append(f'site:{LEVER_HOST} "{city}" {kw}')
-    queries = list(dict.fromkeys(queries))[:args.max]
+    return list(dict.fromkeys(queries))[:max_queries]
+
+_QUERY_RE = re.compile(r'site:(\S+) "([^"]*)" (.*)')
+
+def query_parts(q):
+    """(host, city, keyword) of a build_queries query, or (None, None, None)."""
+    m = _QUERY_RE.match(q)
+    return m.groups() if m else (None, None, None)
+
+def load_query_stats(path=QUERY_STATS_PATH):
+    """History keyed by query: runs, new_total, last_run, last_new, last_unknown, last_results, last_hits, last_num."""
+    return load_json(path)
+
+def save_query_stats(stats, path=QUERY_STATS_PATH):
+    save_json(stats, path)
+
+def expected_yield(q, stats, priors):
+    """New valid slugs per credit: the query's history smoothed toward its keyword/city average."""
+    _, city, kw = query_parts(q)
+    prior = priors.get(("kw", kw), priors.get(("city", city), UNSEEN_QUERY_PRIOR))
+    entry = stats.get(q) or {}
+    return (entry.get("new_total", 0) + prior) / (entry.get("runs", 0) + 1)
+
+def yield_priors(stats):
+    """Average new slugs per run for each keyword and city that has history."""
+    totals = {}
+    for q, entry in stats.items():
+        _, city, kw = query_parts(q)
+        for key in (("kw", kw), ("city", city)):
+            new, runs = totals.get(key, (0, 0))
+            totals[key] = (new + entry.get("new_total", 0), runs + entry.get("runs", 0))
+    return {key: new / runs for key, (new, runs) in totals.items() if runs}
+
+def plan_queries(queries, stats, known, max_queries, requery_days=REQUERY_DAYS, now=None):
+    """
+    Choose which queries to spend credits on, best expected yield first.
+
+    Skips queries whose results last time are now all known slugs (until
+    requery_days have passed), ranks the rest by expected_yield, and asks for
+    LARGE_PAGE results when the query is new or filled its page last time.
+    Returns ([(query, num)], number skipped).
+    """
+    now = now or time.time()
+    known_keys = {f"{provider}:{slug}" for provider, slug in known}
+    priors = yield_priors(stats)
+    ranked = []
+    skipped = 0
+    for idx, q in enumerate(queries):
+        entry = stats.get(q)
+        if (entry and now - entry.get("last_run", 0) < requery_days * 86400
+                and known_keys.issuperset(entry.get("last_slugs", ["?"]))):
+            skipped += 1
+            continue
+        # Older histories have no last_hits; their last_results undercounts, so it only errs toward 10
+        full_page = entry is None or entry.get("last_hits", entry.get("last_results", 0)) >= entry.get("last_num", 10)
+        ranked.append((-expected_yield(q, stats, priors), idx, q, LARGE_PAGE if full_page else 10))
+    ranked.sort()
+    return [(q, num) for _, _, q, num in ranked[:max_queries]], skipped
+
+def record_query_yield(stats, query_slugs, plan, valid, known_before, query_hits=None, now=None):
+    """
+    Update each query's history with the slugs it returned and how many were new and valid.
+
+    query_hits maps a query to its number of organic results, which is what
+    plan_queries compares against the page size it asked for.
+    """
+    now = now or time.time()
+    valid = set(valid)
+    nums = dict(plan)
+    query_hits = query_hits or {}
+    for q, slugs in query_slugs.items():
+        unknown = slugs - known_before
+        new = unknown & valid
+        entry = stats.setdefault(q, {"runs": 0, "new_total": 0})
+        entry.update({
+            "runs": entry.get("runs", 0) + 1,
+            "new_total": entry.get("new_total", 0) + len(new),
+            "last_run": int(now),
+            "last_new": len(new),
+            "last_unknown": len(unknown),
+            "last_results": len(slugs),
+            "last_hits": query_hits.get(q, len(slugs)),
+            "last_num": nums.get(q, 10),
+            "last_slugs": sorted(f"{provider}:{slug}" for provider, slug in slugs),
+        })
+
+def known_slugs(config_path, slug_cache):
+    """(provider, slug) pairs already in the config or checked (either way) in the slug cache."""
+    known = set()
+    if Path(config_path).exists():
+        with open(config_path, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
+        known.update((c.get("provider"), c.get("slug")) for c in data.get("companies", []))
+    known.update(tuple(key.split(":", 1)) for key in slug_cache)
+    return known
 
-    for q in queries:
-        data = serpapi_search(q, api_key, num=10)
-        for res in data.get("organic_results", []):
+def extract_candidates(results, query_slugs=None, query_hits=None):
+    """
+    (provider, slug) for every board link in a stream of (query, response) pairs.
+
+    If query_slugs is given, it also records the set of slugs each query
+    returned; if query_hits is given, the number of organic results.
+    """
+    for q, data in results:
+        seen = query_slugs.setdefault(q, set()) if query_slugs is not None else set()
+        organic = data.get("organic_results", [])
+        if query_hits is not None:
+            query_hits[q] = len(organic)
+        for res in organic:
             link = res.get("link")
             if not link:
                 continue
             slug = extract_slug(link, GH_HOST)
-            if slug and validate_greenhouse(slug):
-                gh_slugs_found.add(slug)
+            if slug:
+                seen.add(("greenhouse", slug))
+                yield "greenhouse", slug
                 continue
             slug = extract_slug(link, LEVER_HOST)
-            if slug and validate_lever(slug):
-                lever_slugs_found.add(slug)
-                continue
-        time.sleep(0.8)
+            if slug:
+                seen.add(("lever", slug))
+                yield "lever", slug
 
-    total = merge_companies(args.config, gh_slugs_found, lever_slugs_found)
-    print("Greenhouse slugs:", sorted(gh_slugs_found))
-    print("Lever slugs:", sorted(lever_slugs_found))
-    print(f"Updated {args.config} with {total} total companies.")
-    
-    # Fetch jobs from newly discovered companies and append to README
-    print("\nFetching jobs from newly discovered companies...")
+def discover_companies(queries, api_key, slug_cache=None, workers=VALIDATE_WORKERS,
+                       valid_ttl_days=VALID_SLUG_TTL_DAYS, invalid_ttl_days=INVALID_SLUG_TTL_DAYS,
+                       qps=SERPAPI_QPS, burst=SERPAPI_BURST, query_workers=QUERY_WORKERS, search_cache=None,
+                       query_stats=None, known=None, report=None):
+    """
+    Run the search queries and validate the slugs they turn up.
+
+    `queries` are query strings or (query, num) pairs from plan_queries.
+    Queries run concurrently under the token bucket and their results stream
+    straight into slug extraction and validation, so boards are checked while
+    later queries are still in flight. When query_stats is given, each
+    query's yield (relative to the `known` slugs) is recorded in it.
+
+    Returns (greenhouse slugs, lever slugs, boards) where boards holds the job
+    lists downloaded during validation, for collect_jobs to reuse.
+    """
+    slug_cache = slug_cache if slug_cache is not None else {}
+    plan = [(q, 10) if isinstance(q, str) else tuple(q) for q in queries]
+    query_slugs = {}
+    query_hits = {}
+    results = run_queries(plan, api_key, qps, burst, query_workers, cache=search_cache, report=report)
+    valid, boards = validate_slugs(extract_candidates(results, query_slugs, query_hits), slug_cache,
+                                   workers, valid_ttl_days, invalid_ttl_days, report)
+    if query_stats is not None:
+        record_query_yield(query_stats, query_slugs, plan, valid, known or set(), query_hits)
+    gh_slugs_found = {slug for provider, slug in valid if provider == "greenhouse"}
+    lever_slugs_found = {slug for provider, slug in valid if provider == "lever"}
+    return gh_slugs_found, lever_slugs_found, boards
+
+def collect_jobs(gh_slugs_found, lever_slugs_found, boards=None, report=None):
+    """Fetch and normalize every job posted by the discovered companies.
+
+    Boards already downloaded during validation are taken from `boards`.
+    """
+    boards = boards or {}
     all_jobs = []
     
     for slug in sorted(gh_slugs_found):
         try:
-            print(f"  Fetching Greenhouse jobs from {slug}...")
-            jobs = fetch_greenhouse_jobs(slug)
+            jobs = boards.get(("greenhouse", slug))
+            if jobs is None:
+                print(f"  Fetching Greenhouse jobs from {slug}...")
+                jobs = fetch_greenhouse_jobs(slug, report)
             for job in jobs:
                 normalized = normalize_greenhouse_job(job, slug.capitalize())
                 all_jobs.append(normalized)
@@ -324,18 +616,99 @@ def main():
     
     for slug in sorted(lever_slugs_found):
         try:
-            print(f"  Fetching Lever jobs from {slug}...")
-            jobs = fetch_lever_jobs(slug)
+            jobs = boards.get(("lever", slug))
+            if jobs is None:
+                print(f"  Fetching Lever jobs from {slug}...")
+                jobs = fetch_lever_jobs(slug, report)
             for job in jobs:
                 normalized = normalize_lever_job(job, slug.capitalize())
                 all_jobs.append(normalized)
         except Exception as e:
             print(f"  ⚠️  Failed to fetch jobs from {slug}: {e}")
+    return all_jobs
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--cities", default=DEFAULT_CITIES)
+    ap.add_argument("--keywords", default=DEFAULT_KEYWORDS)
+    ap.add_argument("--max", type=int, default=100)
+    ap.add_argument("--config", default="config/companies.yml")
+    ap.add_argument("--qps", type=float, default=SERPAPI_QPS,
+                    help="Sustained SerpAPI queries per second (token bucket rate)")
+    ap.add_argument("--burst", type=int, default=SERPAPI_BURST,
+                    help="SerpAPI queries that may be sent back to back (token bucket size)")
+    ap.add_argument("--query-workers", type=int, default=QUERY_WORKERS,
+                    help="SerpAPI queries in flight at once")
+    ap.add_argument("--serp-ttl-hours", type=float, default=SERPAPI_CACHE_TTL_HOURS,
+                    help="Hours a cached SerpAPI response is reused")
+    ap.add_argument("--refresh", action="store_true",
+                    help="Ignore cached SerpAPI responses (fresh ones are still cached)")
+    ap.add_argument("--validate-workers", type=int, default=VALIDATE_WORKERS,
+                    help="Slugs validated concurrently")
+    ap.add_argument("--valid-ttl-days", type=float, default=VALID_SLUG_TTL_DAYS,
+                    help="Days a valid slug is trusted without re-checking")
+    ap.add_argument("--invalid-ttl-days", type=float, default=INVALID_SLUG_TTL_DAYS,
+                    help="Days an invalid slug is skipped before re-checking")
+    ap.add_argument("--requery-days", type=float, default=REQUERY_DAYS,
+                    help="Days before re-running a query whose last results were all known slugs")
+    add_profile_argument(ap)
+    args = ap.parse_args()
+
+    api_key = os.environ.get("SERPAPI_KEY")
+    if not api_key:
+        raise SystemExit("Set SERPAPI_KEY in your environment")
+
+    cities = [c.strip() for c in args.cities.split(",") if c.strip()]
+    keywords = [k.strip() for k in args.keywords.split() if k.strip()]
+
+    report = RunReport("discover_slugs", profile_dir=args.profile)
+    try:
+        discover(args, api_key, cities, keywords, report)
+    finally:
+        http_client.record_connections(report)
+        report.save()
+
+def discover(args, api_key, cities, keywords, report):
+    """Plan and run the searches, validate the slugs, update the config and record their jobs."""
+    # A cassette run must make the same requests when replayed, so it neither
+    # reads nor updates the caches and config that decide what gets requested
+    persist = http_cassette.install_from_env() is None
+    query_stats = load_query_stats() if persist else {}
+    slug_cache = load_slug_cache() if persist else {}
+    known = known_slugs(args.config, slug_cache)
+    queries = build_queries(cities, keywords)
+    with report.stage("plan queries", rows_in=len(queries)) as stage:
+        plan, skipped = plan_queries(queries, query_stats, known, args.max, args.requery_days)
+        stage.rows_out = len(plan)
+    print(f"Query plan: {len(plan)} queries ({sum(1 for _, num in plan if num == LARGE_PAGE)} at num={LARGE_PAGE}), "
+          f"{skipped} skipped as fully known")
+    search_cache = SearchCache(ttl_hours=args.serp_ttl_hours, refresh=args.refresh) if persist else None
+    with report.stage("search and validate", rows_in=len(plan)) as stage:
+        gh_slugs_found, lever_slugs_found, boards = discover_companies(
+            plan, api_key, slug_cache, args.validate_workers, args.valid_ttl_days, args.invalid_ttl_days,
+            args.qps, args.burst, args.query_workers, search_cache, query_stats, known, report)
+        stage.rows_out = len(gh_slugs_found) + len(lever_slugs_found)
+    print("Greenhouse slugs:", sorted(gh_slugs_found))
+    print("Lever slugs:", sorted(lever_slugs_found))
+    if persist:
+        save_slug_cache(slug_cache)
+        save_query_stats(query_stats)
+        total = merge_companies(args.config, gh_slugs_found, lever_slugs_found)
+        print(f"Updated {args.config} with {total} total companies.")
+    
+    # Fetch jobs from newly discovered companies and append to README
+    print("\nFetching jobs from newly discovered companies...")
+    with report.stage("fetch jobs", rows_in=len(gh_slugs_found) + len(lever_slugs_found)) as stage:
+        all_jobs = collect_jobs(gh_slugs_found, lever_slugs_found, boards, report)
+        stage.rows_out = len(all_jobs)
     
     if all_jobs:
-        append_jobs_to_readme(all_jobs)
+        with report.stage("append to README", rows_in=len(all_jobs)) as stage:
+            stage.rows_out = append_jobs_to_readme(all_jobs)
     else:
         print("No jobs found from newly discovered companies.")
+    if search_cache is not None:
+        print(search_cache.summary())
 
 if __name__ == "__main__":
     main()
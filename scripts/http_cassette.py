@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Record/replay HTTP "cassettes" for deterministic offline runs.
+
+In record mode every HTTP response the scrapers receive (README downloads,
+Greenhouse/Lever boards, Adzuna pages, SerpAPI searches) is saved with its
+status and headers as one gzip-compressed JSON file per request. In replay
+mode the same requests are answered from those files without touching the
+network, optionally with simulated latency, so the pipeline can be
+benchmarked on identical input on an air-gapped machine. A request with no
+recording fails like a connection error.
+
+Requests are keyed by method and URL with credentials (app_id, app_key,
+api_key) removed, so cassettes hold no secrets and replay works with any key.
+The hook sits in requests' HTTPAdapter.send, which covers bare requests.get
+calls and sessions alike.
+
+Enable it with environment variables (honoured by every scraper) or with
+pipeline.py --record/--replay:
+
+    HTTP_CASSETTE=cassettes/2026-10-17 HTTP_CASSETTE_MODE=record python pipeline.py
+    HTTP_CASSETTE=cassettes/2026-10-17 HTTP_CASSETTE_MODE=replay \\
+        HTTP_CASSETTE_LATENCY=recorded python pipeline.py
+
+Usage:
+    python http_cassette.py cassettes/2026-10-17      # list what a cassette holds
+"""
+
+import argparse
+import atexit
+import base64
+import gzip
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from datetime import timedelta
+from typing import Dict, Optional, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+MODES = ("record", "replay")
+# Scratch listing store and README written by a replay (see listing_store.default_paths)
+REPLAY_OUTPUT = "replay-output"
+SECRET_PARAMS = {"app_id", "app_key", "api_key"}
+# The body is stored decoded, so these no longer describe it
+DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "set-cookie"}
+
+_original_send = HTTPAdapter.send
+_active: Optional["Cassette"] = None
+_summary_registered = False
+
+
+def redact_url(url: str) -> str:
+    """URL with credential parameters removed and the remaining query sorted."""
+    parts = urlsplit(url)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in SECRET_PARAMS)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ""))
+
+
+class Cassette:
+    """
+    One cassette directory in record or replay mode.
+
+    latency is added before every replayed response: a number of seconds, or
+    "recorded" to wait as long as the original request took.
+    """
+
+    def __init__(self, directory: str, mode: str, latency: Union[float, str] = 0.0):
+        if mode not in MODES:
+            raise ValueError(f"cassette mode must be one of {MODES}, not {mode!r}")
+        self.directory = directory
+        self.mode = mode
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.counts: Dict[str, int] = {"recorded": 0, "replayed": 0, "missing": 0}
+
+    def path(self, method: str, url: str) -> str:
+        redacted = redact_url(url)
+        digest = hashlib.sha1(f"{method} {redacted}".encode("utf-8")).hexdigest()
+        host = urlsplit(redacted).netloc.replace(":", "_") or "local"
+        return os.path.join(self.directory, host, digest + ".json.gz")
+
+    def _count(self, key: str) -> None:
+        with self.lock:
+            self.counts[key] += 1
+
+    def record(self, request: requests.PreparedRequest, response: requests.Response, elapsed: float) -> None:
+        entry = {
+            "method": request.method,
+            "url": redact_url(request.url),
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {k: v for k, v in response.headers.items() if k.lower() not in DROPPED_HEADERS},
+            "elapsed": round(elapsed, 4),
+            "body": base64.b64encode(response.content).decode("ascii"),
+        }
+        path = self.path(request.method, request.url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+        self._count("recorded")
+
+    def replay(self, request: requests.PreparedRequest) -> requests.Response:
+        path = self.path(request.method, request.url)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            self._count("missing")
+            raise requests.ConnectionError(f"no cassette recording for {request.method} {redact_url(request.url)}",
+                                           request=request)
+        delay = entry.get("elapsed", 0.0) if self.latency == "recorded" else float(self.latency or 0)
+        if delay:
+            time.sleep(delay)
+
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.reason = entry.get("reason", "")
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        # A real body stream, so stream=True callers can iter_content and close() it
+        response.raw = io.BytesIO(base64.b64decode(entry["body"]))
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.elapsed = timedelta(seconds=entry.get("elapsed", 0.0))
+        self._count("replayed")
+        return response
+
+    def summary(self) -> str:
+        c = self.counts
+        if self.mode == "record":
+            return f"HTTP cassette {self.directory}: {c['recorded']} responses recorded"
+        return f"HTTP cassette {self.directory}: {c['replayed']} responses replayed, {c['missing']} missing"
+
+
+def _cassette_send(adapter: HTTPAdapter, request: requests.PreparedRequest, *args, **kwargs) -> requests.Response:
+    cassette = _active
+    if cassette is None:
+        return _original_send(adapter, request, *args, **kwargs)
+    if cassette.mode == "replay":
+        return cassette.replay(request)
+    # Session.send only sets response.elapsed after the adapter returns, so time it here
+    start = time.perf_counter()
+    response = _original_send(adapter, request, *args, **kwargs)
+    cassette.record(request, response, time.perf_counter() - start)
+    return response
+
+
+def install(directory: str, mode: str, latency: Union[float, str] = 0.0) -> Cassette:
+    """Route every requests HTTP call in this process through a cassette; prints a summary at exit."""
+    global _active, _summary_registered
+    cassette = Cassette(directory, mode, latency)
+    if not _summary_registered:
+        atexit.register(lambda: _active and print(_active.summary()))
+        _summary_registered = True
+    _active = cassette
+    HTTPAdapter.send = _cassette_send
+    print(f"📼 HTTP cassette: {mode} {directory}")
+    return cassette
+
+
+def active() -> Optional[Cassette]:
+    """The installed cassette, if any."""
+    return _active
+
+
+def uninstall() -> None:
+    global _active
+    _active = None
+    HTTPAdapter.send = _original_send
+
+
+def install_from_env() -> Optional[Cassette]:
+    """Install from HTTP_CASSETTE / HTTP_CASSETTE_MODE / HTTP_CASSETTE_LATENCY, once per process."""
+    directory = os.environ.get("HTTP_CASSETTE")
+    if not directory or _active is not None:
+        return _active
+    latency = os.environ.get("HTTP_CASSETTE_LATENCY", "0")
+    return install(directory, os.environ.get("HTTP_CASSETTE_MODE", "replay"),
+                   latency if latency == "recorded" else float(latency))
+
+
+def main():
+    ap = argparse.ArgumentParser(description="List the responses stored in a cassette")
+    ap.add_argument("directory")
+    args = ap.parse_args()
+
+    total = 0
+    for host in sorted(os.listdir(args.directory)):
+        if host == REPLAY_OUTPUT:
+            continue
+        entries = [name for name in os.listdir(os.path.join(args.directory, host)) if name.endswith(".json.gz")]
+        size = sum(os.path.getsize(os.path.join(args.directory, host, name)) for name in entries)
+        total += len(entries)
+        print(f"{host:<40} {len(entries):6d} responses {size / 1024:10.1f} KB")
+    print(f"{'total':<40} {total:6d} responses")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP client for every scraper.
+
+All fetchers go through HTTP, one requests.Session whose adapters keep a
+pool of keep-alive connections per host (pool_maxsize connections each, for
+up to POOL_HOSTS hosts), so repeated requests to the same API reuse their
+TCP/TLS connection instead of handshaking again. Responses are requested
+compressed (gzip/deflate, plus br when the brotli package is installed), and
+429/5xx responses are retried with exponential backoff (jittered on urllib3
+2.x) that honours Retry-After. SerpAPI gets an adapter without 429 retries because
+discover_slugs paces and backs off those searches itself.
+
+HTTP.connection_stats() reports, per host, how many requests were sent over
+how many new connections; the scripts print it (reuse_summary) and store it
+in their run report.
+
+Usage:
+    from http_client import HTTP
+    r = HTTP.get(url, timeout=20)
+"""
+
+import inspect
+from typing import Dict, Iterable, List
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPConnectionPool
+from urllib3.util import Retry, make_headers
+
+POOL_SIZE = 32        # connections kept per host; at least the largest worker count
+POOL_HOSTS = 16       # hosts whose pools are kept open at once
+RETRIES = 2
+BACKOFF = 0.3         # seconds, doubled per retry
+BACKOFF_JITTER = 0.3  # up to this many seconds added at random, so workers don't retry in lockstep
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+USER_AGENT = "job-reporter/1.1"
+
+# Retry(backoff_jitter=...) is urllib3 >= 2.0; on 1.26 retries back off without jitter
+RETRY_HAS_JITTER = "backoff_jitter" in inspect.signature(Retry.__init__).parameters
+
+
+def make_adapter(pool_size: int = POOL_SIZE, statuses: Iterable[int] = RETRY_STATUSES) -> HTTPAdapter:
+    jitter = {"backoff_jitter": BACKOFF_JITTER} if RETRY_HAS_JITTER else {}
+    retries = Retry(
+        total=RETRIES,
+        backoff_factor=BACKOFF,
+        status_forcelist=list(statuses),
+        allowed_methods=["GET"],
+        # Hand the last response back instead of raising, so callers see its status
+        raise_on_status=False,
+        **jitter,
+    )
+    return HTTPAdapter(pool_connections=POOL_HOSTS, pool_maxsize=pool_size, max_retries=retries)
+
+
+def _adapter_pools(adapter: HTTPAdapter) -> List[HTTPConnectionPool]:
+    pools = adapter.poolmanager.pools
+    return [pool for pool in (pools.get(key) for key in pools.keys()) if pool is not None]
+
+
+def _add_stats(total: Dict[str, Dict[str, int]], pools: Iterable[HTTPConnectionPool]) -> None:
+    for pool in pools:
+        host = total.setdefault(pool.host, {"requests": 0, "connections": 0})
+        host["requests"] += pool.num_requests
+        host["connections"] += pool.num_connections
+
+
+class PooledSession(requests.Session):
+    """A Session with pooled, retrying adapters that can be resized without losing its counters."""
+
+    def __init__(self, pool_size: int = POOL_SIZE):
+        super().__init__()
+        self.pool_size = pool_size
+        self.no_429_retry: List[str] = []
+        self.retired_pools: List[HTTPConnectionPool] = []  # closed by ensure_pool_size; still counted
+        self.headers.update({
+            "User-Agent": USER_AGENT,
+            "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"],
+        })
+        self._mount_adapters()
+
+    def _mount_adapters(self) -> None:
+        for prefix in ("http://", "https://"):
+            self.mount(prefix, make_adapter(self.pool_size))
+        for prefix in self.no_429_retry:
+            self.mount(prefix, make_adapter(self.pool_size, [s for s in RETRY_STATUSES if s != 429]))
+
+    def skip_429_retries(self, prefix: str) -> None:
+        """Don't retry 429s for URLs under prefix; for callers that pace and back off themselves."""
+        if prefix not in self.no_429_retry:
+            self.no_429_retry.append(prefix)
+            self.mount(prefix, make_adapter(self.pool_size, [s for s in RETRY_STATUSES if s != 429]))
+
+    def ensure_pool_size(self, workers: int) -> None:
+        """
+        Grow the per-host pools to at least `workers` connections. Call before
+        fanning out: a pool smaller than the number of threads using it
+        discards the extra connections after each request instead of keeping
+        them alive.
+        """
+        if workers <= self.pool_size:
+            return
+        retired = set(self.adapters.values())
+        self.pool_size = workers
+        self._mount_adapters()
+        # Closing drops the idle connections now; a request still running on
+        # a closed pool finishes, and urllib3 closes its connection instead of
+        # returning it. The pools are kept only for their counters.
+        for adapter in retired:
+            pools = _adapter_pools(adapter)
+            adapter.close()
+            # urllib3 2.x's PoolManager.clear() leaves closing the pools to GC,
+            # which keeping them for their counters would prevent
+            for pool in pools:
+                pool.close()
+            self.retired_pools.extend(pools)
+
+    def connection_stats(self) -> Dict[str, Dict[str, int]]:
+        """Requests sent and new connections opened per host since the session was created."""
+        stats: Dict[str, Dict[str, int]] = {}
+        for adapter in set(self.adapters.values()):
+            _add_stats(stats, _adapter_pools(adapter))
+        _add_stats(stats, self.retired_pools)
+        return dict(sorted(stats.items()))
+
+
+HTTP = PooledSession()
+
+
+def record_connections(report) -> None:
+    """Store HTTP's per-host connection counts in a RunReport and print the reuse summary."""
+    report.connections = HTTP.connection_stats()
+    summary = reuse_summary(report.connections)
+    if summary:
+        print(summary)
+
+
+def reuse_summary(stats: Dict[str, Dict[str, int]]) -> str:
+    """One line per host: requests, connections opened and the share of requests that reused one."""
+    lines = []
+    for host, s in stats.items():
+        if not s["requests"]:
+            continue
+        reused = 1 - s["connections"] / s["requests"]
+        lines.append(f"  {host}: {s['requests']} requests over {s['connections']} connections ({reused:.0%} reused)")
+    return "HTTP connections:\n" + "\n".join(lines) if lines else ""
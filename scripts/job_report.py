@@ -2,13 +2,18 @@ import argparse
 import datetime as dt
 import logging
 import os
-import re
-import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-import requests
-from requests.adapters import HTTPAdapter, Retry
+import http_cassette
+import http_client
+from http_client import HTTP
+from listing_store import ListingStore
+from run_report import RunReport, add_profile_argument
+from locations import format_location, matches_boston_area
 
 # ---------- Logging ----------
 logging.basicConfig(
@@ -16,84 +21,7 @@ logging.basicConfig(
     format="%(levelname)s: %(message)s"
 )
 
-# ---------- Location Formatting ----------
-def format_location(location: str) -> str:
-    """Format location string with proper separators and truncation."""
-    if not location:
-        return location
-    
-    # Preserve "Remote in USA" and "Remote in Canada" exactly as they are
-    location = location.replace('Remote in USA', '<<<REMOTE_USA>>>')
-    location = location.replace('Remote in Canada', '<<<REMOTE_CANADA>>>')
-    
-    # Handle concatenated state/location names without spaces
-    # e.g., "NHMississippiTennessee" -> "NH, Mississippi, Tennessee"
-    # Split on patterns where a lowercase letter is followed by an uppercase letter or full state name
-    location = re.sub(r'([a-z])([A-Z][a-z]{3,})', r'\1, \2', location)  # lowercase followed by capitalized word
-    location = re.sub(r'([A-Z]{2})([A-Z][a-z]{3,})', r'\1, \2', location)  # 2-letter state code followed by full name
-    
-    # Add commas between locations that are missing them
-    location = re.sub(r'([A-Z]{2})([A-Z]{2,}[a-z])', r'\1, \2', location)
-    location = re.sub(r'([A-Z]{2})([A-Z]{3,})', r'\1, \2', location)
-    location = re.sub(r'([A-Z]{2})([A-Z][a-z])', r'\1, \2', location)
-    location = re.sub(r'([a-z])([A-Z][a-z])', r'\1, \2', location)
-    location = re.sub(r'(Remote in [A-Z]{2,})([A-Z])', r'\1, \2', location)
-    location = re.sub(r'(Remote in [A-Za-z\s]+?)([A-Z][a-z]+, [A-Z]{2})', r'\1, \2', location)
-    location = re.sub(r'(\d+ locations)([A-Z])', r'\1, \2', location)
-    
-    # Restore preserved patterns
-    location = location.replace('<<<REMOTE_USA>>>', 'Remote in USA')
-    location = location.replace('<<<REMOTE_CANADA>>>', 'Remote in Canada')
-    
-    locations = re.split(r'[,;]', location)
-    locations = [loc.strip() for loc in locations if loc.strip()]
-    
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_locations = []
-    for loc in locations:
-        loc_lower = loc.lower()
-        if loc_lower not in seen:
-            seen.add(loc_lower)
-            unique_locations.append(loc)
-    locations = unique_locations
-    
-    # If too many locations or too long, truncate and add line break
-    if len(locations) > 3 or len(', '.join(locations)) > 50:
-        kept_locations = []
-        total_length = 0
-        
-        for loc in locations[:3]:
-            if total_length + len(loc) > 50 and kept_locations:
-                break
-            kept_locations.append(loc)
-            total_length += len(loc) + 2
-        
-        result = ', '.join(kept_locations)
-        
-        if len(locations) > len(kept_locations):
-            remaining = len(locations) - len(kept_locations)
-            result += f'<br>+{remaining} more'
-        
-        return result
-    
-    return ', '.join(locations)
-
-# ---------- HTTP with retries ----------
-def session_with_retries(total=2, backoff=0.3) -> requests.Session:
-    s = requests.Session()
-    retries = Retry(
-        total=total,
-        backoff_factor=backoff,
-        status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["GET"]
-    )
-    s.mount("http://", HTTPAdapter(max_retries=retries))
-    s.mount("https://", HTTPAdapter(max_retries=retries))
-    s.headers.update({"User-Agent": "job-reporter/1.1"})
-    return s
-
-HTTP = session_with_retries()
+http_cassette.install_from_env()
 
 # ---------- Models ----------
 @dataclass
@@ -154,20 +82,180 @@ def load_config(path: str, include_remote_flag: bool, out_dir_cli: Optional[str]
     return Config(companies=companies, boston_locations=boston_locations, include_remote=include_remote, out_dir=out_dir)
 
 # ---------- Providers ----------
-def fetch_greenhouse(company_slug: str) -> List[Dict[str, Any]]:
-    url = f"https://boards-api.greenhouse.io/v1/boards/{company_slug}/jobs?content=true"
+# Base URLs can be pointed elsewhere, e.g. at mock_server.py for load tests
+GREENHOUSE_API = os.environ.get("GREENHOUSE_API", "https://boards-api.greenhouse.io/v1/boards")
+LEVER_API = os.environ.get("LEVER_API", "https://api.lever.co/v0/postings")
+
+def fetch_greenhouse(company_slug: str, content: bool = False) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Job list for a board plus the response size in bytes.
+
+    Without content=true the list omits every posting's HTML description, which
+    is most of the payload on large boards; use fetch_greenhouse_description
+    for the few postings that need one.
+    """
+    url = f"{GREENHOUSE_API}/{company_slug}/jobs" + ("?content=true" if content else "")
     r = HTTP.get(url, timeout=10)
     if r.status_code != 200:
         raise RuntimeError(f"Greenhouse {company_slug} HTTP {r.status_code}: {r.text[:300]}")
     data = r.json()
-    return data.get("jobs", [])
+    return data.get("jobs", []), len(r.content)
+
+def fetch_greenhouse_description(company_slug: str, job_id: Any) -> Tuple[str, int]:
+    """Description HTML of one posting plus the response size in bytes."""
+    url = f"{GREENHOUSE_API}/{company_slug}/jobs/{job_id}"
+    r = HTTP.get(url, timeout=10)
+    if r.status_code != 200:
+        raise RuntimeError(f"Greenhouse {company_slug} job {job_id} HTTP {r.status_code}: {r.text[:300]}")
+    return r.json().get("content") or "", len(r.content)
 
-def fetch_lever(company_slug: str) -> List[Dict[str, Any]]:
-    url = f"https://api.lever.co/v0/postings/{company_slug}?mode=json"
+def fetch_lever(company_slug: str) -> Tuple[List[Dict[str, Any]], int]:
+    """Postings for a Lever company plus the response size in bytes."""
+    url = f"{LEVER_API}/{company_slug}?mode=json"
     r = HTTP.get(url, timeout=10)
     if r.status_code != 200:
         raise RuntimeError(f"Lever {company_slug} HTTP {r.status_code}: {r.text[:300]}")
-    return r.json()
+    return r.json(), len(r.content)
+
+# ---------- Concurrent fetching ----------
+DEFAULT_WORKERS = 16
+DEFAULT_HOST_CONCURRENCY = {
+    "greenhouse": 8,  # boards-api.greenhouse.io
+    "lever": 4,       # api.lever.co
+}
+
+def make_host_limits(greenhouse: int, lever: int) -> Dict[str, threading.BoundedSemaphore]:
+    """Build one semaphore per provider host to cap in-flight requests."""
+    return {
+        "greenhouse": threading.BoundedSemaphore(max(1, greenhouse)),
+        "lever": threading.BoundedSemaphore(max(1, lever)),
+    }
+
+def fetch_company(c: Company, host_limits: Dict[str, threading.BoundedSemaphore],
+                  full_content: bool = False) -> Tuple[List[Dict[str, Any]], int]:
+    """Fetch and normalize all postings for one company, respecting its host's cap.
+
+    Returns the normalized postings and the number of bytes downloaded.
+    """
+    if c.provider == "greenhouse":
+        with host_limits["greenhouse"]:
+            jobs, nbytes = fetch_greenhouse(c.slug, content=full_content)
+        return [normalize_greenhouse(j) for j in jobs], nbytes
+    if c.provider == "lever":
+        with host_limits["lever"]:
+            jobs, nbytes = fetch_lever(c.slug)
+        return [normalize_lever(j) for j in jobs], nbytes
+    raise ValueError(f"unsupported provider {c.provider}")
+
+def fetch_description(c: Company, job: Dict[str, Any], host_limits: Dict[str, threading.BoundedSemaphore]) -> Tuple[str, int]:
+    """Fetch one Greenhouse posting's description, respecting the host's cap."""
+    with host_limits["greenhouse"]:
+        return fetch_greenhouse_description(c.slug, job["id"])
+
+def fetch_all_companies(companies: List[Company], workers: int,
+                        host_limits: Dict[str, threading.BoundedSemaphore],
+                        needs_description: Optional[Callable[[Company, Dict[str, Any]], bool]] = None,
+                        full_content: bool = False,
+                        report: Optional[RunReport] = None) -> List[Optional[List[Dict[str, Any]]]]:
+    """
+    Fetch every company concurrently.
+
+    Greenhouse boards are listed without descriptions. Postings for which
+    needs_description(company, job) is true then get their description fetched
+    individually, also concurrently. With full_content=True the old single
+    content=true request per board is used instead.
+
+    Returns one entry per company in config order (None if the fetch failed or
+    the provider is unsupported), so callers can merge results deterministically
+    regardless of completion order. Bytes per provider and time per company
+    (board plus descriptions) are added to `report`.
+    """
+    report = report or RunReport("job_report")
+
+    def timed(fn, c, *args):
+        start = time.perf_counter()
+        try:
+            return fn(c, *args)
+        finally:
+            report.add_company(c.name, time.perf_counter() - start)
+
+    HTTP.ensure_pool_size(workers)
+    results: List[Optional[List[Dict[str, Any]]]] = [None] * len(companies)
+    list_bytes = [0] * len(companies)
+    detail_bytes = [0] * len(companies)
+    detail_counts = [0] * len(companies)
+    description_bytes = 0
+    supported = [(idx, c) for idx, c in enumerate(companies) if c.provider in host_limits]
+    total_companies = len(supported)
+    for c in companies:
+        if c.provider not in host_limits:
+            logging.warning("Skipping %s: unsupported provider %s", c.name, c.provider)
+
+    done = 0
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {pool.submit(timed, fetch_company, c, host_limits, full_content): (idx, c) for idx, c in supported}
+        for fut in as_completed(futures):
+            idx, c = futures[fut]
+            done += 1
+            try:
+                results[idx], list_bytes[idx] = fut.result()
+                report.add_bytes(c.provider, list_bytes[idx])
+                print(f"[{done}/{total_companies}] Fetched {c.name} ({c.provider}): {len(results[idx])} postings", flush=True)
+            except Exception as e:
+                logging.warning("%s fetch failed: %s", c.name, e)
+                print(f"[{done}/{total_companies}] ⚠️  {c.name} failed: {e}", flush=True)
+
+        if full_content or needs_description is None:
+            return results
+
+        # Phase 2: descriptions only for Greenhouse postings the title can't decide
+        detail_futures = {}
+        for idx, c in supported:
+            if c.provider != "greenhouse" or results[idx] is None:
+                continue
+            for job in results[idx]:
+                if job.get("id") is not None and needs_description(c, job):
+                    detail_futures[pool.submit(timed, fetch_description, c, job, host_limits)] = (idx, job)
+        for fut in as_completed(detail_futures):
+            idx, job = detail_futures[fut]
+            try:
+                job["desc"], nbytes = fut.result()
+                detail_bytes[idx] += nbytes
+                report.add_bytes("greenhouse", nbytes)
+                detail_counts[idx] += 1
+                description_bytes += len(job["desc"].encode("utf-8"))
+            except Exception as e:
+                logging.warning("%s description fetch failed: %s", companies[idx].name, e)
+
+    fetched = sum(detail_counts)
+    avg_description = description_bytes / fetched if fetched else 0
+    report_greenhouse_bytes(companies, results, list_bytes, detail_bytes, detail_counts, avg_description)
+    return results
+
+def report_greenhouse_bytes(companies: List[Company], results: List[Optional[List[Dict[str, Any]]]],
+                            list_bytes: List[int], detail_bytes: List[int], detail_counts: List[int],
+                            avg_description: float) -> None:
+    """
+    Print bytes downloaded per Greenhouse board and an estimate of what was
+    saved versus content=true: one average description (measured from the
+    ones that were fetched) for every posting whose description was skipped.
+    """
+    rows = [(c, results[idx], idx) for idx, c in enumerate(companies)
+            if c.provider == "greenhouse" and results[idx] is not None]
+    if not rows:
+        return
+    print("Greenhouse bytes (list + descriptions):")
+    total_saved = 0
+    for c, jobs, idx in rows:
+        downloaded = list_bytes[idx] + detail_bytes[idx]
+        line = f"  {c.name}: {downloaded / 1024:.0f} KB ({detail_counts[idx]}/{len(jobs)} descriptions)"
+        if avg_description:
+            saved = avg_description * (len(jobs) - detail_counts[idx])
+            total_saved += saved
+            line += f", ~{saved / 1024:.0f} KB saved vs content=true"
+        print(line)
+    if avg_description:
+        print(f"  Total: ~{total_saved / 1024:.0f} KB saved")
 
 # ---------- Normalization ----------
 def normalize_greenhouse(job: Dict[str, Any]) -> Dict[str, Any]:
@@ -180,8 +268,8 @@ def normalize_greenhouse(job: Dict[str, Any]) -> Dict[str, Any]:
     elif isinstance(loc_obj, str):
         loc = loc_obj
     updated_at = job.get("updated_at") or job.get("created_at")
-    desc = (job.get("content") or "")  # HTML or text
-    return {"title": title, "url": url, "location": loc, "updated_at": updated_at, "desc": desc}
+    desc = (job.get("content") or "")  # HTML or text; only present with content=true
+    return {"id": job.get("id"), "title": title, "url": url, "location": loc, "updated_at": updated_at, "desc": desc}
 
 def normalize_lever(job: Dict[str, Any]) -> Dict[str, Any]:
     title = job.get("text", "") or ""
@@ -198,28 +286,7 @@ def normalize_lever(job: Dict[str, Any]) -> Dict[str, Any]:
 
 # ---------- Filters ----------
 def location_matches(loc: str, boston_locations: List[str], include_remote: bool) -> bool:
-    l = (loc or "").lower()
-    if any(city in l for city in boston_locations):
-        return True
-    if include_remote:
-        # Check for remote indicators, but exclude specific non-MA cities
-        # Exclude other US states/cities first
-        non_ma_cities = [
-            'denver', 'colorado', ', co,', ', co ', 
-            'tempe', 'arizona', ', az,', ', az ',
-            'new york', ', ny,', ', ny ', 'nyc',
-            'san francisco', 'california', ', ca,', ', ca ',
-            'seattle', 'washington', ', wa,', ', wa ',
-            'austin', 'texas', ', tx,', ', tx ',
-            'chicago', 'illinois', ', il,', ', il ',
-        ]
-        # If it contains a non-MA city/state, reject it
-        if any(city in l for city in non_ma_cities):
-            return False
-        # Now check for remote keywords
-        if any(rem in l for rem in ("remote", "anywhere", "distributed", "remote in usa", "remote in us", "united states remote")):
-            return True
-    return False
+    return matches_boston_area(loc, boston_locations, include_remote)
 
 def title_matches_keywords(title: str, include_keywords: List[str], exclude_keywords: List[str]) -> bool:
     t = (title or "").lower()
@@ -294,33 +361,35 @@ def send_email_if_configured(subject: str, body_md: str) -> bool:
         server.send_message(msg)
     return True
 
-# ---------- Main ----------
-def main():
-    parser = argparse.ArgumentParser(description="Daily Boston internship report (Greenhouse/Lever).")
-    parser.add_argument("--config", default="config/companies.yml", help="Path to YAML config file")
-    parser.add_argument("--include-remote", action="store_true", help="Include remote U.S. roles")
-    parser.add_argument("--out", dest="out_dir", default=None, help="Output directory for reports")
-    args = parser.parse_args()
-
-    cfg = load_config(args.config, args.include_remote, args.out_dir)
+# ---------- Collect / record ----------
+def collect_jobs(cfg: Config, workers: int = DEFAULT_WORKERS,
+                 host_limits: Optional[Dict[str, threading.BoundedSemaphore]] = None,
+                 full_content: bool = False, report: Optional[RunReport] = None) -> List[Dict[str, Any]]:
+    """Fetch every configured company and return its matching internships, newest first."""
+    report = report or RunReport("job_report")
+    if host_limits is None:
+        host_limits = make_host_limits(DEFAULT_HOST_CONCURRENCY["greenhouse"], DEFAULT_HOST_CONCURRENCY["lever"])
+
+    def needs_description(c: Company, job: Dict[str, Any]) -> bool:
+        # Only when the posting passes the other filters and is_intern_role
+        # depends on the description: no "intern" in the title, no seniority term.
+        title = job.get("title", "") or ""
+        return (location_matches(job.get("location", "") or "", cfg.boston_locations, cfg.include_remote)
+                and title_matches_keywords(title, c.include_keywords, c.exclude_keywords)
+                and not is_intern_role(title)
+                and is_intern_role(title, "intern"))
 
-    today = dt.date.today().isoformat()
     results: List[Dict[str, Any]] = []
-
-    total_companies = len(cfg.companies)
-    for idx, c in enumerate(cfg.companies, 1):
-        print(f"[{idx}/{total_companies}] Fetching {c.name} ({c.provider})...", flush=True)
-        try:
-            if c.provider == "greenhouse":
-                jobs = fetch_greenhouse(c.slug)
-                normalized = [normalize_greenhouse(j) for j in jobs]
-            elif c.provider == "lever":
-                jobs = fetch_lever(c.slug)
-                normalized = [normalize_lever(j) for j in jobs]
-            else:
-                logging.warning("Skipping %s: unsupported provider %s", c.name, c.provider)
+    with report.stage("fetch companies", rows_in=len(cfg.companies)) as stage:
+        fetched = fetch_all_companies(cfg.companies, workers, host_limits, needs_description, full_content, report)
+        postings = sum(len(normalized) for normalized in fetched if normalized is not None)
+        stage.rows_out = postings
+
+    # Merge in config order so output matches a serial run
+    with report.stage("filter postings", rows_in=postings) as stage:
+        for c, normalized in zip(cfg.companies, fetched):
+            if normalized is None:
                 continue
-
             for job in normalized:
                 if not location_matches(job.get("location", "") or "", cfg.boston_locations, cfg.include_remote):
                     continue
@@ -334,10 +403,7 @@ def main():
                     "company": c.name,
                     "source": c.provider,
                 })
-
-        except Exception as e:
-            logging.warning("%s fetch failed: %s", c.name, e)
-            print(f"  ⚠️  {c.name} failed: {e}", flush=True)
+        stage.rows_out = len(results)
 
     # Sort newest first (by provider timestamp if present)
     def sort_key(it: Dict[str, Any]):
@@ -346,93 +412,78 @@ def main():
             updated = str(updated) if updated is not None else ""
         return (updated, it.get("company") or "")
 
-    results_sorted = sorted(results, key=sort_key, reverse=True)
-
-    # --- Append to README.md ---
-    readme_path = os.path.join(os.path.dirname(__file__), "..", "README.md")
-    
-    # If README.md doesn't exist, create with header and table
-    if not os.path.exists(readme_path):
-        with open(readme_path, "w", encoding="utf-8") as f:
-            f.write("# Job Listings\n\n")
-            f.write("| Company Name | Job Title | Location | Date Posted | APPLY |\n")
-            f.write("|---|---|---|---|---|\n")
-    
-    # Read existing README.md and extract existing URLs
-    with open(readme_path, "r", encoding="utf-8") as f:
-        readme_lines = f.readlines()
-    
-    # Extract all existing URLs from the README
-    import re
-    existing_urls = set()
-    for line in readme_lines:
-        # Match URLs in [APPLY](url) format (old markdown style)
-        matches = re.findall(r'\[APPLY\]\((https?://[^\)]+)\)', line)
-        existing_urls.update(matches)
-        # Match URLs in HTML <a href="url"> format (new HTML style)
-        matches = re.findall(r'<a href="(https?://[^"]+)"', line)
-        existing_urls.update(matches)
-    
-    # Prepare table rows (internships only, with date posted, excluding duplicates)
-    table_rows = []
+    return sorted(results, key=sort_key, reverse=True)
+
+
+def record_jobs(store: ListingStore, results: List[Dict[str, Any]]) -> Tuple[int, int]:
+    """Upsert collected jobs into the listing store; returns (added, skipped duplicates)."""
     added_count = 0
     skipped_count = 0
-    for it in results_sorted:
+    for it in results:
         # Extra strict internship/co-op filter
         title = (it.get("title", "") or "").lower()
         desc = (it.get("desc", "") or "").lower()
         if not ("intern" in title or "internship" in title or "co-op" in title or "co op" in title or "intern" in desc or "internship" in desc or "co-op" in desc or "co op" in desc):
             continue
-        
+
         url = it.get("url", "")
-        # Skip if URL already exists in README
-        if url and url in existing_urls:
-            skipped_count += 1
-            continue
-        
         company = it.get("company", "")
-        job_title = (it.get("title", "") or "").replace("|", "\\|")
-        location = format_location((it.get("location") or "")).replace("|", "\\|")
+        job_title = it.get("title", "") or ""
+        location = format_location((it.get("location") or ""))
         # Format date posted as MM/DD/YYYY
         raw_date = it.get("updated_at") or it.get("created_at") or ""
+        if isinstance(raw_date, (int, float)):  # Lever timestamps are epoch milliseconds
+            raw_date = dt.datetime.fromtimestamp(raw_date / 1000, dt.timezone.utc).date().isoformat()
         date_posted = ""
         if raw_date:
             try:
                 # Try parsing ISO format
-                from datetime import datetime
-                date_posted = datetime.fromisoformat(raw_date[:10]).strftime("%m/%d/%Y")
+                date_posted = dt.datetime.fromisoformat(raw_date[:10]).strftime("%m/%d/%Y")
             except Exception:
                 date_posted = raw_date
-        # Format apply link
-        apply_link = f'[APPLY]({url})' if url else ""
-        table_rows.append(f"| {company} | {job_title} | {location} | {date_posted} | {apply_link} |")
-        added_count += 1
-
-    # Find where the table ends
-    table_start = None
-    for i, line in enumerate(readme_lines):
-        # Match both old and new table separator formats
-        if line.strip().startswith("|---|---|---|---|") and "---" in line:
-            table_start = i
-            break
-    
-    # If table exists, append rows after it
-    if table_start is not None:
-        # Find last row in table
-        last_row = table_start + 1
-        while last_row < len(readme_lines) and readme_lines[last_row].startswith("|"):
-            last_row += 1
-        # Insert new rows after last_row
-        new_lines = readme_lines[:last_row] + [row + "\n" for row in table_rows] + readme_lines[last_row:]
-    else:
-        # No table found, add header and table
-        new_lines = ["# Job Listings\n\n", "| Company Name | Job Title | Location | Date Posted | APPLY |\n", "|---|---|---|---|---|\n"] + [row + "\n" for row in table_rows] + readme_lines
-    
-    # Write back to README.md
-    with open(readme_path, "w", encoding="utf-8") as f:
-        f.writelines(new_lines)
-
-    print(f"Found {len(results_sorted)} total jobs from {total_companies} companies.")
+        # Skip (but credit this source) if the URL is already stored
+        if store.upsert(company, job_title, location, date_posted, url, source=it.get("source") or "job_report"):
+            added_count += 1
+        else:
+            skipped_count += 1
+    return added_count, skipped_count
+
+# ---------- Main ----------
+def main():
+    parser = argparse.ArgumentParser(description="Daily Boston internship report (Greenhouse/Lever).")
+    parser.add_argument("--config", default="config/companies.yml", help="Path to YAML config file")
+    parser.add_argument("--include-remote", action="store_true", help="Include remote U.S. roles")
+    parser.add_argument("--out", dest="out_dir", default=None, help="Output directory for reports")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Number of companies fetched concurrently (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--greenhouse-concurrency", type=int, default=DEFAULT_HOST_CONCURRENCY["greenhouse"],
+                        help="Max in-flight requests to boards-api.greenhouse.io")
+    parser.add_argument("--lever-concurrency", type=int, default=DEFAULT_HOST_CONCURRENCY["lever"],
+                        help="Max in-flight requests to api.lever.co")
+    parser.add_argument("--full-content", action="store_true",
+                        help="Download every Greenhouse description up front (content=true) instead of on demand")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    cfg = load_config(args.config, args.include_remote, args.out_dir)
+
+    report = RunReport("job_report", profile_dir=args.profile)
+    try:
+        host_limits = make_host_limits(args.greenhouse_concurrency, args.lever_concurrency)
+        results_sorted = collect_jobs(cfg, args.workers, host_limits, args.full_content, report)
+
+        # --- Record in the listing store and re-render README.md ---
+        with ListingStore() as store:
+            with report.stage("record", rows_in=len(results_sorted)) as stage:
+                added_count, skipped_count = record_jobs(store, results_sorted)
+                stage.rows_out = added_count
+            with report.stage("render README") as stage:
+                stage.rows_out = store.render_readme()
+    finally:
+        http_client.record_connections(report)
+        report.save()
+
+    print(f"Found {len(results_sorted)} total jobs from {len(cfg.companies)} companies.")
     print(f"README.md: Added {added_count} new jobs, skipped {skipped_count} duplicates.")
 
 if __name__ == "__main__":
@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+"""
+SQLite listing store: the system of record for every job the scripts collect.
+
+README.md is a rendered view of this store. Writers upsert listings here
+(duplicate checks are indexed lookups on the canonical apply URL or on the
+lower-cased company/title pair) and then re-render the README table, sorted
+newest first. Each listing remembers which sources have reported it.
+
+The database lives in data/listings.db (override with LISTINGS_DB); while an
+HTTP cassette is replayed, both it and the README are a scratch copy inside the
+cassette directory instead (see default_paths). When it is
+empty it is bootstrapped from the rows already in README.md. The database is
+local while README.md is shared, so every render first imports the README rows
+the store doesn't know (added by hand, pulled from git, from another
+maintainer's run) instead of dropping them. --import-readme does the same
+without rendering.
+
+Usage:
+    python listing_store.py --stats
+    python listing_store.py --import-readme
+    python listing_store.py --render
+"""
+
+import argparse
+import datetime as dt
+import os
+import re
+import shutil
+import sqlite3
+from typing import Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import http_cassette
+from run_report import Profiler, add_profile_argument
+
+DEFAULT_DB_PATH = os.environ.get(
+    "LISTINGS_DB", os.path.join(os.path.dirname(__file__), "..", "data", "listings.db"))
+README_PATH = os.path.join(os.path.dirname(__file__), "..", "README.md")
+
+TABLE_HEADER = "| Company Name | Job Title | Location | Date Posted | APPLY |"
+TABLE_SEPARATOR = "|---|---|---|---|:-:|"
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {"ref", "gh_src", "lever-source", "lever-origin"}
+
+# How upsert decides a listing is already stored. Several postings can share a
+# generic careers URL, so only the scripts that always get a posting-specific
+# URL match on the URL alone.
+MATCH_URL = "url"        # same canonical URL (Greenhouse/Lever/Adzuna writers)
+MATCH_TITLE = "title"    # same company and title (GitHub board scraper)
+MATCH_EXACT = "exact"    # same canonical URL *and* company/title (README import)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS listings (
+    id INTEGER PRIMARY KEY,
+    company TEXT NOT NULL,
+    title TEXT NOT NULL,
+    location TEXT NOT NULL DEFAULT '',
+    date_posted TEXT NOT NULL DEFAULT '',
+    sort_date TEXT NOT NULL DEFAULT '',
+    apply_url TEXT NOT NULL DEFAULT '',
+    canonical_url TEXT,
+    company_key TEXT NOT NULL,
+    title_key TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_listings_canonical_url
+    ON listings (canonical_url) WHERE canonical_url IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_listings_company_title
+    ON listings (company_key, title_key);
+CREATE INDEX IF NOT EXISTS idx_listings_sort_date
+    ON listings (sort_date DESC, id);
+CREATE TABLE IF NOT EXISTS provenance (
+    listing_id INTEGER NOT NULL REFERENCES listings (id) ON DELETE CASCADE,
+    source TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    PRIMARY KEY (listing_id, source)
+);
+"""
+
+_APPLY_MD_RE = re.compile(r'\[APPLY\]\((https?://\S+)\)')
+_APPLY_HTML_RE = re.compile(r'<a href="(https?://[^"]+)"')
+_CELL_SPLIT_RE = re.compile(r'(?<!\\)\|')
+
+
+# ---------- Keys ----------
+def canonical_url(url: str) -> Optional[str]:
+    """Apply URL reduced to what identifies the posting (None when there is no URL).
+
+    Lower-cases scheme and host, treats http and https alike, and drops the
+    fragment, trailing slashes and tracking parameters (utm_*, ref, gh_src, ...).
+    """
+    url = (url or "").strip()
+    if not url:
+        return None
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    if not parts.netloc:
+        return url
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+             if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS]
+    scheme = "https" if parts.scheme.lower() in ("http", "https") else parts.scheme.lower()
+    return urlunsplit((scheme, parts.netloc.lower(), parts.path.rstrip("/"), urlencode(query), ""))
+
+
+def listing_key(company: str, title: str) -> Tuple[str, str]:
+    """
+    Case-insensitive (company, title) pair used for title-based dedup.
+
+    Whitespace is collapsed exactly as _cell collapses it in README rows, so
+    a rendered row always maps back to the listing it came from.
+    """
+    return " ".join((company or "").split()).lower(), " ".join((title or "").split()).lower()
+
+
+def is_http_url(url: str) -> bool:
+    """True for the http(s) apply links a README row can carry (see parse_readme_row)."""
+    return (url or "").strip().lower().startswith(("http://", "https://"))
+
+
+def sort_date(date_posted: str) -> str:
+    """ISO date for ordering MM/DD/YYYY display dates; '' (sorts last) when unparseable."""
+    try:
+        return dt.datetime.strptime((date_posted or "").strip(), "%m/%d/%Y").date().isoformat()
+    except ValueError:
+        return ""
+
+
+_replay_outputs_reset = set()
+
+
+def default_paths() -> Tuple[str, str]:
+    """
+    (database, README) a ListingStore opens when not given paths.
+
+    While an HTTP cassette is being replayed these are listings.db and
+    README.md in the cassette's replay-output/ directory, so recorded (stale)
+    listings never reach the real store or the committed README. The scratch
+    README is copied from the real one once per process, so every replay
+    starts from the same state.
+    """
+    cassette = http_cassette.active()
+    if cassette is None or cassette.mode != "replay":
+        return DEFAULT_DB_PATH, README_PATH
+    directory = os.path.join(cassette.directory, http_cassette.REPLAY_OUTPUT)
+    db_path, readme_path = os.path.join(directory, "listings.db"), os.path.join(directory, "README.md")
+    if directory not in _replay_outputs_reset:
+        _replay_outputs_reset.add(directory)
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory)
+        if os.path.exists(README_PATH):
+            shutil.copyfile(README_PATH, readme_path)
+        print(f"Listing store: replaying into {directory} (the real store and README.md are untouched)")
+    return db_path, readme_path
+
+
+def _now() -> str:
+    return dt.datetime.now(dt.timezone.utc).replace(microsecond=0).isoformat()
+
+
+def _cell(text: str) -> str:
+    """Table-safe cell text: single line, pipes escaped exactly once."""
+    text = " ".join((text or "").split())
+    return text.replace("\\|", "|").replace("|", "\\|")
+
+
+# ---------- README table ----------
+def find_table_body(content: str) -> Optional[Tuple[int, int]]:
+    """(start, end) offsets of the job rows under the README table header, or None."""
+    match = re.search(re.escape(TABLE_HEADER), content)
+    if not match:
+        return None
+    header_end = content.find("\n", match.end())
+    if header_end == -1:
+        return len(content), len(content)
+    separator_end = content.find("\n", header_end + 1)
+    if separator_end == -1:
+        return len(content), len(content)
+    # A blank line ends a markdown table; "---" and "## " end older READMEs
+    # that had none before the next section
+    ends = [content.find(marker, separator_end) for marker in ("\n---", "\n## ")]
+    blank = content.find("\n\n", separator_end)
+    ends.append(blank + 1 if blank != -1 else -1)
+    table_end = min((end for end in ends if end != -1), default=len(content))
+    return separator_end + 1, table_end
+
+
+def parse_readme_row(line: str) -> Optional[Tuple[str, str, str, str, str]]:
+    """(company, title, location, date_posted, apply_url) from one README table row."""
+    line = line.strip()
+    if not line.startswith("|"):
+        return None
+    cells = [c.strip().replace("\\|", "|") for c in _CELL_SPLIT_RE.split(line)[1:-1]]
+    if len(cells) < 5 or not cells[0] or not cells[1]:
+        return None
+    apply_cell = cells[4]
+    match = _APPLY_MD_RE.search(apply_cell) or _APPLY_HTML_RE.search(apply_cell)
+    return cells[0], cells[1], cells[2], cells[3], match.group(1) if match else ""
+
+
+def format_readme_row(company: str, title: str, location: str, date_posted: str, apply_url: str) -> str:
+    apply_link = f"[APPLY]({apply_url})" if apply_url else ""
+    return f"| {_cell(company)} | {_cell(title)} | {_cell(location)} | {_cell(date_posted)} | {apply_link} |"
+
+
+# ---------- Store ----------
+class ListingStore:
+    """Listings table plus per-source provenance in a WAL-mode SQLite database.
+
+    Use as a context manager: changes are committed on a clean exit and rolled
+    back if the block raises.
+    """
+
+    def __init__(self, path: Optional[str] = None, readme_path: Optional[str] = None, bootstrap: bool = True):
+        if path is None or readme_path is None:
+            default_db, default_readme = default_paths()
+            path = path or default_db
+            readme_path = readme_path or default_readme
+        self.path = path
+        self.readme_path = readme_path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+        self._rekey()
+        if bootstrap and self.count() == 0 and os.path.exists(readme_path):
+            imported = self.import_readme(readme_path)
+            self.conn.commit()
+            if imported:
+                print(f"Listing store: bootstrapped {imported} listings from {os.path.basename(readme_path)}")
+
+    def _rekey(self) -> None:
+        """Recompute keys stored before listing_key collapsed internal whitespace."""
+        stale = self.conn.execute(
+            "SELECT id, company, title FROM listings WHERE"
+            " instr(company_key, '  ') OR instr(title_key, '  ')"
+            " OR instr(company_key || title_key, char(9)) OR instr(company_key || title_key, char(10))"
+            " OR instr(company_key || title_key, char(13))").fetchall()
+        for listing_id, company, title in stale:
+            self.conn.execute("UPDATE listings SET company_key = ?, title_key = ? WHERE id = ?",
+                              (*listing_key(company, title), listing_id))
+        if stale:
+            self.conn.commit()
+
+    def __enter__(self) -> "ListingStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.conn.commit()
+        else:
+            self.conn.rollback()
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def commit(self) -> None:
+        self.conn.commit()
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM listings").fetchone()[0]
+
+    # --- Lookups ---
+    def find_by_url(self, url: str) -> Optional[int]:
+        key = canonical_url(url)
+        if key is None:
+            return None
+        row = self.conn.execute("SELECT id FROM listings WHERE canonical_url = ? LIMIT 1", (key,)).fetchone()
+        return row[0] if row else None
+
+    def find_by_company_title(self, company: str, title: str) -> Optional[int]:
+        row = self.conn.execute(
+            "SELECT id FROM listings WHERE company_key = ? AND title_key = ? LIMIT 1",
+            listing_key(company, title)).fetchone()
+        return row[0] if row else None
+
+    def find_exact(self, company: str, title: str, url: str) -> Optional[int]:
+        # A README row keeps only http(s) links, so an empty or other URL
+        # can't tell listings apart: match on company and title alone
+        if not is_http_url(url):
+            return self.find_by_company_title(company, title)
+        key = canonical_url(url)
+        row = self.conn.execute(
+            "SELECT id FROM listings WHERE company_key = ? AND title_key = ? AND canonical_url IS ? LIMIT 1",
+            (*listing_key(company, title), key)).fetchone()
+        return row[0] if row else None
+
+    def find(self, company: str, title: str, url: str, match: str = MATCH_URL) -> Optional[int]:
+        """Id of the stored listing this one duplicates under `match`, or None."""
+        if match == MATCH_URL:
+            return self.find_by_url(url)
+        if match == MATCH_TITLE:
+            return self.find_by_company_title(company, title)
+        if match == MATCH_EXACT:
+            return self.find_exact(company, title, url)
+        raise ValueError(f"Unknown match mode: {match}")
+
+    def has_url(self, url: str) -> bool:
+        return self.find_by_url(url) is not None
+
+    def has_company_title(self, company: str, title: str) -> bool:
+        return self.find_by_company_title(company, title) is not None
+
+    # --- Writes ---
+    def upsert(self, company: str, title: str, location: str, date_posted: str, apply_url: str,
+               source: str, match: str = MATCH_URL) -> bool:
+        """Record one listing from `source`. Returns True if it was new.
+
+        A listing already in the store (see the MATCH_* modes) keeps its
+        displayed fields; it is only marked as seen again, credited to
+        `source`, and has any empty location/date/URL filled in.
+        """
+        now = _now()
+        listing_id = self.find(company, title, apply_url, match)
+
+        if listing_id is None:
+            company_key, title_key = listing_key(company, title)
+            cur = self.conn.execute(
+                "INSERT INTO listings (company, title, location, date_posted, sort_date, apply_url,"
+                " canonical_url, company_key, title_key, first_seen, last_seen)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (company, title, location or "", date_posted or "", sort_date(date_posted),
+                 apply_url or "", canonical_url(apply_url), company_key, title_key, now, now))
+            listing_id = cur.lastrowid
+            is_new = True
+        else:
+            self.conn.execute(
+                "UPDATE listings SET last_seen = ?,"
+                " location = CASE WHEN location = '' THEN ? ELSE location END,"
+                " date_posted = CASE WHEN date_posted = '' THEN ? ELSE date_posted END,"
+                " sort_date = CASE WHEN date_posted = '' THEN ? ELSE sort_date END,"
+                " apply_url = CASE WHEN apply_url = '' THEN ? ELSE apply_url END,"
+                " canonical_url = COALESCE(canonical_url, ?)"
+                " WHERE id = ?",
+                (now, location or "", date_posted or "", sort_date(date_posted),
+                 apply_url or "", canonical_url(apply_url), listing_id))
+            is_new = False
+
+        self.conn.execute(
+            "INSERT INTO provenance (listing_id, source, first_seen, last_seen) VALUES (?, ?, ?, ?)"
+            " ON CONFLICT (listing_id, source) DO UPDATE SET last_seen = excluded.last_seen",
+            (listing_id, source, now, now))
+        return is_new
+
+    def update_location(self, listing_id: int, location: str) -> None:
+        self.conn.execute("UPDATE listings SET location = ? WHERE id = ?", (location, listing_id))
+
+    # --- README ---
+    def import_readme(self, readme_path: Optional[str] = None, source: str = "readme") -> int:
+        """Upsert every row of the README job table; returns how many were new."""
+        with open(readme_path or self.readme_path, "r", encoding="utf-8") as f:
+            content = f.read()
+        bounds = find_table_body(content)
+        if bounds is None:
+            return 0
+        return self.import_table_body(content[bounds[0]:bounds[1]], source)
+
+    def import_table_body(self, body: str, source: str = "readme", only_new: bool = False) -> int:
+        """Upsert the rows of a README table body (exact match); returns how many were new.
+
+        With only_new, rows already stored are left alone rather than marked
+        as seen again.
+        """
+        added = 0
+        for line in body.split("\n"):
+            row = parse_readme_row(line)
+            if not row:
+                continue
+            if only_new and self.find_exact(row[0], row[1], row[4]) is not None:
+                continue
+            if self.upsert(*row, source=source, match=MATCH_EXACT):
+                added += 1
+        return added
+
+    def iter_listings(self) -> Iterator[Tuple[int, str, str, str, str, str]]:
+        """(id, company, title, location, date_posted, apply_url), newest first."""
+        return self.conn.execute(
+            "SELECT id, company, title, location, date_posted, apply_url FROM listings"
+            " ORDER BY sort_date DESC, id")
+
+    def render_rows(self) -> List[str]:
+        return [format_readme_row(*row[1:]) for row in self.iter_listings()]
+
+    def render_readme(self, readme_path: Optional[str] = None) -> int:
+        """
+        Rewrite the README job table from the store; returns the number of rows.
+
+        README rows the store doesn't have yet are imported first, so a
+        render never drops listings that only exist in the committed README.
+        """
+        readme_path = readme_path or self.readme_path
+        content = ""
+        if os.path.exists(readme_path):
+            with open(readme_path, "r", encoding="utf-8") as f:
+                content = f.read()
+        bounds = find_table_body(content)
+        if bounds is not None:
+            imported = self.import_table_body(content[bounds[0]:bounds[1]], only_new=True)
+            if imported:
+                print(f"Listing store: imported {imported} README rows it didn't have before rendering")
+
+        self.conn.commit()
+        rows = self.render_rows()
+        body = "".join(row + "\n" for row in rows)
+
+        if bounds is None:
+            new_content = f"# Job Listings\n\n{TABLE_HEADER}\n{TABLE_SEPARATOR}\n{body}\n{content}"
+        else:
+            new_content = content[:bounds[0]] + body + content[bounds[1]:]
+
+        tmp_path = readme_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(new_content)
+        os.replace(tmp_path, readme_path)
+        return len(rows)
+
+    def source_counts(self) -> List[Tuple[str, int]]:
+        return self.conn.execute(
+            "SELECT source, COUNT(*) FROM provenance GROUP BY source ORDER BY COUNT(*) DESC").fetchall()
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Inspect or rebuild the listing store")
+    ap.add_argument("--db", default=DEFAULT_DB_PATH, help="SQLite database path")
+    ap.add_argument("--readme", default=README_PATH, help="README.md rendered from the store")
+    ap.add_argument("--import-readme", action="store_true", help="Upsert rows found in README.md (e.g. added by hand)")
+    ap.add_argument("--render", action="store_true", help="Re-render the README table from the store")
+    ap.add_argument("--stats", action="store_true", help="Print listing counts per source")
+    add_profile_argument(ap)
+    args = ap.parse_args()
+
+    profiler = Profiler(args.profile, "listing_store")
+    with profiler.profile("open store"):
+        store = ListingStore(args.db, args.readme)
+    with store:
+        if args.import_readme:
+            with profiler.profile("import README"):
+                print(f"Imported {store.import_readme()} new listings from README")
+        if args.render:
+            with profiler.profile("render README"):
+                print(f"Rendered {store.render_readme()} listings to README")
+        if args.stats or not (args.import_readme or args.render):
+            print(f"{store.count()} listings in {args.db}")
+            for source, count in store.source_counts():
+                print(f"  {source}: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Load-test the Greenhouse/Lever fetchers against mock_server.py as the
+company list grows.
+
+For each company count, builds a synthetic companies list (alternating
+Greenhouse and Lever slugs) and runs job_report's collect_jobs plus
+record_jobs into a scratch listing store, exactly as job_report.py does,
+against a mock server: one started in-process with the mock_server flags
+given here, or an already running one (--base-url; run it in its own
+process so its threads don't compete with the fetchers for the GIL).
+
+Reports end-to-end wall time, companies and postings per second, the
+per-stage split, the HTTP connections opened and what the server saw
+(requests, 429s, 500s) per size.
+Results are written as JSON; pass a previous run with --baseline to print
+wall-time ratios.
+
+Usage:
+    python load_test.py                                   # 100, 500, 1000, 5000 companies
+    python load_test.py --companies 1000,5000 --latency 0.05 --qps 200 --error-rate 0.01
+    python mock_server.py --port 8765 --latency 0.05 &
+    python load_test.py --base-url http://127.0.0.1:8765 --out load.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import requests
+
+from http_client import HTTP
+from listing_store import ListingStore
+from mock_server import add_mock_arguments, mock_env, start_mock_server, state_from_args
+from run_report import RunReport
+
+DEFAULT_COMPANIES = "100,500,1000,5000"
+
+
+def server_stats(base_url: str):
+    return requests.get(f"{base_url}/_stats", timeout=10).json()
+
+
+def stats_delta(before, after):
+    requests_before = before["requests"]
+    return {
+        "requests": {api: n - requests_before.get(api, 0) for api, n in after["requests"].items()
+                     if n - requests_before.get(api, 0)},
+        "rate_limited": after["rate_limited"] - before["rate_limited"],
+        "errors": after["errors"] - before["errors"],
+    }
+
+
+def connections_opened() -> int:
+    return sum(s["connections"] for s in HTTP.connection_stats().values())
+
+
+def run_size(job_report, count: int, args, base_url: str, workdir: str):
+    """One end-to-end run over `count` synthetic companies; returns its result row."""
+    companies = [job_report.Company(name=f"Company{i:05d}", provider="greenhouse" if i % 2 else "lever",
+                                    slug=f"company{i:05d}", include_keywords=[], exclude_keywords=[])
+                 for i in range(count)]
+    cfg = job_report.Config(companies=companies, boston_locations=["boston", "cambridge", "somerville", "waltham"],
+                            include_remote=True, out_dir=workdir)
+    host_limits = job_report.make_host_limits(args.greenhouse_concurrency, args.lever_concurrency)
+    report = RunReport("load_test", path=os.path.join(workdir, "run_report.json"))
+    db_path = os.path.join(workdir, f"listings-{count}.db")
+    readme_path = os.path.join(workdir, f"README-{count}.md")
+    with open(readme_path, "w", encoding="utf-8") as f:
+        f.write("# Job Listings\n")
+
+    before = server_stats(base_url)
+    opened_before = connections_opened()
+    start = time.perf_counter()
+    # Per-company progress lines would swamp the output; failures are counted from them
+    progress = io.StringIO()
+    with contextlib.redirect_stdout(progress):
+        jobs = job_report.collect_jobs(cfg, args.workers, host_limits, report=report)
+        with ListingStore(db_path, readme_path, bootstrap=False) as store:
+            with report.stage("record", rows_in=len(jobs)) as stage:
+                stage.rows_out, _ = job_report.record_jobs(store, jobs)
+    wall = time.perf_counter() - start
+    opened = connections_opened() - opened_before
+    served = stats_delta(before, server_stats(base_url))
+
+    stages = {s.name: s for s in report.stages}
+    fetch = stages["fetch companies"]
+    return {
+        "companies": count,
+        "wall_seconds": round(wall, 3),
+        "companies_per_second": round(count / wall, 1),
+        "postings": fetch.rows_out,
+        "postings_per_second": round(fetch.rows_out / wall, 1),
+        "matches": len(jobs),
+        "failed_companies": progress.getvalue().count("⚠️"),
+        "connections_opened": opened,
+        "stages": {name: round(s.seconds, 3) for name, s in stages.items()},
+        "server": served,
+    }
+
+
+def print_table(results) -> None:
+    print(f"{'companies':>9} {'wall s':>8} {'co/s':>8} {'posts/s':>9} {'postings':>9} {'matches':>8} "
+          f"{'requests':>9} {'conns':>6} {'429s':>6} {'500s':>6}")
+    for r in results:
+        print(f"{r['companies']:9d} {r['wall_seconds']:8.2f} {r['companies_per_second']:8.1f} "
+              f"{r['postings_per_second']:9.1f} {r['postings']:9d} {r['matches']:8d} "
+              f"{sum(r['server']['requests'].values()):9d} {r['connections_opened']:6d} "
+              f"{r['server']['rate_limited']:6d} {r['server']['errors']:6d}")
+
+
+def print_comparison(results, baseline_path: str) -> None:
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {r["companies"]: r for r in json.load(f)["results"]}
+    print(f"\n{'companies':>9} {'baseline s':>11} {'now s':>8} {'ratio':>7}")
+    for r in results:
+        old = baseline.get(r["companies"])
+        if old:
+            ratio = r["wall_seconds"] / old["wall_seconds"] if old["wall_seconds"] else float("inf")
+            print(f"{r['companies']:9d} {old['wall_seconds']:11.2f} {r['wall_seconds']:8.2f} {ratio:6.2f}x")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Time the company fetchers against a mock server as companies grow")
+    ap.add_argument("--companies", default=DEFAULT_COMPANIES, help="Comma-separated company counts")
+    ap.add_argument("--base-url", help="Use a running mock_server.py instead of starting one in-process")
+    ap.add_argument("--workers", type=int, default=16, help="job_report --workers")
+    ap.add_argument("--greenhouse-concurrency", type=int, default=8, help="job_report --greenhouse-concurrency")
+    ap.add_argument("--lever-concurrency", type=int, default=4, help="job_report --lever-concurrency")
+    ap.add_argument("--out", help="Write JSON results here")
+    ap.add_argument("--baseline", help="Earlier --out file to compare against")
+    add_mock_arguments(ap)
+    args = ap.parse_args()
+
+    base_url = args.base_url
+    if not base_url:
+        _, base_url = start_mock_server(state=state_from_args(args))
+    # The fetchers read their base URLs at import time
+    os.environ.update(mock_env(base_url))
+    import job_report
+
+    # Per-company warnings (synthetic 500s) would swamp the table
+    logging.disable(logging.WARNING)
+    counts = [int(c) for c in args.companies.split(",") if c.strip()]
+    results = []
+    with tempfile.TemporaryDirectory(prefix="load_test-") as workdir:
+        for count in counts:
+            print(f"{count:,} companies", file=sys.stderr)
+            results.append(run_size(job_report, count, args, base_url, workdir))
+
+    print_table(results)
+    if args.out:
+        meta = {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "base_url": args.base_url or "in-process",
+            "workers": args.workers,
+            "greenhouse_concurrency": args.greenhouse_concurrency,
+            "lever_concurrency": args.lever_concurrency,
+            "mock": {k: getattr(args, k) for k in ("qps", "retry_after", "latency", "error_rate", "board_size")},
+        }
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump({"meta": meta, "results": results}, f, indent=2)
+        print(f"\nWrote {args.out}", file=sys.stderr)
+    if args.baseline:
+        print_comparison(results, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+Shared location classification and normalization for all job scripts.
+
+Each list of location substrings is compiled once into a single alternation
+regex, and classification results are memoized on the normalized
+(lower-cased) location string - real data repeats "Remote in USA" and
+"Boston, MA" thousands of times per run. The location formatters share one
+segment tokenizer and are memoized for the duration of a run.
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterable, List, Pattern, Tuple
+
+# ---------- Location lists ----------
+# Boston area cities that are unambiguous (only in MA)
+BOSTON_LOCATIONS_UNAMBIGUOUS = [
+    "boston", "cambridge", "somerville", "lexington", "needham",
+    "waltham", "watertown", "brookline", "quincy", "norwood",
+    "framingham", "lowell", "worcester", "andover",
+    "marlborough", "peabody", "dedham", "acton", "bedford",
+    "pittsfield", "fall river", "attleboro", "westborough",
+    "massachusetts", " ma ", ", ma"
+]
+
+# Cities that exist in multiple states - require MA/Massachusetts to match
+BOSTON_LOCATIONS_AMBIGUOUS = [
+    "newton",      # Newton, MA vs Newton, IA
+    "burlington",  # Burlington, MA vs Burlington, VT
+    "lawrence"     # Lawrence, MA vs Lawrence, KS
+]
+
+# Non-US countries and non-US remote (checked first by is_relevant_location)
+NON_US_PATTERNS = [
+    ', uk', ' uk', ',uk', 'united kingdom',
+    ', canada', ' canada',
+    ', india', ' india',
+    ', mexico', ' mexico',
+    ', europe', ' europe',
+    ', australia', ' australia',
+    ', brazil', ' brazil',
+    ', israel', ' israel',
+    ', china', ' china',
+    ', japan', ' japan',
+    ', singapore', ' singapore',
+    ', germany', ' germany',
+    ', france', ' france',
+    ', netherlands', ' netherlands',
+    ', spain', ' spain',
+    ', italy', ' italy',
+    'remote in uk', 'remote in canada', 'remote in india', 'remote in mexico',
+    'remote in europe', 'remote in australia', 'remote in brazil', 'remote in israel',
+    'remote in china', 'remote in japan', 'remote in singapore', 'remote in germany',
+    'remote in france', 'remote in netherlands', 'remote in spain', 'remote in italy'
+]
+
+# Other US states (not MA), checked by is_relevant_location
+NON_MA_STATES = [
+    ', ks', ', kansas',  # Lawrence, KS
+    ', az', ', arizona',  # Tempe, AZ
+    ', co', ', colorado',  # Denver, CO
+    ', vt', ', vermont',  # Burlington, VT
+    ', ia', ', iowa',  # Newton, IA
+    ', ny', ', new york',
+    ', ca', ', california',
+    ', tx', ', texas',
+    ', fl', ', florida',
+    ', wa', ', washington',
+    ', or', ', oregon',
+    ', il', ', illinois',
+    ', pa', ', pennsylvania',
+    ', oh', ', ohio',
+    ', nc', ', north carolina',
+    ', ga', ', georgia',
+    ', mi', ', michigan',
+    ', nj', ', new jersey',
+    ', va', ', virginia',
+    ', ct', ', connecticut',
+    ', ri', ', rhode island',
+    ', nh', ', new hampshire',
+    ', me', ', maine',
+    'denver, colorado',
+    'tempe, az'
+]
+
+# Shorter state list used by the listing-level check (JobListing.matches_location)
+LISTING_NON_MA_STATES = [
+    ', ks', ', kansas', ', az', ', arizona', ', co', ', colorado',
+    ', vt', ', vermont', ', ia', ', iowa', ', ny', ', new york',
+    ', ca', ', california', ', tx', ', texas', ', fl', ', florida',
+    ', wa', ', washington', 'denver, colorado', 'tempe, az'
+]
+
+LISTING_NON_US_REMOTE = ['remote in uk', 'remote in canada', 'remote in india',
+                         'remote in europe', 'remote in mexico']
+
+# Non-MA cities/states that disqualify a remote match in job_report
+REMOTE_EXCLUDED_CITIES = [
+    'denver', 'colorado', ', co,', ', co ',
+    'tempe', 'arizona', ', az,', ', az ',
+    'new york', ', ny,', ', ny ', 'nyc',
+    'san francisco', 'california', ', ca,', ', ca ',
+    'seattle', 'washington', ', wa,', ', wa ',
+    'austin', 'texas', ', tx,', ', tx ',
+    'chicago', 'illinois', ', il,', ', il ',
+]
+
+REMOTE_KEYWORDS = ["remote", "anywhere", "distributed", "remote in usa", "remote in us", "united states remote"]
+
+MA_MARKERS = [', ma', ' ma', 'massachusetts']
+
+# ---------- Compiled matchers ----------
+@lru_cache(maxsize=None)
+def term_pattern(terms: Tuple[str, ...]) -> Pattern:
+    """Compile substrings into one alternation; .search() is equivalent to any(t in s)."""
+    if not terms:
+        return re.compile(r'(?!)')  # matches nothing, like any() over an empty list
+    # Longest first so shared prefixes don't shadow each other
+    return re.compile('|'.join(re.escape(t) for t in sorted(set(terms), key=len, reverse=True)))
+
+
+_NON_US_RE = term_pattern(tuple(NON_US_PATTERNS))
+_NON_MA_RE = term_pattern(tuple(NON_MA_STATES))
+_LISTING_NON_MA_RE = term_pattern(tuple(LISTING_NON_MA_STATES))
+_LISTING_NON_US_REMOTE_RE = term_pattern(tuple(LISTING_NON_US_REMOTE))
+_UNAMBIGUOUS_RE = term_pattern(tuple(BOSTON_LOCATIONS_UNAMBIGUOUS))
+_AMBIGUOUS_RE = term_pattern(tuple(BOSTON_LOCATIONS_AMBIGUOUS))
+_MA_RE = term_pattern(tuple(MA_MARKERS))
+_REMOTE_EXCLUDED_RE = term_pattern(tuple(REMOTE_EXCLUDED_CITIES))
+_REMOTE_RE = term_pattern(tuple(REMOTE_KEYWORDS))
+
+# ---------- Classifiers ----------
+def is_relevant_location(location: str) -> bool:
+    """
+    Check if a location is relevant (Boston area or US remote).
+    Returns True for Boston area locations and US remote positions.
+    Returns False for non-US remote and other locations.
+    """
+    return _classify_relevant(location.lower().strip())
+
+
+@lru_cache(maxsize=65536)
+def _classify_relevant(location_lower: str) -> bool:
+    # First, exclude non-US countries and other US states explicitly
+    if _NON_US_RE.search(location_lower) or _NON_MA_RE.search(location_lower):
+        return False
+
+    # Unambiguous Boston area locations (only exist in MA)
+    if _UNAMBIGUOUS_RE.search(location_lower):
+        return True
+
+    # Ambiguous city names require MA/Massachusetts (rejects "Newton, IA", "Burlington, VT")
+    if _AMBIGUOUS_RE.search(location_lower):
+        return _MA_RE.search(location_lower) is not None
+
+    # Remote (generic) or Remote in USA
+    if location_lower == 'remote' or 'remote in usa' in location_lower or 'remote in us' in location_lower:
+        return True
+
+    # Remote (no location) or US-specific remote
+    return location_lower.startswith('remote') and 'in' not in location_lower
+
+
+def listing_matches_location(location: str, include_remote: bool = True) -> bool:
+    """Check if a listing's (already formatted) location is Boston area or US remote."""
+    return _classify_listing(location.lower(), include_remote)
+
+
+def listing_key_matches_location(location_lower: str, include_remote: bool = True) -> bool:
+    """listing_matches_location for a location that is already lower-cased."""
+    return _classify_listing(location_lower, include_remote)
+
+
+@lru_cache(maxsize=65536)
+def _classify_listing(location_lower: str, include_remote: bool) -> bool:
+    # Exclude other US states explicitly (not MA)
+    if _LISTING_NON_MA_RE.search(location_lower):
+        return False
+
+    # Remote, as long as it's US remote rather than international
+    if include_remote and "remote" in location_lower:
+        if "remote in usa" in location_lower or "remote in us" in location_lower:
+            return True
+        if location_lower == "remote":
+            return True
+        if location_lower.startswith('remote') and 'in' not in location_lower:
+            return True
+        if _LISTING_NON_US_REMOTE_RE.search(location_lower):
+            return False
+
+    if _UNAMBIGUOUS_RE.search(location_lower):
+        return True
+
+    # Ambiguous city names require MA/Massachusetts
+    if _AMBIGUOUS_RE.search(location_lower):
+        return _MA_RE.search(location_lower) is not None
+
+    return False
+
+
+def matches_boston_area(location: str, boston_locations: Iterable[str], include_remote: bool) -> bool:
+    """
+    Config-driven check used by job_report: any configured Boston-area city,
+    or (with include_remote) a remote location not tied to another US city.
+    """
+    return _classify_boston_area((location or "").lower(), tuple(boston_locations), include_remote)
+
+
+@lru_cache(maxsize=65536)
+def _classify_boston_area(location_lower: str, boston_locations: Tuple[str, ...], include_remote: bool) -> bool:
+    if term_pattern(boston_locations).search(location_lower):
+        return True
+    if include_remote:
+        # If it contains a non-MA city/state, reject it
+        if _REMOTE_EXCLUDED_RE.search(location_lower):
+            return False
+        if _REMOTE_RE.search(location_lower):
+            return True
+    return False
+
+
+# ---------- Normalization ----------
+US_STATE_NAMES = [
+    'Alabama', 'Alaska', 'Arizona', 'Arkansas', 'California', 'Colorado', 'Connecticut',
+    'Delaware', 'Florida', 'Georgia', 'Hawaii', 'Idaho', 'Illinois', 'Indiana', 'Iowa',
+    'Kansas', 'Kentucky', 'Louisiana', 'Maine', 'Maryland', 'Massachusetts', 'Michigan',
+    'Minnesota', 'Mississippi', 'Missouri', 'Montana', 'Nebraska', 'Nevada', 'New Hampshire',
+    'New Jersey', 'New Mexico', 'New York', 'North Carolina', 'North Dakota', 'Ohio',
+    'Oklahoma', 'Oregon', 'Pennsylvania', 'Rhode Island', 'South Carolina', 'South Dakota',
+    'Tennessee', 'Texas', 'Utah', 'Vermont', 'Virginia', 'Washington', 'West Virginia',
+    'Wisconsin', 'Wyoming', 'District of Columbia'
+]
+
+COUNTRY_NAMES = [
+    'USA', 'US', 'United States', 'UK', 'United Kingdom', 'Canada', 'India', 'Mexico',
+    'Europe', 'Australia', 'Brazil', 'Israel', 'China', 'Japan', 'Singapore', 'Germany',
+    'France', 'Netherlands', 'Spain', 'Italy', 'Ireland'
+]
+
+# "3 locations" prefix of a collapsed multi-location cell: a count, not a place
+_COUNT_PREFIX_RE = re.compile(r'^\s*\d+\s+locations?')
+
+# Every place one location ends and the next begins. Cells scraped from
+# <br>-separated HTML arrive with the locations glued together
+# ("New York, NYBoston, MARemote in USA"), so besides the explicit separators
+# this splits where a word runs into a capitalized one (three lowercase letters
+# first, so "McLean" and "DeKalb" survive), where a state code or "USA" runs
+# into the next place, where a word runs into a bare state code ("BostonMA"),
+# and where a state code is followed by the next city after a space
+# ("Boston, MA Cambridge, MA").
+_SEGMENT_BOUNDARY_RE = re.compile('|'.join([
+    r'\s*[,;]\s*',
+    r'(?<=[a-z]{3})(?=[A-Z][a-z])',
+    r'(?<=\b[A-Z]{2})(?=[A-Z][a-z])',
+    r'(?<=\b[A-Z]{3})(?=[A-Z][a-z])',
+    r'(?<=[a-z]{2})(?=[A-Z]{2}(?![A-Za-z]))',
+    r'(?<=\b[A-Z]{2})\s+(?=[A-Z][a-z])',
+]))
+
+_STATE_CODE_RE = re.compile(r'^[A-Z]{2}$')
+_NOTE_RE = re.compile(r'\s*\([^)]*\)$')
+_STATE_NAMES = frozenset(s.lower() for s in US_STATE_NAMES)
+_COUNTRY_NAMES = frozenset(c.lower() for c in COUNTRY_NAMES)
+
+_PLACE, _STATE_NAME, _STATE_CODE, _COUNTRY = range(4)
+
+
+def _part_kind(part: str) -> int:
+    # "MA (+4 other locations)" is a state code carrying our own overflow note
+    part = _NOTE_RE.sub('', part)
+    part_lower = part.lower()
+    if part_lower in _COUNTRY_NAMES:
+        return _COUNTRY
+    if _STATE_CODE_RE.match(part):
+        return _STATE_CODE
+    if part_lower in _STATE_NAMES:
+        return _STATE_NAME
+    return _PLACE
+
+
+def _attaches(kind: int, last_kind: int) -> bool:
+    """Whether a part of `kind` qualifies the location before it."""
+    if kind == _COUNTRY:
+        return last_kind != _COUNTRY
+    if kind == _STATE_CODE:
+        # Also after a state name: "New York, NY" and "Washington, DC" are cities
+        return last_kind != _STATE_CODE
+    if kind == _STATE_NAME:
+        return last_kind == _PLACE
+    return False
+
+
+@lru_cache(maxsize=65536)
+def tokenize_locations(location: str) -> Tuple[str, ...]:
+    """
+    Split a raw location cell into its locations.
+
+    The cell is cut at every boundary in one pass, then states ("MA",
+    "Massachusetts") and countries are attached to the place they qualify,
+    so "Toronto, ON, Canada" stays one location while
+    "NHMississippiTennessee" becomes three.
+    """
+    text = _COUNT_PREFIX_RE.sub('', location, count=1)
+    locations = []
+    last_kind = None
+    for part in _SEGMENT_BOUNDARY_RE.split(text):
+        part = part.strip()
+        if not part:
+            continue
+        kind = _part_kind(part)
+        if locations and _attaches(kind, last_kind):
+            locations[-1] = f"{locations[-1]}, {part}"
+        else:
+            locations.append(part)
+        last_kind = kind
+    return tuple(locations)
+
+
+def _unique(locations):
+    """Drop case-insensitive duplicates, keeping the first occurrence."""
+    seen = set()
+    unique_locations = []
+    for loc in locations:
+        loc_lower = loc.lower()
+        if loc_lower not in seen:
+            seen.add(loc_lower)
+            unique_locations.append(loc)
+    return unique_locations
+
+
+def split_locations(location: str) -> List[str]:
+    """Tokenize a raw location string into distinct locations."""
+    return _unique(tokenize_locations(location))
+
+
+@lru_cache(maxsize=65536)
+def format_location(location: str, max_locations: int = 3, max_length: int = 50,
+                    overflow_format: str = '<br>+{} more') -> str:
+    """Format location string with proper separators and truncation."""
+    if not location:
+        return location
+
+    locations = split_locations(location)
+    if not locations:
+        # Nothing but a "N locations" count
+        return location.strip()
+
+    # If too many locations or too long, truncate and note how many were dropped
+    if len(locations) > max_locations or len(', '.join(locations)) > max_length:
+        kept_locations = []
+        total_length = 0
+
+        for loc in locations[:max_locations]:
+            if total_length + len(loc) > max_length and kept_locations:
+                break
+            kept_locations.append(loc)
+            total_length += len(loc) + 2
+
+        result = ', '.join(kept_locations)
+
+        if len(locations) > len(kept_locations):
+            result += overflow_format.format(len(locations) - len(kept_locations))
+
+        return result
+
+    return ', '.join(locations)
+
+
+@lru_cache(maxsize=65536)
+def format_relevant_location(location: str) -> str:
+    """
+    Format location string with proper separators, filtering, and truncation.
+
+    Only Boston-area and US-remote locations are kept; returns "" if none are
+    left (the job should then be dropped).
+    """
+    if not location:
+        return location
+
+    # Keep only relevant locations (Boston area or US remote)
+    locations = _unique(loc for loc in tokenize_locations(location) if is_relevant_location(loc))
+    if not locations:
+        return ""
+
+    if len(locations) > 4:
+        # E.g., "Boston, MA (+3 other locations)"
+        return f"{locations[0]} (+{len(locations)-1} other location{'s' if len(locations) > 2 else ''})"
+    # For 2-4 locations, show them all compactly
+    return '; '.join(locations)
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the external APIs the scrapers call, for offline testing.
+
+Serves, under one base URL:
+
+    /search.json                                    SerpAPI search
+    /greenhouse/v1/boards/<slug>/jobs[/<id>]        Greenhouse boards API
+    /lever/v0/postings/<slug>                       Lever postings API
+    /adzuna/v1/api/jobs/<country>/search/<page>     Adzuna search
+    /github/<owner>/<repo>/<branch>/README.md       raw.githubusercontent.com
+    /_stats                                         request counters
+
+Every response is synthetic and deterministic. SerpAPI queries return board
+links drawn from a fixed pool of fake company slugs; every board slug exists
+and holds around --board-size postings (a mix of internships and other
+roles across Boston, remote and elsewhere); Adzuna reports --adzuna-results
+results, newest first; the GitHub READMEs are bench_pipeline's synthetic
+SimplifyJobs/markdown tables with --readme-rows rows and an ETag.
+
+Each API has its own rate limit: beyond --qps requests per second it answers
+429 with Retry-After. --error-rate answers that share of requests with 500,
+and --latency adds a fixed delay to every response. Point the scrapers at it
+with the environment variables printed on startup (see mock_env).
+
+Usage:
+    python mock_server.py --port 8765 --qps 5 --latency 0.2
+    SERPAPI_ENDPOINT=http://127.0.0.1:8765/search.json SERPAPI_KEY=test \\
+        python discover_slugs.py --max 40
+    python mock_server.py --board-size 40 --error-rate 0.01    # then see load_test.py
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from bench_pipeline import LOCATIONS, ROLES, markdown_readme, simplify_readme
+
+SLUG_POOL_SIZE = 200
+BOARD_SIZE = 20          # average postings per Greenhouse/Lever board
+ADZUNA_RESULTS = 500     # results Adzuna reports for any search
+ADZUNA_SPAN_DAYS = 14    # Adzuna results are spread over this many days, newest first
+README_ROWS = 2000       # rows per synthetic GitHub README
+OTHER_ROLES = ["Senior Software Engineer", "Account Executive", "Staff Data Scientist",
+               "Engineering Manager", "Product Designer", "Recruiter"]
+INTERN_SHARE = 0.3       # share of board postings that are internships
+
+Response = Tuple[int, Dict[str, str], Any]
+
+
+class MockState:
+    """Settings and counters shared by every request handler."""
+
+    def __init__(self, qps: float = 0.0, latency: float = 0.0, slug_pool: int = SLUG_POOL_SIZE,
+                 board_size: int = BOARD_SIZE, error_rate: float = 0.0, retry_after: int = 1,
+                 adzuna_results: int = ADZUNA_RESULTS, readme_rows: int = README_ROWS, seed: int = 0):
+        self.qps = qps
+        self.latency = latency
+        self.slug_pool = slug_pool
+        self.board_size = board_size
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.adzuna_results = adzuna_results
+        self.readme_rows = readme_rows
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.windows: Dict[str, Tuple[float, int]] = {}
+        self.requests: Dict[str, int] = {}
+        self.rate_limited = 0
+        self.errors = 0
+
+    def over_limit(self, api: str) -> bool:
+        """Fixed one-second window per API: True once more than qps requests arrived in it."""
+        if not self.qps:
+            return False
+        with self.lock:
+            now = time.monotonic()
+            start, count = self.windows.get(api, (now, 0))
+            if now - start >= 1.0:
+                start, count = now, 0
+            self.windows[api] = (start, count + 1)
+            if count + 1 > self.qps:
+                self.rate_limited += 1
+                return True
+            return False
+
+    def should_fail(self) -> bool:
+        if not self.error_rate:
+            return False
+        with self.lock:
+            if self.rng.random() < self.error_rate:
+                self.errors += 1
+                return True
+            return False
+
+    def count(self, api: str) -> None:
+        with self.lock:
+            self.requests[api] = self.requests.get(api, 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            return {"requests": dict(self.requests), "rate_limited": self.rate_limited, "errors": self.errors}
+
+
+def mock_env(base_url: str) -> Dict[str, str]:
+    """Environment variables that point every scraper at a mock server."""
+    return {
+        "SERPAPI_ENDPOINT": f"{base_url}/search.json",
+        "GREENHOUSE_API": f"{base_url}/greenhouse/v1/boards",
+        "LEVER_API": f"{base_url}/lever/v0/postings",
+        "ADZUNA_API": f"{base_url}/adzuna/v1/api/jobs/us/search",
+        "GITHUB_RAW": f"{base_url}/github",
+    }
+
+
+# ---------- Synthetic data ----------
+def _seed(*parts: Any) -> int:
+    return int(hashlib.sha1(":".join(map(str, parts)).encode("utf-8")).hexdigest()[:12], 16)
+
+
+@lru_cache(maxsize=4096)
+def board_postings(seed: int, slug: str, board_size: int) -> Tuple[Dict[str, Any], ...]:
+    """Provider-neutral postings of one board: id, title, location, posted, description."""
+    rng = random.Random(_seed(seed, slug))
+    today = datetime.now(timezone.utc).replace(microsecond=0)
+    count = rng.randint(board_size // 2, board_size + board_size // 2) if board_size else 0
+    postings = []
+    for i in range(count):
+        intern = rng.random() < INTERN_SHARE
+        title = rng.choice(ROLES) if intern else rng.choice(OTHER_ROLES)
+        postings.append({
+            "id": _seed(seed, slug, i) % 10_000_000,
+            "title": title,
+            "location": rng.choice(LOCATIONS),
+            "posted": today - timedelta(hours=rng.randint(0, 24 * 60)),
+            "description": f"<p>{slug} is hiring a {title}. {'This is a summer internship.' if intern else ''}</p>",
+        })
+    return tuple(postings)
+
+
+@lru_cache(maxsize=16)
+def github_readme(seed: int, owner: str, rows: int) -> str:
+    rng = random.Random(_seed(seed, owner))
+    if owner == "SimplifyJobs":
+        return simplify_readme(rng, rows)
+    return markdown_readme(rng, rows, offset=_seed(owner) % 100_000)
+
+
+# ---------- Routes ----------
+def serpapi_search(state: MockState, params: Dict[str, str]) -> Response:
+    query = params.get("q", "")
+    num = int(params.get("num", "10") or 10)
+    host = "jobs.lever.co" if "site:jobs.lever.co" in query else "boards.greenhouse.io"
+    seed = int(hashlib.sha1(query.encode("utf-8")).hexdigest(), 16)
+    results: List[Dict[str, Any]] = []
+    for position in range(min(num, 100)):
+        slug = f"company{(seed >> position) % state.slug_pool:03d}"
+        results.append({
+            "position": position + 1,
+            "title": f"Jobs at {slug}",
+            "link": f"https://{host}/{slug}/jobs/{seed % 10_000_000 + position}",
+        })
+    return 200, {}, {"search_parameters": {"q": query, "num": num}, "organic_results": results}
+
+
+def greenhouse_board(state: MockState, params: Dict[str, str], slug: str) -> Response:
+    content = params.get("content") == "true"
+    jobs = []
+    for p in board_postings(state.seed, slug, state.board_size):
+        job = {
+            "id": p["id"],
+            "title": p["title"],
+            "absolute_url": f"https://boards.greenhouse.io/{slug}/jobs/{p['id']}",
+            "location": {"name": p["location"]},
+            "updated_at": p["posted"].isoformat(),
+        }
+        if content:
+            job["content"] = p["description"]
+        jobs.append(job)
+    return 200, {}, {"jobs": jobs, "meta": {"total": len(jobs)}}
+
+
+def greenhouse_job(state: MockState, params: Dict[str, str], slug: str, job_id: str) -> Response:
+    for p in board_postings(state.seed, slug, state.board_size):
+        if str(p["id"]) == job_id:
+            return 200, {}, {"id": p["id"], "title": p["title"], "content": p["description"]}
+    return 404, {}, {"status": 404, "error": "Job not found"}
+
+
+def lever_postings(state: MockState, params: Dict[str, str], slug: str) -> Response:
+    return 200, {}, [{
+        "id": f"{p['id']:08x}-mock",
+        "text": p["title"],
+        "hostedUrl": f"https://jobs.lever.co/{slug}/{p['id']:08x}-mock",
+        "categories": {"location": p["location"], "commitment": "Intern" if "Intern" in p["title"] else "Full-time"},
+        "createdAt": int(p["posted"].timestamp() * 1000),
+        "descriptionPlain": re.sub(r"<[^>]+>", "", p["description"]),
+    } for p in board_postings(state.seed, slug, state.board_size)]
+
+
+def adzuna_search(state: MockState, params: Dict[str, str], country: str, page: str) -> Response:
+    """
+    Newest first; each query draws its results from a shared pool, so shards
+    overlap. Like Adzuna's, redirect URLs carry a per-search tracking
+    parameter, so only the id identifies an ad across searches.
+    """
+    per_page = int(params.get("results_per_page", "10") or 10)
+    query = "|".join(params.get(k, "") for k in ("what", "what_or", "category", "where"))
+    rng = random.Random(_seed(state.seed, query, page))
+    tracking = _seed(state.seed, query) % 10 ** 8
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    step = timedelta(days=ADZUNA_SPAN_DAYS) / max(1, state.adzuna_results)
+    first = (int(page) - 1) * per_page
+    results = []
+    for k in range(first, min(first + per_page, state.adzuna_results)):
+        ad_id = rng.randrange(state.adzuna_results * 2)
+        title = rng.choice(ROLES) if rng.random() < 0.5 else rng.choice(OTHER_ROLES)
+        results.append({
+            "id": str(ad_id),
+            "title": title,
+            "redirect_url": f"https://www.adzuna.com/land/ad/{ad_id}?se={tracking:08d}",
+            "created": (now - step * k).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "company": {"display_name": f"Adzuna Company {ad_id % 500:03d}"},
+            "location": {"display_name": rng.choice(LOCATIONS)},
+            "description": f"{title} role.",
+        })
+    return 200, {}, {"count": state.adzuna_results, "results": results}
+
+
+def github_raw(state: MockState, params: Dict[str, str], owner: str, repo: str, branch: str) -> Response:
+    body = github_readme(state.seed, owner, state.readme_rows)
+    return 200, {"Content-Type": "text/plain; charset=utf-8"}, body
+
+
+def stats(state: MockState, params: Dict[str, str]) -> Response:
+    return 200, {}, state.stats()
+
+
+# (path pattern, API name for counters and rate limits or None if unlimited, handler)
+ROUTES: List[Tuple["re.Pattern[str]", Optional[str], Callable[..., Response]]] = [
+    (re.compile(r"/search\.json"), "serpapi", serpapi_search),
+    (re.compile(r"/greenhouse/v1/boards/([^/]+)/jobs"), "greenhouse", greenhouse_board),
+    (re.compile(r"/greenhouse/v1/boards/([^/]+)/jobs/([^/]+)"), "greenhouse", greenhouse_job),
+    (re.compile(r"/lever/v0/postings/([^/]+)"), "lever", lever_postings),
+    (re.compile(r"/adzuna/v1/api/jobs/([^/]+)/search/(\d+)"), "adzuna", adzuna_search),
+    (re.compile(r"/github/([^/]+)/([^/]+)/([^/]+)/README\.md"), "github", github_raw),
+    (re.compile(r"/_stats"), None, stats),
+]
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    state: MockState = MockState()
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real APIs
+
+    def do_GET(self) -> None:
+        parts = urlsplit(self.path)
+        for pattern, api, handler in ROUTES:
+            match = pattern.fullmatch(parts.path)
+            if match:
+                break
+        else:
+            self.send_body(404, {}, {"error": "not found"})
+            return
+        if api:
+            self.state.count(api)
+            if self.state.over_limit(api):
+                self.send_body(429, {"Retry-After": str(self.state.retry_after)}, {"error": "rate limited"})
+                return
+        if self.state.latency:
+            time.sleep(self.state.latency)
+        if api and self.state.should_fail():
+            self.send_body(500, {}, {"error": "synthetic failure"})
+            return
+        params = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        self.send_body(*handler(self.state, params, *match.groups()))
+
+    def send_body(self, status: int, headers: Dict[str, str], body: Any) -> None:
+        """Send str bodies as-is (with an ETag, honouring If-None-Match) and anything else as JSON."""
+        headers = dict(headers)
+        if isinstance(body, str):
+            payload = body.encode("utf-8")
+            etag = '"' + hashlib.sha1(payload).hexdigest() + '"'
+            headers["ETag"] = etag
+            if status == 200 and self.headers.get("If-None-Match") == etag:
+                status, payload = 304, b""
+        else:
+            payload = json.dumps(body).encode("utf-8")
+            headers.setdefault("Content-Type", "application/json")
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def start_mock_server(port: int = 0, qps: float = 0.0, latency: float = 0.0,
+                      state: Optional[MockState] = None) -> Tuple[ThreadingHTTPServer, str]:
+    """Serve in a background thread; returns (server, base URL). Call server.shutdown() to stop."""
+    handler = type("BoundMockHandler", (MockHandler,), {"state": state or MockState(qps, latency)})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def add_mock_arguments(ap: argparse.ArgumentParser) -> None:
+    """Flags shared by this server and load_test.py."""
+    ap.add_argument("--qps", type=float, default=0.0, help="Requests per second per API before answering 429 (0 = unlimited)")
+    ap.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429")
+    ap.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    ap.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with 500")
+    ap.add_argument("--board-size", type=int, default=BOARD_SIZE, help="Average postings per Greenhouse/Lever board")
+    ap.add_argument("--adzuna-results", type=int, default=ADZUNA_RESULTS, help="Results reported per Adzuna search")
+    ap.add_argument("--readme-rows", type=int, default=README_ROWS, help="Rows per GitHub README")
+    ap.add_argument("--seed", type=int, default=0, help="Seed for the synthetic data")
+
+
+def state_from_args(args: argparse.Namespace) -> MockState:
+    return MockState(qps=args.qps, latency=args.latency, board_size=args.board_size, error_rate=args.error_rate,
+                     retry_after=args.retry_after, adzuna_results=args.adzuna_results,
+                     readme_rows=args.readme_rows, seed=args.seed)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Local stand-in for external job APIs")
+    ap.add_argument("--port", type=int, default=8765)
+    add_mock_arguments(ap)
+    args = ap.parse_args()
+
+    server, base_url = start_mock_server(args.port, state=state_from_args(args))
+    print(f"Mock server on {base_url}; Ctrl-C to stop. Point the scrapers at it with:")
+    for name, value in mock_env(base_url).items():
+        print(f"  export {name}={value}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        print(json.dumps(server.RequestHandlerClass.state.stats(), indent=2))
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Run every scraper in one process and render README.md once.
+
+The stages (Greenhouse/Lever, Adzuna, slug discovery, GitHub boards) run as
+functions against a single listing store connection, so they share one dedup
+index and one transaction. README.md is rendered exactly once at the end,
+already sorted, and the wall time of every stage is printed.
+
+Usage:
+    python pipeline.py --include-remote --config config/companies.yml
+    python pipeline.py --skip discover --skip adzuna
+    python pipeline.py --include-remote --record cassettes/today
+    python pipeline.py --include-remote --replay cassettes/today --replay-latency recorded
+"""
+
+import time
+
+_IMPORT_START = time.perf_counter()
+
+import argparse
+import os
+import sys
+import traceback
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+import adzuna_report
+import discover_slugs
+import http_cassette
+import http_client
+import job_report
+import simplify_scraper
+from listing_store import ListingStore
+from run_report import RunReport, StageTiming, add_profile_argument
+
+IMPORT_SECONDS = time.perf_counter() - _IMPORT_START
+
+# Narrower than adzuna_report's default query; this is what run_all.sh used
+ADZUNA_WHAT = 'intern systems OR infrastructure OR backend OR reliability OR compiler OR quant OR simulation OR modeling OR "data infrastructure" OR "ml systems"'
+
+STAGES = ["job_report", "adzuna", "discover", "simplify"]
+
+
+@dataclass
+class StageResult:
+    name: str
+    seconds: float
+    added: int = 0
+    skipped: int = 0
+    status: str = "ok"  # ok | skipped | failed
+
+
+def run_stage(name: str, fn: Callable[[], Optional[Tuple[int, int]]], report: RunReport) -> StageResult:
+    """Time one stage. fn returns (added, skipped) or None when the stage isn't configured."""
+    print(f"\n=== {name} ===")
+    start = time.perf_counter()
+    try:
+        with report.profiler.profile(name):
+            outcome = fn()
+    except Exception:
+        traceback.print_exc()
+        result = StageResult(name, time.perf_counter() - start, status="failed")
+    else:
+        elapsed = time.perf_counter() - start
+        result = StageResult(name, elapsed, status="skipped") if outcome is None else StageResult(name, elapsed, *outcome)
+    report.add_stage(StageTiming(name, result.seconds, rows_in=result.added + result.skipped,
+                                 rows_out=result.added, status=result.status))
+    return result
+
+
+def print_report(results: List[StageResult], total: float) -> None:
+    print(f"\n{'stage':<22} {'seconds':>8} {'added':>6} {'skipped':>8}  status")
+    print(f"{'imports':<22} {IMPORT_SECONDS:8.2f} {'':>6} {'':>8}  ok")
+    for r in results:
+        print(f"{r.name:<22} {r.seconds:8.2f} {r.added:6d} {r.skipped:8d}  {r.status}")
+    print(f"{'total':<22} {total:8.2f} {sum(r.added for r in results):6d} {sum(r.skipped for r in results):8d}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Run all scrapers in one process and render README.md once")
+    ap.add_argument("--config", default="config/companies.yml", help="Path to YAML config file")
+    ap.add_argument("--include-remote", action="store_true", help="Include remote U.S. roles (Greenhouse/Lever)")
+    ap.add_argument("--workers", type=int, default=job_report.DEFAULT_WORKERS,
+                    help="Number of Greenhouse/Lever companies fetched concurrently")
+    ap.add_argument("--adzuna-what", default=ADZUNA_WHAT, help="Adzuna search query")
+    ap.add_argument("--adzuna-location", default="Boston, MA", help="Adzuna search location")
+    ap.add_argument("--adzuna-sharded", action="store_true",
+                    help="Split --adzuna-what into smaller Adzuna queries run in parallel")
+    ap.add_argument("--stream-readmes", action="store_true",
+                    help="Parse each GitHub README while it downloads (simplify_scraper.py --stream)")
+    ap.add_argument("--discover-max", type=int, default=50, help="Max search queries for slug discovery")
+    ap.add_argument("--skip", action="append", choices=STAGES, default=[], help="Stage to skip (repeatable)")
+    ap.add_argument("--record", metavar="DIR", help="Save every HTTP response to a cassette directory")
+    ap.add_argument("--replay", metavar="DIR", help="Answer every HTTP request from a recorded cassette (no network)")
+    ap.add_argument("--replay-latency", default="0",
+                    help="Seconds added to each replayed response, or 'recorded' for the original timings")
+    add_profile_argument(ap)
+    args = ap.parse_args()
+    if args.record and args.replay:
+        ap.error("--record and --replay are mutually exclusive")
+
+    run_start = time.perf_counter()
+    report = RunReport("pipeline", profile_dir=args.profile)
+    if args.record or args.replay:
+        latency = args.replay_latency if args.replay_latency == "recorded" else float(args.replay_latency)
+        http_cassette.install(args.record or args.replay, "record" if args.record else "replay", latency)
+    # A cassette run must make the same requests when replayed, so it neither
+    # reads nor updates the caches and config that decide what gets requested
+    persist = http_cassette.install_from_env() is None
+    # The GitHub README validators are only saved once the store has been written
+    http_cache = simplify_scraper.load_http_cache() if persist else {}
+
+    with ListingStore() as store:
+        def greenhouse_lever():
+            cfg = job_report.load_config(args.config, args.include_remote, None)
+            jobs = job_report.collect_jobs(cfg, args.workers, report=report)
+            print(f"Found {len(jobs)} total jobs from {len(cfg.companies)} companies.")
+            return job_report.record_jobs(store, jobs)
+
+        def adzuna():
+            if not (os.environ.get("ADZUNA_APP_ID") and os.environ.get("ADZUNA_APP_KEY")):
+                print("ℹ️  Skipping Adzuna (set ADZUNA_APP_ID and ADZUNA_APP_KEY to enable)")
+                return None
+            fetch = adzuna_report.fetch_adzuna_sharded if args.adzuna_sharded else adzuna_report.fetch_adzuna
+            results = fetch(args.adzuna_what, args.adzuna_location, report=report)
+            return adzuna_report.record_jobs(store, results)
+
+        def discover():
+            api_key = os.environ.get("SERPAPI_KEY")
+            if not api_key:
+                print("ℹ️  Skipping slug discovery (set SERPAPI_KEY to enable)")
+                return None
+            cities = [c.strip() for c in discover_slugs.DEFAULT_CITIES.split(",")]
+            keywords = discover_slugs.DEFAULT_KEYWORDS.split()
+            query_stats = discover_slugs.load_query_stats() if persist else {}
+            slug_cache = discover_slugs.load_slug_cache() if persist else {}
+            known = discover_slugs.known_slugs(args.config, slug_cache)
+            plan, skipped = discover_slugs.plan_queries(
+                discover_slugs.build_queries(cities, keywords), query_stats, known, args.discover_max)
+            print(f"Query plan: {len(plan)} queries, {skipped} skipped as fully known")
+            search_cache = discover_slugs.SearchCache() if persist else None
+            gh_slugs, lever_slugs, boards = discover_slugs.discover_companies(
+                plan, api_key, slug_cache, search_cache=search_cache, query_stats=query_stats, known=known,
+                report=report)
+            if persist:
+                discover_slugs.save_slug_cache(slug_cache)
+                discover_slugs.save_query_stats(query_stats)
+                print(search_cache.summary())
+                total = discover_slugs.merge_companies(args.config, gh_slugs, lever_slugs)
+                print(f"Updated {args.config} with {total} total companies.")
+            jobs = discover_slugs.collect_jobs(gh_slugs, lever_slugs, boards, report)
+            return discover_slugs.record_jobs(store, jobs)
+
+        def github_boards():
+            all_jobs, _ = simplify_scraper.fetch_all_sources(http_cache, report=report, stream=args.stream_readmes,
+                                                             snapshots=persist)
+            all_jobs = simplify_scraper.deduplicate_across_sources(all_jobs)
+            filtered = simplify_scraper.filter_boston_remote(all_jobs, include_remote=True)
+            new_jobs = simplify_scraper.deduplicate_jobs(filtered, store)
+            return simplify_scraper.record_jobs(store, new_jobs), len(filtered) - len(new_jobs)
+
+        stages = [
+            ("job_report", "greenhouse/lever", greenhouse_lever),
+            ("adzuna", "adzuna", adzuna),
+            ("discover", "discover_slugs", discover),
+            ("simplify", "github boards", github_boards),
+        ]
+        results = [run_stage(label, fn, report) for key, label, fn in stages if key not in args.skip]
+
+        with report.stage("render README") as timing:
+            rendered = timing.rows_out = store.render_readme()
+        results.append(StageResult("render README", timing.seconds))
+
+    if persist and not any(r.name == "github boards" and r.status == "failed" for r in results):
+        simplify_scraper.save_http_cache(http_cache)
+    print(f"\n✅ README.md rendered once with {rendered} listings.")
+    print_report(results, time.perf_counter() - run_start + IMPORT_SECONDS)
+    http_client.record_connections(report)
+    report.save()
+    sys.exit(1 if any(r.status == "failed" for r in results) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Structured run reports for the scrapers.
+
+Each script records the wall time and rows in/out of its stages, the bytes
+it fetched per source, how long each company took and how many HTTP
+connections it opened per host, then appends the run
+to run_report.json next to README.md. Only the last KEEP_RUNS runs are kept,
+so consecutive nightly runs can be compared stage by stage.
+
+With --profile, every stage also runs under cProfile and tracemalloc (see
+Profiler): a .pstats file and the top allocation sites are written per stage.
+
+Usage:
+    python run_report.py               # stage times of recent runs, per script
+    python run_report.py --script job_report --last 5
+"""
+
+import argparse
+import cProfile
+import json
+import os
+import re
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+RUN_REPORT_PATH = os.environ.get(
+    "RUN_REPORT", os.path.join(os.path.dirname(__file__), "..", "run_report.json"))
+KEEP_RUNS = 50
+SLOWEST_COMPANIES = 10
+
+PROFILE_DIR = os.path.join(os.path.dirname(__file__), "..", ".cache", "profile")
+PROFILE_TOP_N = 25  # allocation sites listed per stage
+
+
+class Profiler:
+    """
+    Per-stage cProfile and tracemalloc capture, written under out_dir.
+
+    Each profiled stage produces <script>-<n>-<stage>.pstats (open with
+    `python -m pstats` or snakeviz) and <script>-<n>-<stage>.alloc.txt, the
+    top_n source lines by memory allocated during the stage plus its peak.
+    cProfile only sees the calling thread, so for stages that fan out to a
+    thread pool the pstats show the wait while allocations cover every thread.
+    Stages opened inside a profiled stage are part of its profile rather than
+    profiled again. With out_dir=None, profile() does nothing.
+    """
+
+    def __init__(self, out_dir: Optional[str], script: str, top_n: int = PROFILE_TOP_N):
+        self.out_dir = out_dir
+        self.script = script
+        self.top_n = top_n
+        self._count = 0
+        self._active = False
+
+    @contextmanager
+    def profile(self, name: str) -> Iterator[None]:
+        if not self.out_dir or self._active:
+            yield
+            return
+        os.makedirs(self.out_dir, exist_ok=True)
+        self._count += 1
+        base = os.path.join(self.out_dir, f"{self.script}-{self._count:02d}-{re.sub(r'[^A-Za-z0-9]+', '_', name).strip('_')}")
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        if hasattr(tracemalloc, "reset_peak"):
+            # Python 3.9+; before that the peak of an already-running trace
+            # covers everything since tracing started
+            tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+        profiler = cProfile.Profile()
+        self._active = True
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            self._active = False
+            after = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            if started_tracing:
+                tracemalloc.stop()
+            profiler.dump_stats(base + ".pstats")
+            self._write_allocations(base + ".alloc.txt", name, before, after, peak)
+            print(f"🔬 Profiled {name}: {base}.pstats (peak {peak / 1e6:.1f} MB)")
+
+    def _write_allocations(self, path: str, name: str, before: tracemalloc.Snapshot,
+                           after: tracemalloc.Snapshot, peak: int) -> None:
+        ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        diff = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), "lineno")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f"# {self.script}: {name}\n# peak traced memory {peak / 1e6:.1f} MB\n")
+            f.write(f"# top {self.top_n} allocation sites (net size, count)\n")
+            for stat in diff[:self.top_n]:
+                frame = stat.traceback[0]
+                f.write(f"{stat.size_diff / 1024:10.1f} KiB {stat.count_diff:+9d}  {frame.filename}:{frame.lineno}\n")
+
+
+def add_profile_argument(ap: argparse.ArgumentParser) -> None:
+    """Add the shared --profile [DIR] flag."""
+    ap.add_argument("--profile", nargs="?", const=PROFILE_DIR, default=None, metavar="DIR",
+                    help=f"Write cProfile stats and allocation sites per stage to DIR (default {PROFILE_DIR})")
+
+
+@dataclass
+class StageTiming:
+    name: str
+    seconds: float = 0.0
+    rows_in: Optional[int] = None
+    rows_out: Optional[int] = None
+    status: str = "ok"  # ok | skipped | failed
+
+
+class RunReport:
+    """Timings and counters for one run of one script. Safe to update from worker threads."""
+
+    def __init__(self, script: str, path: str = RUN_REPORT_PATH, keep: int = KEEP_RUNS,
+                 slowest: int = SLOWEST_COMPANIES, profile_dir: Optional[str] = None):
+        self.script = script
+        self.profiler = Profiler(profile_dir, script)
+        self.path = path
+        self.keep = keep
+        self.slowest = slowest
+        self.started = datetime.now(timezone.utc)
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+        self.stages: List[StageTiming] = []
+        self.bytes_by_source: Dict[str, int] = {}
+        self.company_seconds: Dict[str, float] = {}
+        self.connections: Dict[str, Dict[str, int]] = {}  # host -> requests, connections (http_client)
+
+    @contextmanager
+    def stage(self, name: str, rows_in: Optional[int] = None) -> Iterator[StageTiming]:
+        """Time the body as one stage; set rows_in/rows_out on the yielded record."""
+        timing = StageTiming(name, rows_in=rows_in)
+        start = time.perf_counter()
+        try:
+            with self.profiler.profile(name):
+                yield timing
+        except BaseException:
+            timing.status = "failed"
+            raise
+        finally:
+            timing.seconds = time.perf_counter() - start
+            self.add_stage(timing)
+
+    def add_stage(self, timing: StageTiming) -> None:
+        with self._lock:
+            self.stages.append(timing)
+
+    def add_bytes(self, source: str, nbytes: int) -> None:
+        with self._lock:
+            self.bytes_by_source[source] = self.bytes_by_source.get(source, 0) + nbytes
+
+    def add_company(self, company: str, seconds: float) -> None:
+        with self._lock:
+            self.company_seconds[company] = self.company_seconds.get(company, 0.0) + seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        slowest = sorted(self.company_seconds.items(), key=lambda kv: kv[1], reverse=True)[:self.slowest]
+        return {
+            "script": self.script,
+            "started": self.started.isoformat(timespec="seconds"),
+            "wall_seconds": round(time.perf_counter() - self._start, 3),
+            "stages": [{**asdict(s), "seconds": round(s.seconds, 3)} for s in self.stages],
+            "bytes_by_source": dict(sorted(self.bytes_by_source.items())),
+            "slowest_companies": [{"company": c, "seconds": round(s, 3)} for c, s in slowest],
+            "connections": self.connections,
+        }
+
+    def save(self) -> None:
+        """Append this run to the report file, dropping all but the last `keep` runs."""
+        runs = load_runs(self.path)
+        runs.append(self.to_dict())
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"runs": runs[-self.keep:]}, f, indent=2)
+                f.write("\n")
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠️  Could not write run report: {e}")
+
+
+def load_runs(path: str = RUN_REPORT_PATH) -> List[Dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            runs = json.load(f).get("runs", [])
+        return runs if isinstance(runs, list) else []
+    except (OSError, ValueError, AttributeError):
+        return []
+
+
+def print_trend(runs: List[Dict[str, Any]]) -> None:
+    """One row per run, one column per stage (seconds)."""
+    stages = list(dict.fromkeys(s["name"] for run in runs for s in run.get("stages", [])))
+    print(f"{'started':<26} {'wall':>7}  " + "  ".join(f"{name[:14]:>14}" for name in stages))
+    for run in runs:
+        seconds = {s["name"]: s["seconds"] for s in run.get("stages", [])}
+        cells = "  ".join(f"{seconds[name]:14.2f}" if name in seconds else f"{'-':>14}" for name in stages)
+        print(f"{run.get('started', ''):<26} {run.get('wall_seconds', 0):7.1f}  {cells}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Show stage timings from recent runs")
+    ap.add_argument("--path", default=RUN_REPORT_PATH, help="Run report file")
+    ap.add_argument("--script", help="Only runs of this script")
+    ap.add_argument("--last", type=int, default=10, help="Number of runs to show")
+    args = ap.parse_args()
+
+    runs = [r for r in load_runs(args.path) if not args.script or r.get("script") == args.script]
+    if not runs:
+        raise SystemExit(f"No runs recorded in {args.path}")
+    for script in dict.fromkeys(r.get("script") for r in runs):
+        script_runs = [r for r in runs if r.get("script") == script][-args.last:]
+        print(f"\n{script}")
+        print_trend(script_runs)
+        latest = script_runs[-1]
+        if latest.get("bytes_by_source"):
+            print("Bytes fetched (latest run): " + ", ".join(
+                f"{source} {nbytes / 1024:.1f} KB" for source, nbytes in latest["bytes_by_source"].items()))
+        if latest.get("slowest_companies"):
+            print("Slowest companies (latest run): " + ", ".join(
+                f"{c['company']} {c['seconds']:.1f}s" for c in latest["slowest_companies"]))
+        if latest.get("connections"):
+            print("Connections (latest run): " + ", ".join(
+                f"{host} {s['requests']} requests/{s['connections']} opened" for host, s in latest["connections"].items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -11,223 +11,810 @@ Sources:
 
 Usage:
     python simplify_scraper.py --out ./reports
+    python simplify_scraper.py --stream      # parse READMEs while they download
+    python simplify_scraper.py --no-snapshots  # re-parse every row from scratch
 """
 
 import argparse
 import datetime as dt
+import functools
+import hashlib
+import html
+import json
 import logging
 import os
+import pickle
 import re
 import sys
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass
+import time
+import zlib
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Tuple
 
 import requests
 from bs4 import BeautifulSoup
 
+import http_cassette
+import http_client
+from http_client import HTTP
+from listing_store import MATCH_TITLE, ListingStore
+from run_report import RunReport, add_profile_argument
+from locations import (
+    BOSTON_LOCATIONS_AMBIGUOUS,
+    BOSTON_LOCATIONS_UNAMBIGUOUS,
+    format_relevant_location as format_location,
+    listing_key_matches_location,
+    term_pattern,
+)
+
 # ---------- Logging ----------
 logging.basicConfig(
     level=os.environ.get("LOGLEVEL", "INFO"),
     format="%(levelname)s: %(message)s"
 )
 
+http_cassette.install_from_env()
+
 # ---------- Constants ----------
-# GitHub repo sources (URL, branch, owner credit)
+# GitHub repo sources (URL, branch, owner credit, table format for --stream);
+# GITHUB_RAW points them at a mirror or mock_server.py
+GITHUB_RAW = os.environ.get("GITHUB_RAW", "https://raw.githubusercontent.com")
 GITHUB_SOURCES = [
     {
         "name": "SimplifyJobs",
-        "url": "https://raw.githubusercontent.com/SimplifyJobs/Summer2026-Internships/dev/README.md",
+        "url": f"{GITHUB_RAW}/SimplifyJobs/Summer2026-Internships/dev/README.md",
         "owner": "SimplifyJobs",
-        "repo": "Summer2026-Internships"
+        "repo": "Summer2026-Internships",
+        "format": "html"
     },
     {
         "name": "SpeedyApply",
-        "url": "https://raw.githubusercontent.com/speedyapply/2026-SWE-College-Jobs/main/README.md",
+        "url": f"{GITHUB_RAW}/speedyapply/2026-SWE-College-Jobs/main/README.md",
         "owner": "speedyapply",
-        "repo": "2026-SWE-College-Jobs"
+        "repo": "2026-SWE-College-Jobs",
+        "format": "markdown"
     },
     {
         "name": "vanshb03",
-        "url": "https://raw.githubusercontent.com/vanshb03/Summer2026-Internships/main/README.md",
+        "url": f"{GITHUB_RAW}/vanshb03/Summer2026-Internships/main/README.md",
         "owner": "vanshb03",
-        "repo": "Summer2026-Internships"
+        "repo": "Summer2026-Internships",
+        "format": "markdown"
     }
 ]
 
-# Boston area cities that are unambiguous (only in MA)
-BOSTON_LOCATIONS_UNAMBIGUOUS = [
-    "boston", "cambridge", "somerville", "lexington", "needham", 
-    "waltham", "watertown", "brookline", "quincy", "norwood",
-    "framingham", "lowell", "worcester", "andover",
-    "marlborough", "peabody", "dedham", "acton", "bedford",
-    "pittsfield", "fall river", "attleboro", "westborough",
-    "massachusetts", " ma ", ", ma"
-]
+# --stream reads README responses in chunks of this many bytes
+STREAM_CHUNK_BYTES = 64 * 1024
+
+# On-disk HTTP validator cache (ETag / Last-Modified per source URL)
+HTTP_CACHE_PATH = os.path.join(os.path.dirname(__file__), "..", ".cache", "readme_http_cache.json")
 
-# Cities that exist in multiple states - require MA/Massachusetts to match
-BOSTON_LOCATIONS_AMBIGUOUS = [
-    "newton",      # Newton, MA vs Newton, IA
-    "burlington",  # Burlington, MA vs Burlington, VT
-    "lawrence"     # Lawrence, MA vs Lawrence, KS
+# Per-source snapshots of the raw README rows and their parsed listings (see parse_with_snapshot)
+SNAPSHOT_DIR = os.path.join(os.path.dirname(__file__), "..", ".cache", "snapshots")
+# Modules whose code decides what a row parses to; editing either invalidates every snapshot
+SNAPSHOT_CODE = ("simplify_scraper.py", "locations.py")
+
+# SimplifyJobs README sections to scrape (each holds one HTML table)
+SIMPLIFY_SECTIONS = [
+    '💻 Software Engineering Internship Roles',
+    '🤖 Data Science, AI & Machine Learning Internship Roles',
+    '📈 Quantitative Finance Internship Roles',
+    '🔧 Hardware Engineering Internship Roles'
 ]
 
 # ---------- Models ----------
-@dataclass
 class JobListing:
-    company: str
-    title: str
-    location: str
-    apply_url: str
-    date_posted: str
-    source: str = ""  # Which GitHub repo this came from
-    is_closed: bool = False
+    """
+    One scraped listing. Slotted rather than a dataclass, since runs hold tens
+    of thousands: no per-instance __dict__, the values repeated across
+    listings (company, title, location, date, source) are interned so equal
+    ones share one string, and the lowercase keys the filters compare are
+    computed once and interned too. location_key and dedupe_key are
+    read-only; assigning company, title or location recomputes them.
+    bench_memory.py measures the difference.
+    """
+    __slots__ = ("_company", "_title", "_location", "apply_url", "date_posted", "source", "is_closed",
+                 "_location_key", "_dedupe_key")
+    FIELDS = ("company", "title", "location", "apply_url", "date_posted", "source", "is_closed")
+    
+    def __init__(self, company: str, title: str, location: str, apply_url: str, date_posted: str,
+                 source: str = "", is_closed: bool = False):
+        self._company = sys.intern(company)
+        self._title = sys.intern(title)
+        self.location = location
+        self.apply_url = apply_url
+        self.date_posted = sys.intern(date_posted)
+        self.source = sys.intern(source)  # Which GitHub repo this came from
+        self.is_closed = is_closed
+        self._set_dedupe_key()
+    
+    def _set_dedupe_key(self) -> None:
+        # deduplicate_across_sources; the same job on several boards shares one key
+        self._dedupe_key = sys.intern(f"{self._company}|{self._title}".lower())
+    
+    @property
+    def company(self) -> str:
+        return self._company
+    
+    @company.setter
+    def company(self, value: str) -> None:
+        self._company = sys.intern(value)
+        self._set_dedupe_key()
+    
+    @property
+    def title(self) -> str:
+        return self._title
+    
+    @title.setter
+    def title(self, value: str) -> None:
+        self._title = sys.intern(value)
+        self._set_dedupe_key()
+    
+    @property
+    def location(self) -> str:
+        return self._location
+    
+    @location.setter
+    def location(self, value: str) -> None:
+        self._location = sys.intern(value)
+        self._location_key = sys.intern(value.lower())
+    
+    @property
+    def location_key(self) -> str:
+        return self._location_key
+    
+    @property
+    def dedupe_key(self) -> str:
+        return self._dedupe_key
+    
+    def astuple(self) -> tuple:
+        """Field values in constructor order; JobListing(*job.astuple()) rebuilds the listing."""
+        return tuple([getattr(self, name) for name in self.FIELDS])
+    
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.astuple() == other.astuple()
+    
+    __hash__ = None  # mutable and compared by value
+    
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS)
+        return f"JobListing({values})"
     
     def matches_location(self, include_remote: bool = True) -> bool:
         """Check if location matches Boston area or remote."""
-        # Use the same logic as is_relevant_location function
-        location_lower = self.location.lower()
-        
-        # Exclude other US states explicitly (not MA)
-        non_ma_states = [
-            ', ks', ', kansas', ', az', ', arizona', ', co', ', colorado',
-            ', vt', ', vermont', ', ia', ', iowa', ', ny', ', new york',
-            ', ca', ', california', ', tx', ', texas', ', fl', ', florida',
-            ', wa', ', washington', 'denver, colorado', 'tempe, az'
-        ]
-        for pattern in non_ma_states:
-            if pattern in location_lower:
-                return False
-        
-        # Check for remote
-        if include_remote and "remote" in location_lower:
-            # Make sure it's US remote, not international
-            if "remote in usa" in location_lower or "remote in us" in location_lower:
-                return True
-            if location_lower == "remote":
-                return True
-            if location_lower.startswith('remote') and 'in' not in location_lower:
-                return True
-            # If it says "remote in <country>", check if it's filtered out
-            non_us_remote = ['remote in uk', 'remote in canada', 'remote in india', 
-                           'remote in europe', 'remote in mexico']
-            for pattern in non_us_remote:
-                if pattern in location_lower:
-                    return False
-        
-        # Check for unambiguous Boston area locations
-        for loc in BOSTON_LOCATIONS_UNAMBIGUOUS:
-            if loc in location_lower:
-                return True
-        
-        # Check for ambiguous city names - require MA/Massachusetts
-        for city in BOSTON_LOCATIONS_AMBIGUOUS:
-            if city in location_lower:
-                # Only accept if it also contains MA or Massachusetts
-                if ', ma' in location_lower or ' ma' in location_lower or 'massachusetts' in location_lower:
-                    return True
-                # Otherwise reject
-                return False
-        
-        return False
+        return listing_key_matches_location(self.location_key, include_remote)
+
+
+def load_http_cache(path: str = HTTP_CACHE_PATH) -> Dict[str, Dict[str, str]]:
+    """Load stored ETag/Last-Modified validators keyed by source URL."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_http_cache(cache: Dict[str, Dict[str, str]], path: str = HTTP_CACHE_PATH) -> None:
+    """Persist validators so the next run can revalidate instead of re-downloading."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logging.warning(f"Could not save HTTP cache: {e}")
+
+
+class RowCache:
+    """
+    Parsed listing (or None, for skipped rows) per raw table row: `previous`
+    holds the rows of the last snapshot to reuse, `rows` collects the rows
+    of this parse for the next one.
+    """
+
+    def __init__(self, previous: Optional[Dict[str, Optional[JobListing]]] = None):
+        self.previous = previous or {}
+        self.rows: Dict[str, Optional[JobListing]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def parse(self, row: str, parse_row: Callable[[str], Optional[JobListing]]) -> Optional[JobListing]:
+        """parse_row(row), unless the previous snapshot already holds this exact row."""
+        if row in self.rows:
+            return self.rows[row]
+        if row in self.previous:
+            self.hits += 1
+            job = self.previous[row]
+        else:
+            self.misses += 1
+            job = parse_row(row)
+        self.rows[row] = job
+        return job
+
+
+@functools.lru_cache(maxsize=None)
+def snapshot_code_hash() -> str:
+    digest = hashlib.sha256()
+    for name in SNAPSHOT_CODE:
+        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), name), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def snapshot_key(source_name: str, parser: str = "fast", prefilter: bool = True) -> Dict[str, object]:
+    """
+    Everything besides the row text that a snapshot's parsed rows depend on.
+    Includes today's date because relative dates ("2d", "1w") parse against it.
+    """
+    return {
+        "code": snapshot_code_hash(),
+        "date": dt.date.today().isoformat(),
+        "source": source_name,
+        "parser": parser,
+        "prefilter": prefilter,
+    }
+
+
+def snapshot_path(source_name: str) -> str:
+    return os.path.join(SNAPSHOT_DIR, re.sub(r'[^\w.-]', '_', source_name) + ".snapshot")
+
+
+def load_snapshot(source_name: str, key: Dict[str, object]) -> Optional[Dict[str, object]]:
+    """
+    Load a source's snapshot as {"sha256", "listings", "rows"}. Returns None if
+    there is none, it can't be read, or it was taken under a different key.
+    """
+    try:
+        with open(snapshot_path(source_name), 'rb') as f:
+            data = pickle.loads(zlib.decompress(f.read()))
+    except FileNotFoundError:
+        return None
+    except Exception as e:  # truncated, corrupt or from an older format
+        logging.warning(f"Ignoring unreadable {source_name} snapshot: {e}")
+        return None
+    if not isinstance(data, dict) or data.get("key") != key:
+        return None
+
+    # Listings are stored as field tuples, each once however many rows share it
+    jobs: Dict[int, JobListing] = {}
+
+    def unpack(fields):
+        if fields is None:
+            return None
+        job = jobs.get(id(fields))
+        if job is None:
+            job = jobs[id(fields)] = JobListing(*fields)
+        return job
+
+    return {
+        "sha256": data["sha256"],
+        "listings": [unpack(fields) for fields in data["listings"]],
+        "rows": {row: unpack(fields) for row, fields in data["rows"].items()},
+    }
+
+
+def save_snapshot(source_name: str, key: Dict[str, object], sha256: Optional[str], jobs: List[JobListing],
+                  rows: Dict[str, Optional[JobListing]]) -> None:
+    """
+    Replace a source's snapshot with this body's hash, listings and parsed
+    rows (zlib-compressed pickle). sha256 is None when the whole body wasn't
+    read, so no later body is taken to match it.
+    """
+    packed: Dict[int, tuple] = {}
+
+    def pack(job):
+        if job is None:
+            return None
+        values = packed.get(id(job))
+        if values is None:
+            values = packed[id(job)] = job.astuple()
+        return values
+
+    data = {
+        "key": key,
+        "sha256": sha256,
+        "listings": [pack(job) for job in jobs],
+        "rows": {row: pack(job) for row, job in rows.items()},
+    }
+    path = snapshot_path(source_name)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(zlib.compress(pickle.dumps(data, pickle.HIGHEST_PROTOCOL), 1))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logging.warning(f"Could not save {source_name} snapshot: {e}")
+
+
+def request_readme(url: str, source_name: str, http_cache: Optional[Dict[str, Dict[str, str]]] = None,
+                   stream: bool = False) -> Optional[requests.Response]:
+    """
+    GET a README, sending If-None-Match/If-Modified-Since from http_cache.
 
+    Returns None on 304 Not Modified and raises requests.RequestException on
+    failure. With stream=True the body is left unread for iter_response_lines.
+    """
+    headers = {}
+    cached = (http_cache or {}).get(url, {})
+    if http_cache is not None:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    response = HTTP.get(url, headers=headers, timeout=30, stream=stream)
+    if response.status_code == 304:
+        response.close()
+        logging.info(f"{source_name} README not modified since last run")
+        return None
+    response.raise_for_status()
+    return response
+
+
+def store_validators(http_cache: Optional[Dict[str, Dict[str, str]]], url: str, response: requests.Response) -> None:
+    """Write the response's ETag/Last-Modified into http_cache for the next run."""
+    if http_cache is None:
+        return
+    validators = {}
+    if response.headers.get("ETag"):
+        validators["etag"] = response.headers["ETag"]
+    if response.headers.get("Last-Modified"):
+        validators["last_modified"] = response.headers["Last-Modified"]
+    if validators:
+        http_cache[url] = validators
+    else:
+        http_cache.pop(url, None)
+
+
+def fetch_readme(url: str, source_name: str, http_cache: Optional[Dict[str, Dict[str, str]]] = None) -> Optional[str]:
+    """
+    Fetch README.md content from a GitHub repo.
 
-def fetch_readme(url: str, source_name: str) -> str:
-    """Fetch README.md content from a GitHub repo."""
+    When http_cache is given, sends If-None-Match/If-Modified-Since from the
+    previous run and returns None on 304 Not Modified (nothing to download or
+    parse). New validators are written back into http_cache.
+    Returns "" on failure.
+    """
     try:
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
+        response = request_readme(url, source_name, http_cache)
+        if response is None:
+            return None
         logging.info(f"Successfully fetched {source_name} README ({len(response.text)} bytes)")
+        store_validators(http_cache, url, response)
         return response.text
     except requests.RequestException as e:
         logging.error(f"Failed to fetch {source_name} README: {e}")
         return ""
 
 
-def parse_markdown_table(readme_content: str, source_name: str = "") -> List[JobListing]:
+def iter_response_lines(response: requests.Response, on_bytes: Optional[Callable[[int], None]] = None,
+                        chunk_size: int = STREAM_CHUNK_BYTES) -> Iterator[str]:
+    """
+    Yield the lines of a streamed response body, split on "\n" like str.split.
+
+    Not Response.iter_lines: with a delimiter it yields a spurious empty line
+    whenever a chunk ends on one, and an empty line ends a markdown table.
+    on_bytes is called with the size of every chunk read.
+    """
+    pending = b""
+    for chunk in response.iter_content(chunk_size):
+        if on_bytes:
+            on_bytes(len(chunk))
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            yield line.decode("utf-8", errors="replace")
+    yield pending.decode("utf-8", errors="replace")
+
+
+def stream_readme_listings(source: Dict[str, str], http_cache: Optional[Dict[str, Dict[str, str]]] = None,
+                           parser: str = "fast", prefilter: bool = True,
+                           on_bytes: Optional[Callable[[int], None]] = None,
+                           row_cache: Optional[RowCache] = None) -> Optional[Iterator[JobListing]]:
+    """
+    Request a source's README and return a generator of its JobListings,
+    parsed line by line as the body arrives (None on 304 Not Modified).
+
+    HTML sources stop reading, and close the connection, once the last
+    wanted section's table has ended. Validators are only written into
+    http_cache after the generator finishes, so an interrupted stream is
+    downloaded again next run. Raises requests.RequestException if the
+    request fails. row_cache is passed to the row parser.
+    """
+    url = source["url"]
+    response = request_readme(url, source["name"], http_cache, stream=True)
+    if response is None:
+        return None
+
+    def listings() -> Iterator[JobListing]:
+        with response:
+            lines = iter_response_lines(response, on_bytes)
+            if source.get("format") == "html":
+                yield from iter_html_listings(lines, source["name"], parser, prefilter, row_cache)
+            else:
+                yield from iter_markdown_listings(lines, source["name"], prefilter, row_cache)
+        store_validators(http_cache, url, response)
+
+    return listings()
+
+
+def stream_source(source: Dict[str, str], http_cache: Optional[Dict[str, Dict[str, str]]] = None,
+                  parser: str = "fast", prefilter: bool = True,
+                  report: Optional[RunReport] = None, snapshots: bool = False,
+                  save_snapshots: bool = True) -> Optional[List[JobListing]]:
+    """
+    Download and parse one source in a single streamed pass (see
+    stream_readme_listings). Returns its listings, or None if unchanged;
+    raises requests.RequestException on failure. Logs the time to the first
+    listing; bytes read go into `report`. With snapshots=True, rows already
+    in the source's snapshot aren't parsed again (see parse_with_snapshot),
+    and unless save_snapshots=False the snapshot is then replaced. HTML
+    sources stop reading early, so the snapshot is saved without a body hash.
+    """
+    name = source['name']
+    report = report or RunReport("simplify_scraper")
+    with report.stage(f"fetch and parse {name}") as stage:
+        start = time.perf_counter()
+        key = row_cache = None
+        if snapshots:
+            key = snapshot_key(name, parser, prefilter)
+            snapshot = load_snapshot(name, key)
+            row_cache = RowCache(snapshot["rows"] if snapshot else None)
+        listings = stream_readme_listings(source, http_cache, parser, prefilter,
+                                          on_bytes=lambda nbytes: report.add_bytes(name, nbytes),
+                                          row_cache=row_cache)
+        if listings is None:
+            return None
+        jobs = []
+        for job in listings:
+            if not jobs:
+                logging.info(f"First {name} listing after {time.perf_counter() - start:.2f}s")
+            jobs.append(job)
+        stage.rows_out = len(jobs)
+        if row_cache is not None:
+            logging.info(f"{name}: {row_cache.hits} rows reused from snapshot, {row_cache.misses} parsed")
+            if save_snapshots:
+                save_snapshot(name, key, None, jobs, row_cache.rows)
+    return jobs
+
+
+def fetch_all_sources(http_cache: Optional[Dict[str, Dict[str, str]]] = None, parser: str = "fast",
+                      prefilter: bool = True, report: Optional[RunReport] = None,
+                      stream: bool = False, snapshots: bool = False,
+                      save_snapshots: bool = True) -> Tuple[List[JobListing], int]:
+    """
+    Fetch and parse every GitHub source. Returns (jobs, number of unchanged sources).
+
+    Fetch and parse time, table rows and bytes per source go into `report`.
+    With stream=True each README is parsed as it downloads (stream_source)
+    instead of being read whole first. With snapshots=True only rows that
+    changed since the source's last snapshot are parsed (parse_with_snapshot);
+    save_snapshots=False leaves the snapshots as they were (dry runs).
+    """
+    report = report or RunReport("simplify_scraper")
+    all_jobs = []
+    unchanged_sources = 0
+    
+    for source in GITHUB_SOURCES:
+        print(f"📥 Fetching from {source['owner']}/{source['repo']}...")
+        if stream:
+            try:
+                jobs = stream_source(source, http_cache, parser, prefilter, report, snapshots, save_snapshots)
+            except requests.RequestException as e:
+                logging.error(f"Failed to fetch {source['name']} README: {e}")
+                print(f"   ⚠️  Could not fetch from {source['name']}")
+            else:
+                if jobs is None:
+                    unchanged_sources += 1
+                    print(f"   ✓ {source['name']} unchanged since last run (skipped download and parse)")
+                else:
+                    all_jobs.extend(jobs)
+                    print(f"   ✓ Found {len(jobs)} jobs from {source['name']}")
+            print()
+            continue
+        
+        with report.stage(f"fetch {source['name']}"):
+            readme_content = fetch_readme(source['url'], source['name'], http_cache)
+        report.add_bytes(source['name'], len(readme_content.encode("utf-8")) if readme_content else 0)
+        
+        if readme_content is None:
+            unchanged_sources += 1
+            print(f"   ✓ {source['name']} unchanged since last run (skipped download and parse)")
+        elif readme_content:
+            table_rows = readme_content.count('<tr') + readme_content.count('\n|')
+            with report.stage(f"parse {source['name']}", rows_in=table_rows) as stage:
+                if snapshots:
+                    jobs = parse_with_snapshot(readme_content, source['name'], parser, prefilter, save_snapshots)
+                else:
+                    jobs = parse_markdown_table(readme_content, source['name'], parser, prefilter)
+                stage.rows_out = len(jobs)
+            all_jobs.extend(jobs)
+            print(f"   ✓ Found {len(jobs)} jobs from {source['name']}")
+        else:
+            print(f"   ⚠️  Could not fetch from {source['name']}")
+        print()
+    
+    return all_jobs, unchanged_sources
+
+
+def parse_with_snapshot(readme_content: str, source_name: str = "", parser: str = "fast",
+                        prefilter: bool = True, save: bool = True) -> List[JobListing]:
+    """
+    parse_markdown_table, reusing the source's snapshot from the last run.
+
+    A body with the snapshot's hash returns its listings without parsing
+    anything; otherwise only table rows that aren't in the snapshot are
+    parsed, so the cost follows upstream churn rather than table size.
+    Unless save=False, the snapshot is then replaced with this body's rows
+    and listings.
+    """
+    key = snapshot_key(source_name, parser, prefilter)
+    sha256 = hashlib.sha256(readme_content.encode("utf-8")).hexdigest()
+    snapshot = load_snapshot(source_name, key)
+    if snapshot and snapshot["sha256"] == sha256:
+        logging.info(f"{source_name} README matches its snapshot; loaded {len(snapshot['listings'])} listings")
+        return snapshot["listings"]
+    
+    row_cache = RowCache(snapshot["rows"] if snapshot else None)
+    jobs = parse_markdown_table(readme_content, source_name, parser, prefilter, row_cache)
+    logging.info(f"{source_name}: {row_cache.hits} rows reused from snapshot, {row_cache.misses} parsed")
+    if save:
+        save_snapshot(source_name, key, sha256, jobs, row_cache.rows)
+    return jobs
+
+
+def parse_markdown_table(readme_content: str, source_name: str = "", parser: str = "fast",
+                         prefilter: bool = True, row_cache: Optional[RowCache] = None) -> List[JobListing]:
     """
     Parse tables from GitHub README files (both HTML and markdown formats).
     
     Extracts jobs from internship listings, filtering for tech roles.
     Excludes Product Management positions.
+    `parser` selects the HTML row-parser backend (see HTML_ROW_PARSERS).
+    `prefilter` drops rows whose location cannot be Boston-area or remote
+    before the expensive normalization (see location_may_be_relevant).
+    Rows found in `row_cache` aren't parsed again.
     """
     jobs = []
     
     # Try HTML table format first (SimplifyJobs style)
-    html_jobs = parse_html_tables(readme_content, source_name)
+    html_jobs = parse_html_tables(readme_content, source_name, parser, prefilter, row_cache)
     if html_jobs:
         return html_jobs
     
     # Fall back to markdown table format (speedyapply, vanshb03 style)
-    md_jobs = parse_plain_markdown_tables(readme_content, source_name)
+    md_jobs = parse_plain_markdown_tables(readme_content, source_name, prefilter, row_cache)
     return md_jobs
 
 
-def parse_html_tables(readme_content: str, source_name: str = "") -> List[JobListing]:
-    """Parse HTML tables (SimplifyJobs format)."""
-    jobs = []
-    
-    # Define all sections we want to scrape
-    sections_to_scrape = [
-        '💻 Software Engineering Internship Roles',
-        '🤖 Data Science, AI & Machine Learning Internship Roles',
-        '📈 Quantitative Finance Internship Roles',
-        '🔧 Hardware Engineering Internship Roles'
-    ]
-    
-    lines = readme_content.split('\n')
+def find_section_tables(readme_content: str, section_names: List[str]) -> List[Tuple[str, str]]:
+    """
+    Locate the <table>...</table> block of each wanted "## section" in one sweep.
+
+    Header lines are found with str.find instead of rescanning the line list
+    once per section, so the cost scales with README size rather than README
+    size times section count. Returns (section_name, table_html) pairs in the
+    order the sections appear in section_names; sections without a table are
+    omitted.
+    """
+    section_starts: Dict[str, int] = {}  # section name -> offset just past its header line
+    boundaries: List[Tuple[int, str]] = []  # (line offset, line) for lines starting with "## "
+    
+    pos = readme_content.find('## ')
+    while pos != -1:
+        line_start = readme_content.rfind('\n', 0, pos) + 1
+        line_end = readme_content.find('\n', pos)
+        if line_end == -1:
+            line_end = len(readme_content)
+        line = readme_content[line_start:line_end]
+        
+        if line.startswith('## '):
+            boundaries.append((line_start, line))
+        for section_name in section_names:
+            if section_name not in section_starts and f'## {section_name}' in line:
+                section_starts[section_name] = line_end
+        
+        pos = readme_content.find('## ', line_end)
     
-    for section_name in sections_to_scrape:
-        logging.info(f"Parsing section: {section_name}")
-        table_html = []
-        in_target_section = False
-        in_table = False
+    tables = []
+    for section_name in section_names:
+        start = section_starts.get(section_name)
+        if start is None:
+            continue
         
-        for line in lines:
-            # Look for the target section header
-            if f'## {section_name}' in line:
-                in_target_section = True
-                continue
-            
-            # Stop at next section (another ## heading that's not our target)
-            if in_target_section and line.startswith('## ') and section_name not in line:
-                break
-            
-            # Start collecting table HTML
-            if in_target_section and '<table>' in line:
-                in_table = True
-            
-            if in_table:
-                table_html.append(line)
-            
-            # Stop at end of table
-            if in_table and '</table>' in line:
+        # Section ends at the next "## " heading that isn't this section's own
+        end = len(readme_content)
+        for offset, line in boundaries:
+            if offset >= start and section_name not in line:
+                end = offset
                 break
         
-        if not table_html:
-            logging.warning(f"Could not find table in section: {section_name}")
+        table_start = readme_content.find('<table>', start, end)
+        if table_start == -1:
             continue
+        # Widen to whole lines, matching the old line-based collection; an
+        # unterminated table runs to the end of its section
+        table_start = readme_content.rfind('\n', 0, table_start) + 1
+        table_end = readme_content.find('</table>', table_start, end)
+        if table_end == -1:
+            table_end = end
+        else:
+            table_end = readme_content.find('\n', table_end)
+            if table_end == -1 or table_end > end:
+                table_end = end
         
-        # Parse the collected HTML table
-        table_content = '\n'.join(table_html)
-        soup = BeautifulSoup(table_content, 'html.parser')
-        table = soup.find('table')
+        tables.append((section_name, readme_content[table_start:table_end]))
+    
+    return tables
+
+
+# Raw cell values of one HTML row: (company, role, location, apply_url, date)
+HtmlRowCells = Tuple[str, str, str, str, str]
+
+
+def iter_html_rows_bs4(table_html: str, location_filter: Optional[Callable[[str], bool]] = None) -> Iterator[HtmlRowCells]:
+    """
+    Extract row cell values with BeautifulSoup (reference backend).
+    
+    Rows whose location text fails location_filter are skipped before the
+    remaining cells are read.
+    """
+    soup = BeautifulSoup(table_html, 'html.parser')
+    table = soup.find('table')
+    
+    if not table:
+        logging.warning("Could not parse table HTML")
+        return
+    
+    rows = table.find_all('tr')
+    for row in rows[1:]:  # Skip header row
+        cells = row.find_all('td')
+        if len(cells) < 4:
+            continue
+        if location_filter and not location_filter(cells[2].get_text(strip=True)):
+            continue
+        yield html_cell_values(cells)
+
+
+_TR_RE = re.compile(r'<tr\b[^>]*>(.*?)</tr\s*>', re.S | re.I)
+_TD_RE = re.compile(r'<td\b[^>]*>(.*?)</td\s*>', re.S | re.I)
+_TAG_RE = re.compile(r'<!--.*?-->|<[^>]*>', re.S)
+_A_TAG_RE = re.compile(r'<a\b[^>]*>', re.I)
+_HREF_RE = re.compile(r'\bhref\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))', re.I)
+
+
+def _fast_cell_text(cell_html: str) -> str:
+    """Equivalent of Tag.get_text(strip=True): strip each text node, join with ''."""
+    if '<' not in cell_html:
+        text = cell_html.strip()
+        return html.unescape(text) if '&' in text else text
+    parts = []
+    for piece in _TAG_RE.split(cell_html):
+        if '&' in piece:
+            piece = html.unescape(piece)
+        piece = piece.strip()
+        if piece:
+            parts.append(piece)
+    return ''.join(parts)
+
+
+def _fast_first_href(cell_html: str) -> str:
+    """href of the first <a> tag in the cell (empty if that tag has none)."""
+    a_match = _A_TAG_RE.search(cell_html)
+    if not a_match:
+        return ""
+    href_match = _HREF_RE.search(a_match.group(0))
+    if not href_match:
+        return ""
+    href = next(g for g in href_match.groups() if g is not None)
+    return html.unescape(href) if '&' in href else href
+
+
+def iter_html_rows_fast(table_html: str, location_filter: Optional[Callable[[str], bool]] = None) -> Iterator[HtmlRowCells]:
+    """
+    Extract row cell values with a regex tokenizer over the table slice.
+
+    Produces the same values as iter_html_rows_bs4 for the well-formed tables
+    SimplifyJobs generates, without building a DOM.
+    """
+    rows = _TR_RE.findall(table_html)
+    for row_html in rows[1:]:  # Skip header row
+        row_cells = fast_row_cells(row_html, location_filter)
+        if row_cells:
+            yield row_cells
+
+
+def fast_row_cells(row_html: str, location_filter: Optional[Callable[[str], bool]] = None) -> Optional[HtmlRowCells]:
+    """Cell values of one row's inner HTML, or None if it has under 4 cells or fails location_filter."""
+    cells = _TD_RE.findall(row_html)
+    if len(cells) < 4:
+        return None
+    location_text = _fast_cell_text(cells[2])
+    if location_filter and not location_filter(location_text):
+        return None
+    return (
+        _fast_cell_text(cells[0]),
+        _fast_cell_text(cells[1]),
+        location_text,
+        _fast_first_href(cells[3]),
+        _fast_cell_text(cells[4]) if len(cells) > 4 else "",
+    )
+
+
+def bs4_row_cells(row_html: str, location_filter: Optional[Callable[[str], bool]] = None) -> Optional[HtmlRowCells]:
+    """fast_row_cells with BeautifulSoup (one small soup per row)."""
+    cells = BeautifulSoup(f"<table><tr>{row_html}</tr></table>", 'html.parser').find_all('td')
+    if len(cells) < 4:
+        return None
+    if location_filter and not location_filter(cells[2].get_text(strip=True)):
+        return None
+    return html_cell_values(cells)
+
+
+# Selectable HTML row-parser backends (simplify_scraper.py --parser), for a
+# whole table and, with --stream, for one row at a time
+HTML_ROW_PARSERS: Dict[str, Callable[..., Iterator[HtmlRowCells]]] = {
+    "bs4": iter_html_rows_bs4,
+    "fast": iter_html_rows_fast,
+}
+HTML_ROW_CELLS: Dict[str, Callable[..., Optional[HtmlRowCells]]] = {
+    "bs4": bs4_row_cells,
+    "fast": fast_row_cells,
+}
+
+
+def html_row_listing(row_html: str, source_name: str = "", parser: str = "fast",
+                     location_filter: Optional[Callable[[str], bool]] = None) -> Optional[JobListing]:
+    """JobListing of one row's inner HTML; None if it is skipped or fails to parse."""
+    try:
+        cells = HTML_ROW_CELLS[parser](row_html, location_filter)
+        return build_html_listing(*cells, source_name=source_name) if cells else None
+    except Exception as e:
+        logging.debug(f"Error parsing row: {e}")
+        return None
+
+
+def parse_html_tables(readme_content: str, source_name: str = "", parser: str = "fast",
+                      prefilter: bool = True, row_cache: Optional[RowCache] = None) -> List[JobListing]:
+    """
+    Parse HTML tables (SimplifyJobs format).
+
+    With a row_cache, rows are parsed one at a time (HTML_ROW_CELLS) so
+    those already in it can be skipped.
+    """
+    jobs = []
+    iter_rows = HTML_ROW_PARSERS[parser]
+    location_filter = location_cell_may_be_relevant if prefilter else None
+    parse_row = functools.partial(html_row_listing, source_name=source_name, parser=parser,
+                                  location_filter=location_filter)
+    
+    section_tables = dict(find_section_tables(readme_content, SIMPLIFY_SECTIONS))
+    
+    for section_name in SIMPLIFY_SECTIONS:
+        logging.info(f"Parsing section: {section_name}")
+        table_content = section_tables.get(section_name)
         
-        if not table:
-            logging.warning(f"Could not parse table HTML for section: {section_name}")
+        if not table_content:
+            logging.warning(f"Could not find table in section: {section_name}")
             continue
         
-        # Parse all rows in the table body
-        rows = table.find_all('tr')
         section_jobs = 0
+        if row_cache is not None:
+            for row_html in _TR_RE.findall(table_content)[1:]:  # Skip header row
+                job = row_cache.parse(row_html, parse_row)
+                if job:
+                    jobs.append(job)
+                    section_jobs += 1
+            logging.info(f"  → Parsed {section_jobs} jobs from {section_name}")
+            continue
         
-        for row in rows[1:]:  # Skip header row
-            cells = row.find_all('td')
-            
-            if len(cells) < 4:
-                continue
-            
+        for row_cells in iter_rows(table_content, location_filter):
             try:
-                job = parse_html_row(cells, source_name)
+                job = build_html_listing(*row_cells, source_name=source_name)
                 if job:
                     jobs.append(job)
                     section_jobs += 1
@@ -241,15 +828,105 @@ def parse_html_tables(readme_content: str, source_name: str = "") -> List[JobLis
     return jobs
 
 
-def parse_plain_markdown_tables(readme_content: str, source_name: str = "") -> List[JobListing]:
+def iter_html_listings(lines: Iterable[str], source_name: str = "", parser: str = "fast",
+                       prefilter: bool = True, row_cache: Optional[RowCache] = None) -> Iterator[JobListing]:
+    """
+    Streaming parse_html_tables: run the section/table state machine over
+    lines as they arrive and yield each row's JobListing once its </tr> is seen.
+
+    Follows find_section_tables: a wanted section starts at the first line
+    containing "## <name>" and ends at the next line starting with "## " that
+    doesn't name it, and only its first table is read. Stops consuming lines
+    once every wanted section has started and the last one has ended.
+    Listings come out in README order rather than SIMPLIFY_SECTIONS order.
+    Rows found in `row_cache` aren't parsed again.
+    """
+    location_filter = location_cell_may_be_relevant if prefilter else None
+    parse_row = functools.partial(html_row_listing, source_name=source_name, parser=parser,
+                                  location_filter=location_filter)
+    parsed: Dict[str, int] = {}  # wanted section -> jobs parsed, once it has started
+    tables = set()               # wanted sections whose table was found
+    section = None               # wanted section whose table is still to come or being read
+    in_table = False
+    header_skipped = False
+    buffer: List[str] = []
+
+    def end_section():
+        if section in tables:
+            logging.info(f"  → Parsed {parsed[section]} jobs from {section}")
+
+    for line in lines:
+        if '## ' in line:
+            if section is not None and line.startswith('## ') and section not in line:
+                end_section()
+                section = None
+            if section is None:
+                section = next((name for name in SIMPLIFY_SECTIONS
+                                if name not in parsed and f'## {name}' in line), None)
+                if section is not None:
+                    logging.info(f"Parsing section: {section}")
+                    parsed[section] = 0
+                    in_table = header_skipped = False
+                    buffer = []
+                elif len(parsed) == len(SIMPLIFY_SECTIONS):
+                    break
+            continue
+        if section is None or (not in_table and (section in tables or '<table>' not in line)):
+            continue
+        if not in_table:
+            in_table = True
+            tables.add(section)
+        buffer.append(line)
+        table_ended = '</table>' in line
+        if '</tr' not in line and not table_ended:
+            continue
+
+        chunk = '\n'.join(buffer)
+        consumed = 0
+        for match in _TR_RE.finditer(chunk):
+            consumed = match.end()
+            if not header_skipped:
+                header_skipped = True
+                continue
+            row_html = match.group(1)
+            job = row_cache.parse(row_html, parse_row) if row_cache is not None else parse_row(row_html)
+            if job:
+                parsed[section] += 1
+                yield job
+        buffer = [chunk[consumed:]] if consumed < len(chunk) else []
+        if table_ended:
+            in_table = False
+            end_section()
+            section = None
+            if len(parsed) == len(SIMPLIFY_SECTIONS):
+                break
+    else:
+        end_section()
+
+    for name in SIMPLIFY_SECTIONS:
+        if name not in tables:
+            logging.warning(f"Could not find table in section: {name}")
+    logging.info(f"Parsed {sum(parsed.values())} total job listings from {source_name} (all sections)")
+
+
+def parse_plain_markdown_tables(readme_content: str, source_name: str = "", prefilter: bool = True,
+                                row_cache: Optional[RowCache] = None) -> List[JobListing]:
     """Parse plain markdown tables (speedyapply, vanshb03 format)."""
-    jobs = []
-    lines = readme_content.split('\n')
-    
+    return list(iter_markdown_listings(readme_content.split('\n'), source_name, prefilter, row_cache))
+
+
+def iter_markdown_listings(lines: Iterable[str], source_name: str = "", prefilter: bool = True,
+                           row_cache: Optional[RowCache] = None) -> Iterator[JobListing]:
+    """
+    Yield the JobListings of plain markdown tables as their lines arrive.
+    Rows found in `row_cache` aren't parsed again.
+    """
+    parse_row = functools.partial(markdown_row_listing, source_name=source_name, prefilter=prefilter)
+    count = 0
     in_table = False
     table_started = False
     
-    for i, line in enumerate(lines):
+    for line in lines:
         # Look for table separator (|---|---|)
         if '|' in line and ('---' in line or '===' in line):
             in_table = True
@@ -263,19 +940,24 @@ def parse_plain_markdown_tables(readme_content: str, source_name: str = "") -> L
         
         # Parse table rows
         if in_table and '|' in line and line.strip().startswith('|'):
-            try:
-                job = parse_markdown_row(line, source_name)
-                if job:
-                    jobs.append(job)
-            except Exception as e:
-                logging.debug(f"Error parsing markdown row: {e}")
-                continue
+            job = row_cache.parse(line, parse_row) if row_cache is not None else parse_row(line)
+            if job:
+                count += 1
+                yield job
     
-    logging.info(f"Parsed {len(jobs)} total job listings from {source_name}")
-    return jobs
+    logging.info(f"Parsed {count} total job listings from {source_name}")
+
+
+def markdown_row_listing(row: str, source_name: str = "", prefilter: bool = True) -> Optional[JobListing]:
+    """parse_markdown_row; None if the row fails to parse."""
+    try:
+        return parse_markdown_row(row, source_name, prefilter)
+    except Exception as e:
+        logging.debug(f"Error parsing markdown row: {e}")
+        return None
 
 
-def parse_markdown_row(row: str, source_name: str = "") -> Optional[JobListing]:
+def parse_markdown_row(row: str, source_name: str = "", prefilter: bool = True) -> Optional[JobListing]:
     """Parse a markdown table row."""
     # Split by | and clean up
     cells = [cell.strip() for cell in row.split('|')]
@@ -289,6 +971,10 @@ def parse_markdown_row(row: str, source_name: str = "") -> Optional[JobListing]:
     position_cell = cells[1]
     location_cell = cells[2]
     
+    # Cheap location check before any other normalization
+    if prefilter and not location_cell_may_be_relevant(location_cell):
+        return None
+    
     # Get URL from any cell (usually in position or company)
     apply_url = extract_url(company_cell) or extract_url(position_cell)
     if len(cells) > 3:
@@ -339,11 +1025,8 @@ def parse_markdown_row(row: str, source_name: str = "") -> Optional[JobListing]:
     )
 
 
-def parse_html_row(cells, source_name: str = "") -> Optional[JobListing]:
-    """Parse HTML table cells into a JobListing."""
-    if len(cells) < 4:
-        return None
-    
+def html_cell_values(cells) -> HtmlRowCells:
+    """Pull (company, role, location, apply_url, date) out of BeautifulSoup <td> cells."""
     # Get text from each cell
     company_cell = cells[0].get_text(strip=True)
     role_cell = cells[1].get_text(strip=True)
@@ -356,6 +1039,20 @@ def parse_html_row(cells, source_name: str = "") -> Optional[JobListing]:
     # Get date from cell 4 if exists
     date_cell = cells[4].get_text(strip=True) if len(cells) > 4 else ""
     
+    return company_cell, role_cell, location_cell, apply_url, date_cell
+
+
+def parse_html_row(cells, source_name: str = "") -> Optional[JobListing]:
+    """Parse HTML table cells into a JobListing."""
+    if len(cells) < 4:
+        return None
+    
+    return build_html_listing(*html_cell_values(cells), source_name=source_name)
+
+
+def build_html_listing(company_cell: str, role_cell: str, location_cell: str, apply_url: str,
+                       date_cell: str, source_name: str = "") -> Optional[JobListing]:
+    """Build a JobListing from the raw cell values of an HTML table row."""
     # Check if position is closed
     is_closed = '🔒' in company_cell or '🔒' in role_cell
     if is_closed:
@@ -505,213 +1202,39 @@ def clean_markdown(text: str) -> str:
     return text.strip()
 
 
-def is_relevant_location(location: str) -> bool:
+# Substrings at least one of which must appear in any location that
+# is_relevant_location accepts (the ", ma"/" ma " forms are handled by
+# _PREFILTER_MA_RE below)
+_PREFILTER_TOKEN_RE = term_pattern(tuple(
+    [loc for loc in BOSTON_LOCATIONS_UNAMBIGUOUS if loc.strip(' ,') != 'ma']
+    + BOSTON_LOCATIONS_AMBIGUOUS + ['remote']
+))
+# "ma" not preceded by a letter, or not followed by one ("SalemMA" is
+# tokenized as "Salem, MA")
+_PREFILTER_MA_RE = re.compile(r'(?<![a-z])ma|ma(?![a-z])')
+
+
+def location_may_be_relevant(location: str) -> bool:
     """
-    Check if a location is relevant (Boston area or US remote).
-    Returns True for Boston area locations and US remote positions.
-    Returns False for non-US remote and other locations.
+    Conservative pre-filter: False only if format_location(location) is
+    guaranteed to be "" (so the row would be dropped anyway).
+    
+    `location` is the clean_markdown()-ed location cell. format_location only
+    splits the cell into locations and re-joins states and countries with
+    ", " - it never creates letters - so every location is_relevant_location
+    accepts has one of its tokens already present in the input. The one
+    exception is a separator inserted before "MA", which _PREFILTER_MA_RE
+    covers.
     """
-    location_lower = location.lower().strip()
-    
-    # First, exclude non-US countries explicitly
-    non_us_patterns = [
-        ', uk', ' uk', ',uk', 'united kingdom',
-        ', canada', ' canada',
-        ', india', ' india',
-        ', mexico', ' mexico',
-        ', europe', ' europe',
-        ', australia', ' australia',
-        ', brazil', ' brazil',
-        ', israel', ' israel',
-        ', china', ' china',
-        ', japan', ' japan',
-        ', singapore', ' singapore',
-        ', germany', ' germany',
-        ', france', ' france',
-        ', netherlands', ' netherlands',
-        ', spain', ' spain',
-        ', italy', ' italy',
-        'remote in uk', 'remote in canada', 'remote in india', 'remote in mexico',
-        'remote in europe', 'remote in australia', 'remote in brazil', 'remote in israel',
-        'remote in china', 'remote in japan', 'remote in singapore', 'remote in germany',
-        'remote in france', 'remote in netherlands', 'remote in spain', 'remote in italy'
-    ]
-    
-    for pattern in non_us_patterns:
-        if pattern in location_lower:
-            return False
-    
-    # Exclude other US states explicitly (not MA)
-    non_ma_states = [
-        ', ks', ', kansas',  # Lawrence, KS
-        ', az', ', arizona',  # Tempe, AZ
-        ', co', ', colorado',  # Denver, CO
-        ', vt', ', vermont',  # Burlington, VT
-        ', ia', ', iowa',  # Newton, IA
-        ', ny', ', new york',
-        ', ca', ', california',
-        ', tx', ', texas',
-        ', fl', ', florida',
-        ', wa', ', washington',
-        ', or', ', oregon',
-        ', il', ', illinois',
-        ', pa', ', pennsylvania',
-        ', oh', ', ohio',
-        ', nc', ', north carolina',
-        ', ga', ', georgia',
-        ', mi', ', michigan',
-        ', nj', ', new jersey',
-        ', va', ', virginia',
-        ', ct', ', connecticut',
-        ', ri', ', rhode island',
-        ', nh', ', new hampshire',
-        ', me', ', maine',
-        'denver, colorado',
-        'tempe, az'
-    ]
-    
-    for pattern in non_ma_states:
-        if pattern in location_lower:
-            return False
-    
-    # Check for unambiguous Boston area locations (only exist in MA)
-    for loc in BOSTON_LOCATIONS_UNAMBIGUOUS:
-        if loc in location_lower:
-            return True
-    
-    # Check for ambiguous city names - require MA/Massachusetts in the location string
-    for city in BOSTON_LOCATIONS_AMBIGUOUS:
-        if city in location_lower:
-            # Only accept if it also contains MA or Massachusetts
-            if ', ma' in location_lower or ' ma' in location_lower or 'massachusetts' in location_lower:
-                return True
-            # Otherwise reject (e.g., "Newton, IA" or "Burlington, VT")
-            return False
-    
-    # Check for Remote (generic) or Remote in USA
-    if location_lower == 'remote' or 'remote in usa' in location_lower or 'remote in us' in location_lower:
+    location_lower = location.lower()
+    if _PREFILTER_TOKEN_RE.search(location_lower):
         return True
-    
-    # Check for Remote (no location) or US-specific remote
-    if location_lower.startswith('remote') and 'in' not in location_lower:
-        return True
-    
-    return False
+    return _PREFILTER_MA_RE.search(location_lower) is not None
 
 
-def format_location(location: str) -> str:
-    """Format location string with proper separators, filtering, and truncation."""
-    if not location:
-        return location
-    
-    # Protect certain patterns from being split (use lowercase placeholders to avoid regex matches)
-    location = location.replace('Remote in USA', '___remote_usa___')
-    location = location.replace('Remote in UK', '___remote_uk___')
-    location = location.replace('Remote in Canada', '___remote_canada___')
-    location = location.replace('Remote in India', '___remote_india___')
-    location = location.replace('Remote in Europe', '___remote_europe___')
-    
-    # Handle concatenated state/location names without spaces
-    # e.g., "NHMississippiTennessee" -> "NH; Mississippi; Tennessee"
-    # Split on patterns where a lowercase letter is followed by an uppercase letter or full state name
-    location = re.sub(r'([a-z])([A-Z][a-z]{3,})', r'\1; \2', location)  # lowercase followed by capitalized word
-    location = re.sub(r'([A-Z]{2})([A-Z][a-z]{3,})', r'\1; \2', location)  # 2-letter state code followed by full name
-    
-    # Add commas/separators between locations that are missing them
-    # Handle edge cases like "CT Norwood, MA" (two separate locations concatenated)
-    
-    # Pattern 1: "STATE City, STATE" -> "STATE; City, STATE"
-    # e.g., "CT Norwood, MA" -> "CT; Norwood, MA"
-    location = re.sub(r'\b([A-Z]{2})\s+([A-Z][a-z]+),\s*([A-Z]{2})\b', r'\1; \2, \3', location)
-    
-    # Pattern 2: "City, STATE City, STATE" -> "City, STATE; City, STATE"
-    # e.g., "Boston, MA Cambridge, MA" -> "Boston, MA; Cambridge, MA"
-    location = re.sub(r'([a-z], [A-Z]{2})\s+([A-Z][a-z]+)', r'\1; \2', location)
-    
-    # Handle "X locations" pattern at the start
-    location = re.sub(r'(\d+ locations)([A-Z])', r'\1, \2', location)
-    
-    # Add commas between "Remote in X" patterns and other locations
-    location = re.sub(r'(Remote in [A-Z]{2,})([A-Z])', r'\1; \2', location)
-    location = re.sub(r'(Remote in [A-Za-z\s]+?)([A-Z][a-z]+, [A-Z]{2})', r'\1; \2', location)
-    
-    # Restore protected patterns
-    location = location.replace('___remote_usa___', 'Remote in USA')
-    location = location.replace('___remote_uk___', 'Remote in UK')
-    location = location.replace('___remote_canada___', 'Remote in Canada')
-    location = location.replace('___remote_india___', 'Remote in India')
-    location = location.replace('___remote_europe___', 'Remote in Europe')
-    
-    # Split by semicolons primarily (indicates separate locations)
-    # Also split by commas but be careful not to split city, state pairs
-    locations = re.split(r';', location)  # Split by semicolon first
-    
-    # Now handle comma-separated locations within each segment
-    expanded_locations = []
-    for segment in locations:
-        # Only split by comma if it's not part of a "City, ST" pattern
-        # Look for pattern: word, 2-letter-code and keep it together
-        if re.search(r'[a-zA-Z]+,\s*[A-Z]{2}(?:\s|$)', segment):
-            # Has city, state pattern - keep as is
-            expanded_locations.append(segment.strip())
-        else:
-            # No state pattern, can split by commas
-            parts = [p.strip() for p in segment.split(',')]
-            expanded_locations.extend([p for p in parts if p])
-    
-    locations = [loc.strip() for loc in expanded_locations if loc.strip()]
-    
-    # Merge city with state if they got split (e.g., "Boston" and "MA" -> "Boston, MA")
-    merged_locations = []
-    i = 0
-    while i < len(locations):
-        current = locations[i]
-        # Check if next item is a 2-letter state code
-        if i + 1 < len(locations) and re.match(r'^[A-Z]{2}$', locations[i + 1].strip()):
-            # Merge them
-            merged_locations.append(f"{current}, {locations[i + 1]}")
-            i += 2
-        else:
-            merged_locations.append(current)
-            i += 1
-    
-    locations = merged_locations
-    
-    # Filter to only relevant locations (Boston area or US remote)
-    filtered_locations = []
-    for loc in locations:
-        if is_relevant_location(loc):
-            filtered_locations.append(loc)
-    locations = filtered_locations
-    
-    # If no relevant locations remain, return empty (job will be filtered out)
-    if not locations:
-        return ""
-    
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_locations = []
-    for loc in locations:
-        loc_lower = loc.lower()
-        if loc_lower not in seen:
-            seen.add(loc_lower)
-            unique_locations.append(loc)
-    locations = unique_locations
-    
-    # Format locations - show all relevant ones
-    # If there are many, just show them all in a compact format
-    if len(locations) > 4:
-        # Show first location prominently, then list count of others
-        # E.g., "Boston, MA (+3 other locations)"
-        result = f"{locations[0]} (+{len(locations)-1} other location{'s' if len(locations) > 2 else ''})"
-        return result
-    elif len(locations) > 1:
-        # For 2-4 locations, show them all but compactly
-        # Use semicolons to save space
-        return '; '.join(locations)
-    else:
-        # Single location - just return it
-        return locations[0] if locations else ""
+def location_cell_may_be_relevant(location_cell: str) -> bool:
+    """Pre-filter a raw location cell (markdown or extracted HTML text)."""
+    return location_may_be_relevant(clean_markdown(location_cell))
 
 
 def parse_date(date_cell: str) -> str:
@@ -795,59 +1318,9 @@ def filter_boston_remote(jobs: List[JobListing], include_remote: bool = True) ->
     return filtered
 
 
-def format_for_readme(jobs: List[JobListing]) -> str:
-    """Format job listings for README table."""
-    if not jobs:
-        return ""
-    
-    rows = []
-    for job in jobs:
-        # Format the apply link
-        apply_link = f'[APPLY]({job.apply_url})' if job.apply_url else "N/A"
-        
-        row = f"| {job.company} | {job.title} | {job.location} | {job.date_posted} | {apply_link} |"
-        rows.append(row)
-    
-    return '\n'.join(rows)
-
-
-def get_existing_jobs() -> set:
-    """Get set of existing job identifiers from README to avoid duplicates."""
-    readme_path = os.path.join(os.path.dirname(__file__), "..", "README.md")
-    
-    if not os.path.exists(readme_path):
-        return set()
-    
-    try:
-        with open(readme_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Extract job identifiers (company + title as simple check)
-        existing = set()
-        for line in content.split('\n'):
-            if line.startswith('|') and '|' in line[1:]:
-                cells = [c.strip() for c in line.split('|')]
-                if len(cells) >= 3:
-                    # Use company + title as identifier
-                    company = clean_markdown(cells[1])
-                    title = clean_markdown(cells[2])
-                    if company and title:
-                        existing.add(f"{company}|{title}".lower())
-        
-        logging.info(f"Found {len(existing)} existing jobs in README")
-        return existing
-    except Exception as e:
-        logging.warning(f"Could not read existing README: {e}")
-        return set()
-
-
-def deduplicate_jobs(jobs: List[JobListing], existing: set) -> List[JobListing]:
-    """Remove jobs that already exist in README."""
-    new_jobs = []
-    for job in jobs:
-        identifier = f"{job.company}|{job.title}".lower()
-        if identifier not in existing:
-            new_jobs.append(job)
+def deduplicate_jobs(jobs: List[JobListing], store: ListingStore) -> List[JobListing]:
+    """Remove jobs whose company + title is already in the listing store."""
+    new_jobs = [job for job in jobs if not store.has_company_title(job.company, job.title)]
     
     logging.info(f"After deduplication: {len(new_jobs)} new jobs")
     return new_jobs
@@ -863,8 +1336,8 @@ def deduplicate_across_sources(jobs: List[JobListing]) -> List[JobListing]:
     duplicates_removed = 0
     
     for job in jobs:
-        # Create identifier from company + title (case-insensitive)
-        identifier = f"{job.company}|{job.title}".lower()
+        # Identifier from company + title (case-insensitive), computed by JobListing
+        identifier = job.dedupe_key
         
         if identifier not in seen:
             seen.add(identifier)
@@ -879,45 +1352,25 @@ def deduplicate_across_sources(jobs: List[JobListing]) -> List[JobListing]:
     return unique_jobs
 
 
-def append_to_readme(jobs: List[JobListing]) -> None:
-    """Append new jobs to README.md."""
+def record_jobs(store: ListingStore, jobs: List[JobListing]) -> int:
+    """Upsert jobs into the listing store (deduplicated by company + title); returns how many were new."""
+    added = 0
+    for job in jobs:
+        if store.upsert(job.company, job.title, job.location, job.date_posted, job.apply_url,
+                        source=job.source or "github", match=MATCH_TITLE):
+            added += 1
+    return added
+
+
+def append_to_readme(jobs: List[JobListing], store: ListingStore) -> None:
+    """Record new jobs in the listing store and re-render README.md from it."""
     if not jobs:
         logging.info("No new jobs to add to README")
         return
     
-    readme_path = os.path.join(os.path.dirname(__file__), "..", "README.md")
-    
     try:
-        # Read existing content
-        with open(readme_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Find the job listings table
-        # Look for the line with the table header
-        table_pattern = r'(\| Company Name \| Job Title \| Location \| Date Posted \| APPLY \|)'
-        match = re.search(table_pattern, content)
-        
-        if not match:
-            logging.error("Could not find job listings table in README")
-            return
-        
-        # Find the end of the header (separator line)
-        header_end = content.find('\n', match.end())
-        separator_end = content.find('\n', header_end + 1)
-        
-        # Format new jobs
-        new_jobs_text = format_for_readme(jobs)
-        
-        # Insert after the separator line
-        new_content = (
-            content[:separator_end + 1] +
-            new_jobs_text + '\n' +
-            content[separator_end + 1:]
-        )
-        
-        # Write back
-        with open(readme_path, 'w', encoding='utf-8') as f:
-            f.write(new_content)
+        record_jobs(store, jobs)
+        store.render_readme()
         
         logging.info(f"✅ Added {len(jobs)} new jobs to README.md")
         
@@ -956,78 +1409,118 @@ def main():
                     help="Exclude remote positions")
     ap.add_argument("--dry-run", action="store_true",
                     help="Show what would be added without modifying README")
+    ap.add_argument("--no-cache", action="store_true",
+                    help="Ignore stored ETag/Last-Modified and re-download every README")
+    ap.add_argument("--parser", choices=sorted(HTML_ROW_PARSERS), default="fast",
+                    help="HTML row-parser backend for SimplifyJobs tables (default: fast)")
+    ap.add_argument("--no-prefilter", action="store_true",
+                    help="Fully parse every row instead of pre-filtering on the location cell")
+    ap.add_argument("--stream", action="store_true",
+                    help="Parse each README while it downloads instead of reading it whole first")
+    ap.add_argument("--no-snapshots", action="store_true",
+                    help="Parse every table row again instead of reusing rows unchanged since the last snapshot")
+    add_profile_argument(ap)
     args = ap.parse_args()
     
+    report = RunReport("simplify_scraper", profile_dir=args.profile)
+    try:
+        scrape(args, report)
+    finally:
+        http_client.record_connections(report)
+        report.save()
+
+
+def scrape(args: argparse.Namespace, report: RunReport) -> None:
+    """Fetch, filter and deduplicate the GitHub boards and add new jobs to README.md."""
     print("🔍 Fetching jobs from multiple GitHub repositories...")
     print(f"   Sources: {', '.join([s['owner'] + '/' + s['repo'] for s in GITHUB_SOURCES])}")
     print()
     
-    all_jobs = []
+    # A cassette run must make the same requests when replayed, so it neither
+    # sends stored validators (recording bodiless 304s) nor updates them
+    persist = http_cassette.install_from_env() is None
+    # Validators are only persisted once the run has finished and its rows are
+    # committed, so an interrupted or dry run never causes the next run to skip
+    # listings it hasn't recorded. A --no-remote run leaves the remote listings
+    # out of the store, so it doesn't persist them either: the next full run
+    # must download and parse those READMEs again.
+    http_cache = load_http_cache() if persist and not args.no_cache else {}
     
-    # Fetch and parse from all sources
-    for source in GITHUB_SOURCES:
-        print(f"📥 Fetching from {source['owner']}/{source['repo']}...")
-        readme_content = fetch_readme(source['url'], source['name'])
-        
-        if readme_content:
-            jobs = parse_markdown_table(readme_content, source['name'])
-            all_jobs.extend(jobs)
-            print(f"   ✓ Found {len(jobs)} jobs from {source['name']}")
-        else:
-            print(f"   ⚠️  Could not fetch from {source['name']}")
-        print()
+    all_jobs, unchanged_sources = fetch_all_sources(http_cache, args.parser, not args.no_prefilter, report,
+                                                    args.stream, snapshots=persist and not args.no_snapshots,
+                                                    save_snapshots=not args.dry_run)
+    
+    def finish_run():
+        if persist and not args.dry_run and not args.no_remote:
+            save_http_cache(http_cache)
     
     if not all_jobs:
-        print("❌ No jobs found from any source")
+        if unchanged_sources:
+            print("✨ No upstream changes - nothing to parse")
+            finish_run()
+        else:
+            print("❌ No jobs found from any source")
         return
     
     print(f"📊 Total jobs fetched: {len(all_jobs)}")
     
     # Deduplicate across sources first (before filtering)
-    all_jobs = deduplicate_across_sources(all_jobs)
+    with report.stage("deduplicate sources", rows_in=len(all_jobs)) as stage:
+        all_jobs = deduplicate_across_sources(all_jobs)
+        stage.rows_out = len(all_jobs)
     print(f"📊 After cross-source deduplication: {len(all_jobs)} unique jobs")
     
     # Filter for Boston/Remote
     include_remote = not args.no_remote
-    filtered_jobs = filter_boston_remote(all_jobs, include_remote)
+    with report.stage("filter locations", rows_in=len(all_jobs)) as stage:
+        filtered_jobs = filter_boston_remote(all_jobs, include_remote)
+        stage.rows_out = len(filtered_jobs)
     
     if not filtered_jobs:
         print("No Boston/Remote jobs found")
+        finish_run()
         return
     
-    # Deduplicate against existing README jobs
-    existing_jobs = get_existing_jobs()
-    new_jobs = deduplicate_jobs(filtered_jobs, existing_jobs)
-    
-    if not new_jobs:
-        print("✨ No new jobs to add - all listings are already in your README!")
-        return
-    
-    # Sort by date (newest first)
-    new_jobs.sort(key=lambda j: parse_date_to_datetime(j.date_posted), reverse=True)
-    
-    # Show preview grouped by source
-    print(f"\n📋 Found {len(new_jobs)} new jobs:")
-    source_counts = {}
-    for job in new_jobs:
-        source_counts[job.source] = source_counts.get(job.source, 0) + 1
-    
-    for source_name, count in source_counts.items():
-        print(f"   • {source_name}: {count} jobs")
-    
-    print("\nPreview (first 10):")
-    for job in new_jobs[:10]:
-        print(f"  • {job.company} - {job.title}")
-        print(f"    📍 {job.location} | 📅 {job.date_posted} | 🔗 {job.source}")
-    if len(new_jobs) > 10:
-        print(f"  ... and {len(new_jobs) - 10} more")
-    
-    if args.dry_run:
-        print("\n[DRY RUN] Would have added these jobs to README.md")
-        return
-    
-    # Append to README
-    append_to_readme(new_jobs)
+    # Deduplicate against the listing store (indexed company + title lookup)
+    with ListingStore() as store:
+        with report.stage("deduplicate store", rows_in=len(filtered_jobs)) as stage:
+            new_jobs = deduplicate_jobs(filtered_jobs, store)
+            stage.rows_out = len(new_jobs)
+        
+        if not new_jobs:
+            print("✨ No new jobs to add - all listings are already in your README!")
+            finish_run()
+            return
+        
+        # Sort by date (newest first)
+        new_jobs.sort(key=lambda j: parse_date_to_datetime(j.date_posted), reverse=True)
+        
+        # Show preview grouped by source
+        print(f"\n📋 Found {len(new_jobs)} new jobs:")
+        source_counts = {}
+        for job in new_jobs:
+            source_counts[job.source] = source_counts.get(job.source, 0) + 1
+        
+        for source_name, count in source_counts.items():
+            print(f"   • {source_name}: {count} jobs")
+        
+        print("\nPreview (first 10):")
+        for job in new_jobs[:10]:
+            print(f"  • {job.company} - {job.title}")
+            print(f"    📍 {job.location} | 📅 {job.date_posted} | 🔗 {job.source}")
+        if len(new_jobs) > 10:
+            print(f"  ... and {len(new_jobs) - 10} more")
+        
+        if args.dry_run:
+            print("\n[DRY RUN] Would have added these jobs to README.md")
+            return
+        
+        # Record in the store and re-render README
+        with report.stage("append to README", rows_in=len(new_jobs)) as stage:
+            append_to_readme(new_jobs, store)
+            stage.rows_out = store.count()
+    # The store is committed when its block exits
+    finish_run()
     
     # Print credits
     print("\n" + "="*60)
@@ -1036,6 +1529,5 @@ def main():
         print(f"   • {source['owner']}/{source['repo']}")
     print("="*60)
 
-
 if __name__ == "__main__":
     main()